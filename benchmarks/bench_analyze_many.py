@@ -0,0 +1,73 @@
+"""
+Batch complexity scoring: analyze_many vs. the per-task loop.
+
+Runs two workloads: every ticket distinct (a backlog import) and tickets
+drawn from a handful of templates (re-fired alerts). analyze_many only
+saves work on the second, where repeated tickets are scored once.
+
+Usage:
+    python benchmarks/bench_analyze_many.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+from haci.orchestrator import HACIOrchestrator
+from haci.types import Task
+
+TITLES = [
+    "Password reset request",
+    "API returning 502 errors with database timeouts",
+    "Production database issue",
+    "Security vulnerability in auth endpoint",
+    "Slow SQL query causing high CPU on server",
+    "Kubernetes pods crash looping after deploy",
+    "Disk usage alert on db-{n}",
+    "Customer cannot export report #{n}",
+]
+
+
+def make_tasks(n: int, distinct: bool) -> list[Task]:
+    rng = random.Random(42)
+    return [
+        Task(
+            id=str(i),
+            type="import",
+            title=rng.choice(TITLES).format(n=rng.randrange(500))
+            + (f" (ticket {i})" if distinct else ""),
+            description=rng.choice(["", "Logs show errors since the last deploy"]),
+            priority=rng.choice(["low", "medium", "high", "critical"]),
+        )
+        for i in range(n)
+    ]
+
+
+async def per_task(orchestrator: HACIOrchestrator, tasks: list[Task]) -> None:
+    for task in tasks:
+        await orchestrator._analyze_complexity(task)
+
+
+def main() -> None:
+    orchestrator = HACIOrchestrator()
+    for label, distinct in [("distinct", True), ("repeated", False)]:
+        tasks = make_tasks(20_000, distinct)
+        
+        start = time.perf_counter()
+        asyncio.run(per_task(orchestrator, tasks))
+        loop_s = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        orchestrator.analyze_many(tasks)
+        batch_s = time.perf_counter() - start
+        
+        print(
+            f"20,000 {label:<8} tasks: per-task loop {loop_s:6.2f}s  "
+            f"analyze_many {batch_s:6.2f}s  ({loop_s / batch_s:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Filtered listing over a large pending-approval queue.
+
+Compares indexed ApprovalQueue selection against a linear scan of every
+pending approval, which is what listing by task or agent used to require.
+
+Usage:
+    python benchmarks/bench_approval_queue.py [PENDING]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from haci.approvals import ApprovalFilter, ApprovalQueue
+from haci.types import AgentType, HumanApprovalRequest
+
+RISKS = ["low", "medium", "high", "critical"]
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    pending = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tasks = pending // 5
+    now = datetime(2025, 1, 1)
+    agents = list(AgentType)
+    queue = ApprovalQueue()
+    requests = []
+    for i in range(pending):
+        request = HumanApprovalRequest(
+            id=f"approval-{i}",
+            task_id=f"task-{random.randrange(tasks)}",
+            action_description="Restart service",
+            risk_assessment=random.choice(RISKS),
+            confidence=75.0,
+            agents_recommending=[random.choice(agents)],
+            expires_at=now + timedelta(seconds=random.randrange(3600)),
+        )
+        requests.append(request)
+    
+    start = time.perf_counter()
+    for request in requests:
+        queue.add(request)
+    add_us = (time.perf_counter() - start) / pending * 1e6
+    
+    by_task = ApprovalFilter(task_ids={"task-7"})
+    narrow = ApprovalFilter.parse("agent=security_analyst risk=critical expires<2025-01-01T00:05")
+    
+    print(f"pending: {pending:,}  (add: {add_us:.2f} us/approval)")
+    for name, approval_filter, calls in (("task", by_task, 2000), ("agent+risk+expiry", narrow, 200)):
+        indexed = per_call_us(lambda: queue.select(approval_filter), calls)
+        scan = per_call_us(
+            lambda: [r.id for r in requests if approval_filter.matches(r)], 5
+        )
+        print(f"{name:<18} indexed {indexed:10.1f} us   scan {scan:10.1f} us")
+    page = per_call_us(lambda: queue.page(ApprovalFilter.parse("risk=high"), limit=50), 20)
+    print(f"first page of risk=high (~{pending // 4:,} matches): {page:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Per-task audit log query latency at 1M+ entries.
+
+Compares the indexed AuditStore against a linear scan over a plain list,
+which is how Harness.get_audit_log used to work.
+
+Usage:
+    python benchmarks/bench_audit_log.py [ENTRIES]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from haci.audit import AuditStore
+
+EVENTS = ["context_created", "action_gated", "action_executed", "context_cleaned_up"]
+ENTRIES_PER_TASK = 6
+
+
+def per_query_us(fn, task_ids: list[str]) -> float:
+    start = time.perf_counter()
+    for task_id in task_ids:
+        fn(task_id)
+    return (time.perf_counter() - start) / len(task_ids) * 1e6
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_200_000
+    tasks = total // ENTRIES_PER_TASK
+    
+    store = AuditStore(capacity=total)
+    flat: list[dict] = []
+    for i in range(total):
+        entry = {
+            "event": EVENTS[i % len(EVENTS)],
+            "timestamp": "2025-01-01T00:00:00",
+            "task_id": f"task-{random.randrange(tasks)}",
+        }
+        store.append(entry)
+        flat.append(entry)
+    
+    sample = [f"task-{random.randrange(tasks)}" for _ in range(200)]
+    indexed = per_query_us(lambda t: store.query(task_id=t), sample)
+    scan = per_query_us(
+        lambda t: [e for e in flat if e.get("task_id") == t], sample[:20]
+    )
+    by_event = per_query_us(lambda _: store.query(event="action_gated"), sample[:5])
+    
+    print(f"entries: {total:,}  tasks: {tasks:,}")
+    print(f"indexed per-task query: {indexed:12.1f} us")
+    print(f"linear scan per task:   {scan:12.1f} us")
+    print(f"indexed event query:    {by_event:12.1f} us (~{total // len(EVENTS):,} hits)")
+
+
+if __name__ == "__main__":
+    main()
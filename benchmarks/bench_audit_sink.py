@@ -0,0 +1,68 @@
+"""
+gate_action latency with inline logging vs. the batched segment sink.
+
+Usage:
+    python benchmarks/bench_audit_sink.py [ACTIONS] > /dev/null
+Results are printed to stderr.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+
+from haci.harness import Harness, HarnessAction, HarnessConfig
+from haci.types import AgentType, ExecutionMode
+
+
+async def gate_latencies(harness: Harness, n: int) -> list[float]:
+    context = harness.create_context("bench", ExecutionMode.SINGLE_AGENT)
+    action = HarnessAction(
+        agent_type=AgentType.LOG_ANALYST,
+        action_type="query_logs",
+        description="Search error logs",
+        confidence=97.0,
+    )
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await harness.gate_action(context, action)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<28} p50={q[49]:7.1f}us  p99={q[98]:7.1f}us",
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    limits = {
+        "max_tool_calls_per_task": n + 1,
+        "max_actions_per_minute": 0,
+        "max_global_actions_per_minute": 0,
+    }
+    inline = Harness(config=HarnessConfig(**limits))
+    report("inline structlog", asyncio.run(gate_latencies(inline, n)))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        batched = Harness(
+            config=HarnessConfig(
+                **limits,
+                audit_segment_dir=tmp,
+                audit_fsync_mode="batch",
+            )
+        )
+        report("batched sink (fsync/batch)", asyncio.run(gate_latencies(batched, n)))
+        batched.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Cold-start import cost of the haci CLI, with a regression budget.
+
+Runs ``python -X importtime`` in fresh interpreters for trivial commands and
+sums the cumulative import time of ``haci.cli``. Also checks that the
+commands do not load the modules that only task-running commands need. The
+median over several runs is compared against ``BUDGET_MS``. The script exits
+non-zero when a command is over budget or loads a heavy module, so it can
+gate CI.
+
+Usage:
+    python benchmarks/bench_cli_import.py [RUNS]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Cumulative import time of haci.cli for informational commands
+BUDGET_MS = 150.0
+
+# Must not be imported by the commands below
+HEAVY_MODULES = (
+    "pydantic",
+    "pydantic_settings",
+    "yaml",
+    "structlog",
+    "haci.config",
+    "haci.orchestrator",
+)
+
+COMMANDS = [
+    ["--version"],
+    ["--help"],
+    ["mode", "info", "single_agent"],
+]
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(args: list[str]) -> tuple[float, set[str]]:
+    """Return (haci.cli cumulative import ms, heavy modules loaded) for one run."""
+    code = (
+        "import sys\n"
+        "from haci.cli import main\n"
+        f"sys.argv = ['haci', *{args!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONSAFEPATH": "1"},
+    )
+    cli_us = 0
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        if name == "haci.cli":
+            cli_us = int(match.group(2))
+        if name in HEAVY_MODULES:
+            loaded.add(name)
+    return cli_us / 1000, loaded
+
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    failed = False
+    print(f"budget: {BUDGET_MS:.0f} ms  runs: {runs}")
+    for args in COMMANDS:
+        samples = []
+        heavy: set[str] = set()
+        for _ in range(runs):
+            ms, loaded = measure(args)
+            samples.append(ms)
+            heavy |= loaded
+        median = statistics.median(samples)
+        ok = median <= BUDGET_MS and not heavy
+        failed |= not ok
+        label = "haci " + " ".join(args)
+        print(f"{label:<28} median {median:7.1f} ms  min {min(samples):7.1f} ms  "
+              f"{'ok' if ok else 'OVER BUDGET'}")
+        if heavy:
+            print(f"    loaded heavy modules: {', '.join(sorted(heavy))}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Hedged execution for borderline tickets vs. always swarming or escalating.
+
+Agents answer after heavy-tailed (log-normal) delays, and 75% of answers
+are confident. The same borderline tickets run three ways:
+- micro-swarm: what a complexity score of 4 gets without hedging;
+- escalate: a single agent, then a micro-swarm if its answer is not
+  confident;
+- hedged: ``HACIOrchestrator._execute_hedged`` with the given delay.
+It reports p50/p95 latency, mean cost and how often the swarm ran.
+
+Usage:
+    python benchmarks/bench_hedged.py [TASKS] [HEDGE_DELAY_SECONDS]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+
+import structlog
+
+from haci.agents import AgentBackend
+from haci.batch import percentile
+from haci.config import HACIConfig, HedgeConfig
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+from haci.orchestrator import HACIOrchestrator, TaskState
+from haci.types import AgentType, ExecutionMode, Task
+
+AGENTS = [AgentType.LOG_ANALYST, AgentType.API_SPECIALIST, AgentType.SWARM_COORDINATOR]
+
+
+class HeavyTailBackend(AgentBackend):
+    """Log-normal latency (median 80 ms); 75% of answers are confident."""
+    
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+    
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        await asyncio.sleep(0.08 * self.rng.lognormvariate(0, 0.9))
+        confident = self.rng.random() < 0.75
+        text = json.dumps({
+            "root_cause": "Connection pool exhausted" if confident else "Unclear",
+            "confidence": 92 if confident else 65,
+        })
+        return LLMResponse(provider="bench", model=request.model, text=text)
+
+
+async def run(tasks: int, delay: float) -> None:
+    config = HACIConfig()
+    config.response_cache.enabled = False
+    config.execution.hedge = HedgeConfig(enabled=True, delay_seconds=delay)
+    orchestrator = HACIOrchestrator(config)
+    min_confidence = config.execution.hedge.min_confidence
+    
+    async def micro_swarm(state: TaskState) -> dict:
+        return await orchestrator._execute_micro_swarm(state, None)
+    
+    async def escalate(state: TaskState) -> dict:
+        result = await orchestrator._execute_single_agent(state, None, AGENTS[:1])
+        if result["confidence"] >= min_confidence:
+            return result
+        swarm = await orchestrator._execute_micro_swarm(state, None)
+        return {**swarm, "cost": result["cost"] + swarm["cost"]}
+    
+    async def hedged(state: TaskState) -> dict:
+        return await orchestrator._execute_hedged(state, None)
+    
+    print(f"tasks: {tasks}  hedge delay: {delay * 1000:.0f} ms", file=sys.stderr)
+    for label, path in [("micro-swarm", micro_swarm), ("escalate", escalate), ("hedged", hedged)]:
+        orchestrator.agent_backend = HeavyTailBackend(seed=7)
+        samples: list[float] = []
+        cost = 0.0
+        swarms = 0
+        for i in range(tasks):
+            state = TaskState(task=Task(id=f"t-{i}", type="general", title=f"Outage {i}"))
+            state.assigned_agents = list(AGENTS)
+            start = time.perf_counter()
+            result = await path(state)
+            samples.append((time.perf_counter() - start) * 1000)
+            cost += result["cost"]
+            swarms += result["metadata"]["mode"] == ExecutionMode.MICRO_SWARM.value
+        samples.sort()
+        print(f"{label:<12} p50 {percentile(samples, 50):6.1f} ms  "
+              f"p95 {percentile(samples, 95):6.1f} ms  "
+              f"mean cost ${cost / tasks:.4f}  swarm answered {swarms}/{tasks}", file=sys.stderr)
+    await orchestrator.close()
+
+
+def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.15
+    asyncio.run(run(tasks, delay))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Pooled provider client vs. one HTTP client per call.
+
+Runs a stub Anthropic Messages endpoint in-process (uvicorn) and sends the
+same requests two ways:
+- through ``ProviderClient``, which reuses keep-alive connections;
+- through a fresh ``httpx.AsyncClient`` per call, i.e. a new TCP connection
+  for every agent call.
+
+It reports calls/sec and the client's latency percentiles.
+
+Usage:
+    python benchmarks/bench_llm_client.py [CALLS] [CONCURRENCY]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import sys
+import time
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from haci.integrations.api.llm import AnthropicAdapter, LLMRequest, ProviderClient
+
+
+async def messages(request: Request) -> JSONResponse:
+    await request.body()
+    return JSONResponse({
+        "content": [{"type": "text", "text": "Check the logs."}],
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": 12, "output_tokens": 3},
+    })
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run(calls: int, concurrency: int) -> None:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        Starlette(routes=[Route("/v1/messages", messages, methods=["POST"])]),
+        host="127.0.0.1", port=port, log_level="warning", access_log=False,
+    ))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    base_url = f"http://127.0.0.1:{port}"
+    request = LLMRequest(model="claude-sonnet-4-20250514", messages=[{"role": "user", "content": "Why?"}])
+    adapter = AnthropicAdapter()
+    
+    pooled = ProviderClient(
+        "anthropic", adapter, base_url, api_key="k",
+        max_concurrency=concurrency, max_connections=concurrency,
+    )
+    start = time.perf_counter()
+    await asyncio.gather(*(pooled.complete(request) for _ in range(calls)))
+    pooled_rate = calls / (time.perf_counter() - start)
+    latency = pooled.stats.latency
+    await pooled.close()
+    
+    slots = asyncio.Semaphore(concurrency)
+    
+    async def unpooled() -> None:
+        async with slots:
+            async with httpx.AsyncClient(base_url=base_url, headers=adapter.headers("k")) as client:
+                response = await client.post(adapter.path, json=adapter.payload(request, stream=False))
+                adapter.parse(response.json())
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(unpooled() for _ in range(calls)))
+    unpooled_rate = calls / (time.perf_counter() - start)
+    
+    server.should_exit = True
+    await serving
+    print(f"calls: {calls:,}  concurrency: {concurrency}", file=sys.stderr)
+    print(f"pooled ProviderClient   {pooled_rate:8,.0f} calls/s  "
+          f"p50 {latency.percentile(50):.1f} ms  p99 {latency.percentile(99):.1f} ms", file=sys.stderr)
+    print(f"client per call         {unpooled_rate:8,.0f} calls/s", file=sys.stderr)
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    asyncio.run(run(calls, concurrency))
+
+
+if __name__ == "__main__":
+    main()
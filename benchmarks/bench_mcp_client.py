@@ -0,0 +1,84 @@
+"""
+Pooled MCP sessions vs. a new session per tool call.
+
+Runs ``StubMCPServer`` in-process (uvicorn) and makes the same tool calls
+two ways:
+- through ``MCPServerPool``, which keeps warm sessions and multiplexes
+  concurrent calls over them;
+- with a fresh client and session per call (initialize, initialized,
+  tools/call, session delete), which is what an unpooled caller pays.
+
+It reports calls/sec and the pool's latency percentiles.
+
+Usage:
+    python benchmarks/bench_mcp_client.py [CALLS] [CONCURRENCY]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+
+import structlog
+
+from haci.config import MCPServerConfig
+from haci.integrations.mcp import MCPServerPool
+from haci.integrations.mcp.stub import StubMCPServer
+
+
+async def drive(calls: int, concurrency: int, call) -> float:
+    counter = iter(range(calls))
+    
+    async def worker() -> None:
+        for i in counter:
+            await call(i)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return calls / (time.perf_counter() - start)
+
+
+async def run(calls: int, concurrency: int) -> None:
+    stub = StubMCPServer()
+    async with stub.running() as url:
+        config = MCPServerConfig(name="stub", url=url, health_check_seconds=0)
+        
+        pool = MCPServerPool(config)
+        await pool.start()
+        
+        async def pooled(i: int) -> None:
+            await pool.call_tool("echo", {"text": f"PROJ-{i}"})
+        
+        pooled_rate = await drive(calls, concurrency, pooled)
+        stats = pool.stats.latency.snapshot()
+        await pool.close()
+        
+        async def fresh(i: int) -> None:
+            single = MCPServerPool(config.model_copy(update={"sessions": 1}))
+            try:
+                await single.call_tool("echo", {"text": f"PROJ-{i}"})
+            finally:
+                await single.close()
+        
+        fresh_rate = await drive(calls // 4, concurrency, fresh)
+    
+    print(f"calls: {calls:,}  concurrency: {concurrency}", file=sys.stderr)
+    print(f"pooled sessions:  {pooled_rate:8,.0f} calls/s  "
+          f"p50 {stats['p50_ms']:.1f} ms  p99 {stats['p99_ms']:.1f} ms", file=sys.stderr)
+    print(f"session per call: {fresh_rate:8,.0f} calls/s  "
+          f"(pooled {pooled_rate / fresh_rate:.1f}x faster)", file=sys.stderr)
+
+
+def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    asyncio.run(run(calls, concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark of the LLM response cache.
+
+Replays a stream of agent calls in which tickets repeat (re-fired alerts
+follow a skewed distribution) against a simulated provider with a fixed
+latency, with and without ``ResponseCache``. It reports provider calls,
+hit rate and wall time, then the per-lookup cost of memory and disk hits.
+
+Usage:
+    python benchmarks/bench_response_cache.py [CALLS] [DISTINCT_PROMPTS]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from haci.integrations.api.cache import ResponseCache
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+
+PROVIDER_LATENCY_SECONDS = 0.02
+CONCURRENCY = 32
+
+
+def workload(calls: int, distinct: int) -> list[LLMRequest]:
+    rng = random.Random(7)
+    prompts = [
+        f"Alert {i}: p99 latency above SLO on service-{i % 17}\n\nPriority: high"
+        for i in range(distinct)
+    ]
+    weights = [1 / (rank + 1) for rank in range(distinct)]  # Zipf-like repeats
+    return [
+        LLMRequest(
+            model="claude-sonnet-4-20250514",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=8000,
+        )
+        for prompt in rng.choices(prompts, weights=weights, k=calls)
+    ]
+
+
+async def replay(requests: list[LLMRequest], cache: ResponseCache | None) -> tuple[int, float]:
+    calls = 0
+    
+    async def provider() -> LLMResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(PROVIDER_LATENCY_SECONDS)
+        return LLMResponse(provider="stub", model="m", text="finding " * 200)
+    
+    queue = iter(requests)
+    
+    async def worker() -> None:
+        for request in queue:
+            if cache is None:
+                await provider()
+            else:
+                await cache.get_or_call(request, provider, label="log_analyst")
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return calls, time.perf_counter() - start
+
+
+async def lookup_cost(tmp: Path, iterations: int = 5_000) -> None:
+    request = workload(1, 1)[0]
+    response = LLMResponse(provider="stub", model="m", text="finding " * 200)
+    
+    memory = ResponseCache()
+    await memory.put(request, response)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await memory.get(request)
+    memory_us = (time.perf_counter() - start) / iterations * 1e6
+    
+    disk = ResponseCache(memory_max_bytes=0, disk_path=str(tmp / "lookup.db"))
+    await disk.put(request, response)
+    start = time.perf_counter()
+    for _ in range(iterations // 10):
+        await disk.get(request)
+    disk_us = (time.perf_counter() - start) / (iterations // 10) * 1e6
+    disk.close()
+    print(f"hit cost: memory {memory_us:.1f} us, disk {disk_us:.1f} us "
+          f"(provider call {PROVIDER_LATENCY_SECONDS * 1e3:.0f} ms)", file=sys.stderr)
+
+
+async def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    requests = workload(calls, distinct)
+    
+    uncached_calls, uncached_s = await replay(requests, None)
+    cache = ResponseCache()
+    cached_calls, cached_s = await replay(requests, cache)
+    hit_rate = cache.stats()["log_analyst"]["hit_rate"]
+    
+    print(f"agent calls: {calls:,}  distinct prompts: {distinct}  "
+          f"concurrency: {CONCURRENCY}", file=sys.stderr)
+    print(f"uncached: {uncached_calls:5,} provider calls  {uncached_s:6.2f} s", file=sys.stderr)
+    print(f"cached:   {cached_calls:5,} provider calls  {cached_s:6.2f} s  "
+          f"hit rate {hit_rate:.1%}", file=sys.stderr)
+    with tempfile.TemporaryDirectory() as tmp:
+        await lookup_cost(Path(tmp))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
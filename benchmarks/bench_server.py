@@ -0,0 +1,191 @@
+"""
+In-process load test of the HACI HTTP server.
+
+Starts uvicorn with ``haci.server.create_app`` on a local port inside this
+process, on the same event loop as the client. It then drives the server
+over real keep-alive HTTP connections and reports requests/sec
+for each endpoint. It also compares encoding a ``TaskResult`` with FastAPI's
+generic ``jsonable_encoder`` + ``json.dumps`` path against the direct
+pydantic-core serialization the server uses.
+
+Usage:
+    python benchmarks/bench_server.py [REQUESTS] [CONCURRENCY]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import socket
+import sys
+import time
+from typing import Awaitable, Callable
+
+import orjson
+import structlog
+import uvicorn
+from fastapi.encoders import jsonable_encoder
+
+from haci.config import HACIConfig
+from haci.server import create_app, event_loop_setting
+from haci.types import AgentType, ExecutionMode, TaskResult, TaskStatus
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Connection:
+    """
+    Minimal keep-alive HTTP/1.1 client connection.
+    
+    httpx's connection pool costs more CPU per request than the server under
+    test, so the load generator speaks HTTP over raw asyncio streams.
+    """
+    
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+    
+    @classmethod
+    async def open(cls, port: int) -> Connection:
+        return cls(*await asyncio.open_connection("127.0.0.1", port))
+    
+    async def request(self, method: str, path: str, body: object = None) -> tuple[int, bytes]:
+        payload = b"" if body is None else orjson.dumps(body)
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n"
+        )
+        self.writer.write(head.encode() + payload)
+        response_head = await self.reader.readuntil(b"\r\n\r\n")
+        status = int(response_head[9:12])
+        length = 0
+        for line in response_head.split(b"\r\n"):
+            if line[:15].lower() == b"content-length:":
+                length = int(line[15:])
+        data = await self.reader.readexactly(length)
+        if status >= 400:
+            raise RuntimeError(f"{method} {path}: HTTP {status} {data[:200]!r}")
+        return status, data
+    
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def drive(
+    connections: list[Connection],
+    n: int,
+    make_request: Callable[[Connection, int], Awaitable[object]],
+) -> float:
+    """Issue n requests, one in flight per connection; return requests/sec."""
+    counter = iter(range(n))
+    
+    async def worker(conn: Connection) -> None:
+        for i in counter:
+            await make_request(conn, i)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(conn) for conn in connections))
+    return n / (time.perf_counter() - start)
+
+
+async def load_test(n: int, concurrency: int) -> None:
+    config = HACIConfig()
+    config.execution.max_concurrent_tasks = 2_000
+    config.complexity_cache.enabled = False
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(config),
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        access_log=False,
+        timeout_keep_alive=config.server.keep_alive_seconds,
+    ))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    
+    connections = [await Connection.open(port) for _ in range(concurrency)]
+    task_ids: list[str] = []
+    
+    async def submit(conn: Connection, i: int) -> None:
+        _, body = await conn.request("POST", "/tasks", {
+            "title": f"Ticket {i}",
+            "description": "API latency spike",
+            "metadata": {"mode": "single_agent"},
+        })
+        task_ids.append(orjson.loads(body)["id"])
+    
+    async def status(conn: Connection, i: int) -> None:
+        await conn.request("GET", f"/tasks/{task_ids[i % len(task_ids)]}/status")
+    
+    async def result(conn: Connection, i: int) -> None:
+        await conn.request("GET", f"/tasks/{task_ids[i % len(task_ids)]}/result?wait=30")
+    
+    async def bulk(conn: Connection, i: int) -> None:
+        await conn.request("POST", "/tasks/batch", [
+            {"title": f"Bulk {i}-{j}", "metadata": {"mode": "single_agent"}}
+            for j in range(100)
+        ])
+    
+    rows = [
+        ("POST /tasks", await drive(connections, n, submit), 1),
+        ("GET /tasks/{id}/status", await drive(connections, n, status), 1),
+        ("GET /tasks/{id}/result", await drive(connections, n, result), 1),
+        ("POST /tasks/batch (100)", await drive(connections, n // 50, bulk), 100),
+    ]
+    
+    for conn in connections:
+        conn.close()
+    server.should_exit = True
+    await serving
+    
+    print(f"requests: {n:,}  connections: {concurrency}  "
+          f"loop: {event_loop_setting('auto')}", file=sys.stderr)
+    for label, rate, per_request in rows:
+        extra = f"  ({rate * per_request:,.0f} tasks/s)" if per_request > 1 else ""
+        print(f"{label:<26} {rate:9,.0f} req/s{extra}", file=sys.stderr)
+
+
+def encode_comparison(iterations: int = 20_000) -> None:
+    result = TaskResult(
+        task_id="3f0c8f9e-6a53-4a43-9d1f-0f7d8d6b2f11",
+        status=TaskStatus.COMPLETED,
+        mode=ExecutionMode.MICRO_SWARM,
+        summary="Connection pool exhausted; raised pool size and restarted workers",
+        confidence=91.5,
+        agents_used=[AgentType.LOG_ANALYST, AgentType.DATABASE_EXPERT],
+        resolution_steps=[f"step {i}" for i in range(8)],
+        execution_time_ms=412,
+        metadata={"agents": {"log_analyst": {"ms": 120}, "database_expert": {"ms": 290}}},
+    )
+    start = time.perf_counter()
+    for _ in range(iterations):
+        json.dumps(jsonable_encoder(result)).encode()
+    generic = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result.model_dump_json()
+    direct = (time.perf_counter() - start) / iterations * 1e6
+    print(f"TaskResult encode: jsonable_encoder+json {generic:.1f} us, "
+          f"model_dump_json {direct:.1f} us ({generic / direct:.1f}x)", file=sys.stderr)
+
+
+def main() -> None:
+    # As under `haci server`: per-task info logs are filtered out
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    asyncio.run(load_test(n, concurrency))
+    encode_comparison()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Per-task intake cost: submit() in a loop vs. one submit_many() call.
+
+Measures intake only; no event loop runs, so nothing is dispatched.
+
+Usage:
+    python benchmarks/bench_submit_many.py [N] > /dev/null
+Results are printed to stderr.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from haci.orchestrator import HACIOrchestrator
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    batch = [
+        {
+            "type": "support_ticket",
+            "title": f"Imported ticket {i}",
+            "description": "Customer reports intermittent 502 errors",
+            "priority": ("low", "medium", "high", "critical")[i % 4],
+            "metadata": {"source": "importer", "row": i},
+        }
+        for i in range(n)
+    ]
+    
+    orchestrator = HACIOrchestrator()
+    start = time.perf_counter()
+    for data in batch:
+        orchestrator.submit(data)
+    single = (time.perf_counter() - start) / n * 1e6
+    
+    orchestrator = HACIOrchestrator()
+    start = time.perf_counter()
+    orchestrator.submit_many(batch)
+    bulk = (time.perf_counter() - start) / n * 1e6
+    
+    print(f"{n:,} tasks", file=sys.stderr)
+    print(f"submit() loop:  {single:6.1f} us/task", file=sys.stderr)
+    print(f"submit_many():  {bulk:6.1f} us/task", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Swarm agent fan-out: concurrent vs. one agent after another.
+
+Runs full-swarm tasks whose agents answer through ``SimulatedBackend``
+with a fixed per-call latency, and reports the median time for the agent
+phase when agents are awaited in sequence and when they are fanned out
+with ``HACIOrchestrator._run_agents``.
+
+Usage:
+    python benchmarks/bench_swarm_fanout.py [TASKS] [AGENT_LATENCY_SECONDS]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import sys
+import time
+
+import structlog
+
+from haci.agents import SimulatedBackend
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator, TaskState
+from haci.types import AgentType, Task
+
+AGENTS = [
+    AgentType.LOG_ANALYST,
+    AgentType.API_SPECIALIST,
+    AgentType.INFRASTRUCTURE_OPS,
+    AgentType.CODE_SPECIALIST,
+    AgentType.DATABASE_EXPERT,
+    AgentType.SWARM_COORDINATOR,
+]
+
+
+async def run(tasks: int, latency: float) -> None:
+    config = HACIConfig()
+    config.response_cache.enabled = False
+    orchestrator = HACIOrchestrator(config)
+    orchestrator.agent_backend = SimulatedBackend(latency_seconds=latency)
+    
+    async def sequential(state: TaskState) -> None:
+        for agent in AGENTS:
+            await orchestrator._ask_agent(state, agent)
+    
+    async def fanned_out(state: TaskState) -> None:
+        await orchestrator._run_agents(state, AGENTS)
+    
+    for label, phase in [("sequential", sequential), ("fan-out", fanned_out)]:
+        samples = []
+        for i in range(tasks):
+            state = TaskState(task=Task(id=f"t-{i}", type="general", title=f"Outage {i}"))
+            start = time.perf_counter()
+            await phase(state)
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{label:<10} {len(AGENTS)} agents: median {statistics.median(samples):7.1f} ms",
+              file=sys.stderr)
+    await orchestrator.close()
+
+
+def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    asyncio.run(run(tasks, latency))
+
+
+if __name__ == "__main__":
+    main()
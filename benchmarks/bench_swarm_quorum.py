@@ -0,0 +1,90 @@
+"""
+Swarm latency with and without quorum early termination.
+
+Five full-swarm agents answer after heavy-tailed (log-normal) delays; four
+of them usually name the same root cause with high confidence. The agent
+phase runs through ``HACIOrchestrator._run_agents`` once waiting for every
+agent and once with the default full-swarm quorum policy (3 agents at 85%
+confidence or above). It reports p50/p95 latency and how many agent calls
+were cancelled.
+
+Usage:
+    python benchmarks/bench_swarm_quorum.py [TASKS]
+Run from outside the repository root (the top-level types.py would shadow
+the stdlib).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+
+import structlog
+
+from haci.agents import AgentBackend
+from haci.batch import percentile
+from haci.config import HACIConfig
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+from haci.orchestrator import HACIOrchestrator, TaskState
+from haci.types import AgentType, ExecutionMode, Task
+
+AGENTS = [
+    AgentType.LOG_ANALYST,
+    AgentType.API_SPECIALIST,
+    AgentType.INFRASTRUCTURE_OPS,
+    AgentType.CODE_SPECIALIST,
+    AgentType.SWARM_COORDINATOR,
+]
+
+
+class HeavyTailBackend(AgentBackend):
+    """Log-normal latency (median 50 ms); 80% of answers agree at 90%."""
+    
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+    
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        await asyncio.sleep(0.05 * self.rng.lognormvariate(0, 0.8))
+        agrees = self.rng.random() < 0.8
+        text = json.dumps({
+            "root_cause": "Connection pool exhausted" if agrees else f"{agent_type.value} anomaly",
+            "confidence": 90 if agrees else 70,
+        })
+        return LLMResponse(provider="bench", model=request.model, text=text)
+
+
+async def run(tasks: int) -> None:
+    config = HACIConfig()
+    config.response_cache.enabled = False
+    orchestrator = HACIOrchestrator(config)
+    policy = config.execution.quorum[ExecutionMode.FULL_SWARM.value]
+    
+    for label, quorum in [("all agents", None), ("quorum 3@85", policy)]:
+        orchestrator.agent_backend = HeavyTailBackend(seed=11)
+        samples: list[float] = []
+        cancelled = 0
+        for i in range(tasks):
+            state = TaskState(task=Task(id=f"t-{i}", type="general", title=f"Outage {i}"))
+            start = time.perf_counter()
+            fan_out = await orchestrator._run_agents(state, AGENTS, quorum)
+            samples.append((time.perf_counter() - start) * 1000)
+            cancelled += len(fan_out.cancelled)
+        samples.sort()
+        print(f"{label:<12} p50 {percentile(samples, 50):6.1f} ms  "
+              f"p95 {percentile(samples, 95):6.1f} ms  "
+              f"agent calls cancelled {cancelled}/{tasks * len(AGENTS)}", file=sys.stderr)
+    await orchestrator.close()
+
+
+def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    asyncio.run(run(tasks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Memory-per-task benchmark for finished-task retention.
+
+Runs N tasks to completion and reports the Python heap still held per task,
+first with everything retained in memory and then with a small in-memory
+window that spills results to a SQLite file.
+
+Usage:
+    python benchmarks/bench_task_retention.py [N]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+
+
+async def run(n: int, max_completed: int, spill_path: str) -> float:
+    config = HACIConfig(anthropic_api_key="bench")
+    config.execution.max_concurrent_tasks = n
+    config.retention.ttl_seconds = 0
+    config.retention.max_completed_tasks = max_completed
+    config.retention.spill_path = spill_path
+    orchestrator = HACIOrchestrator(config)
+    
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    
+    tasks = [
+        orchestrator.submit(
+            {"title": f"Password reset {i}", "description": "User locked out"}
+        )
+        for i in range(n)
+    ]
+    for task in tasks:
+        await orchestrator.await_result(task.id)
+    del tasks
+    
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - baseline) / n
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        spill = str(Path(tmp) / "results.db")
+        retained = asyncio.run(run(n, max_completed=n, spill_path=spill))
+        bounded = asyncio.run(run(n, max_completed=100, spill_path=spill))
+    
+    print(f"tasks: {n}")
+    print(f"all retained in memory:     {retained:8.0f} bytes/task")
+    print(f"100 in memory, rest on disk: {bounded:8.0f} bytes/task")
+
+
+if __name__ == "__main__":
+    main()
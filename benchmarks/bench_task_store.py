@@ -0,0 +1,92 @@
+"""
+Task-state persistence cost with the SQLAlchemy store on SQLite.
+
+Compares writing every state transition in its own transaction against the
+store's coalesced, batched upserts, then measures end-to-end orchestrator
+throughput with the in-memory and SQLite backends.
+
+Usage:
+    python benchmarks/bench_task_store.py [TASKS]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+from haci.task_store import SQLAlchemyTaskStore, TaskRecord
+from haci.types import Task, TaskStatus
+
+TRANSITIONS = [TaskStatus.PENDING, TaskStatus.ANALYZING, TaskStatus.EXECUTING, TaskStatus.COMPLETED]
+
+
+async def per_transition(url: str, tasks: list[Task]) -> float:
+    store = SQLAlchemyTaskStore(url, flush_interval_seconds=3600)
+    start = time.perf_counter()
+    for task in tasks:
+        for status in TRANSITIONS:
+            store.record(TaskRecord(task=task, status=status))
+            await store.flush()
+    elapsed = time.perf_counter() - start
+    await store.close()
+    return elapsed
+
+
+async def batched(url: str, tasks: list[Task]) -> tuple[float, int]:
+    store = SQLAlchemyTaskStore(url, batch_size=500)
+    start = time.perf_counter()
+    for task in tasks:
+        for status in TRANSITIONS:
+            store.record(TaskRecord(task=task, status=status))
+        await asyncio.sleep(0)  # let the flusher run as it would between tasks
+    await store.flush()
+    elapsed = time.perf_counter() - start
+    batches = store.batches_written
+    await store.close()
+    return elapsed, batches
+
+
+async def orchestrator_throughput(config: HACIConfig, n: int) -> float:
+    orchestrator = HACIOrchestrator(config)
+    start = time.perf_counter()
+    tasks = orchestrator.submit_many(
+        {"title": f"Check logs {i}", "description": "error rate up"} for i in range(n)
+    )
+    await asyncio.gather(*(orchestrator.await_result(t.id) for t in tasks))
+    await orchestrator.close()
+    return n / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    tasks = [Task(id=f"task-{i}", type="incident", title="Slow API") for i in range(n)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        naive = await per_transition(f"sqlite:///{Path(tmp) / 'naive.db'}", tasks)
+        fast, batches = await batched(f"sqlite:///{Path(tmp) / 'batched.db'}", tasks)
+        print(f"tasks: {n:,}  transitions: {n * len(TRANSITIONS):,}")
+        print(f"one transaction per transition: {naive * 1e3:8.0f} ms")
+        print(f"coalesced batches ({batches:>4}):     {fast * 1e3:8.0f} ms")
+        
+        memory = HACIConfig()
+        memory.complexity_cache.enabled = False
+        sqlite = HACIConfig()
+        sqlite.complexity_cache.enabled = False
+        sqlite.task_store.backend = "sqlalchemy"
+        sqlite.task_store.url = f"sqlite:///{Path(tmp) / 'orchestrator.db'}"
+        print(f"orchestrator, memory store:  {await orchestrator_throughput(memory, n):8.0f} tasks/s")
+        print(f"orchestrator, sqlite store:  {await orchestrator_throughput(sqlite, n):8.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    # Per-task info events would dominate the end-to-end numbers
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""
+Orchestrator throughput in-process vs. with N worker processes.
+
+Per-task pipeline work (complexity analysis, result construction, pydantic
+validation, structlog formatting) is CPU-bound once concurrency is high
+enough that the simulated agent sleeps overlap, so throughput should scale
+with worker processes up to the number of cores.
+
+Usage:
+    python benchmarks/bench_worker_pool.py [TASKS] > /dev/null
+Results are printed to stderr. Run from outside the repository root (the
+top-level types.py would shadow the stdlib in spawned workers).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+
+
+async def throughput(n: int, processes: int) -> float:
+    config = HACIConfig()
+    config.execution.max_concurrent_tasks = 2_000
+    config.execution.worker_processes = processes
+    config.complexity_cache.enabled = False
+    orchestrator = HACIOrchestrator(config)
+    
+    if orchestrator.worker_pool is not None:
+        # Exclude process start-up from the measurement
+        await orchestrator.worker_pool.start()
+        warmup = orchestrator.submit({"title": "warm up", "description": "log error"})
+        await orchestrator.await_result(warmup.id)
+    
+    start = time.perf_counter()
+    tasks = orchestrator.submit_many(
+        {"title": f"Ticket {i}", "description": "API latency spike in production"}
+        for i in range(n)
+    )
+    await asyncio.gather(*(orchestrator.await_result(t.id) for t in tasks))
+    elapsed = time.perf_counter() - start
+    await orchestrator.close()
+    return n / elapsed
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    cores = os.cpu_count() or 1
+    counts = [0] + [p for p in (1, 2, 4, 8, 16) if p <= cores]
+    print(f"tasks: {n:,}  cores: {cores}", file=sys.stderr)
+    for processes in counts:
+        rate = asyncio.run(throughput(n, processes))
+        label = "in-process" if processes == 0 else f"{processes} worker(s)"
+        print(f"{label:<14} {rate:10.0f} tasks/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
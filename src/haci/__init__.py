@@ -4,10 +4,16 @@ HACI: Harness-Enhanced Agentic Collaborative Intelligence
 Enterprise-grade multi-agent AI orchestration with calibrated human oversight.
 """
 
-from haci.config import HACIConfig
-from haci.orchestrator import HACIOrchestrator
-from haci.harness import Harness, HarnessConfig
-from haci.types import ExecutionMode, TaskResult, TaskStatus
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from haci.config import HACIConfig
+    from haci.harness import Harness, HarnessConfig
+    from haci.orchestrator import HACIOrchestrator
+    from haci.types import ExecutionMode, TaskResult, TaskStatus
 
 __version__ = "0.1.0"
 __all__ = [
@@ -20,3 +26,28 @@ __all__ = [
     "TaskStatus",
     "__version__",
 ]
+
+# Public names are imported on first access so ``import haci`` (and the CLI)
+# does not pull in pydantic, structlog and the orchestrator up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    "HACIConfig": "haci.config",
+    "HACIOrchestrator": "haci.orchestrator",
+    "Harness": "haci.harness",
+    "HarnessConfig": "haci.harness",
+    "ExecutionMode": "haci.types",
+    "TaskResult": "haci.types",
+    "TaskStatus": "haci.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'haci' has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,17 @@
+"""Agent execution backends."""
+
+from haci.agents.backends import (
+    AgentBackend,
+    LLMBackend,
+    SimulatedBackend,
+    create_agent_backend,
+    parse_finding,
+)
+
+__all__ = [
+    "AgentBackend",
+    "LLMBackend",
+    "SimulatedBackend",
+    "create_agent_backend",
+    "parse_finding",
+]
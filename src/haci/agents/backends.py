@@ -0,0 +1,123 @@
+"""
+Backends that answer agent calls.
+
+The orchestrator builds one ``LLMRequest`` per agent call from the agent's
+``AgentConfig`` and hands it to an ``AgentBackend``. ``execution.agent_backend``
+selects the backend: ``simulated`` (the default) answers locally after a
+fixed delay, and ``llm`` sends the request through the pooled provider
+clients in ``haci.integrations.api``.
+
+Agents are asked to answer with a JSON object holding ``root_cause`` and
+``confidence`` (0-100); ``parse_finding`` extracts them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+from haci.types import AgentType
+
+if TYPE_CHECKING:
+    from haci.config import HACIConfig
+    from haci.integrations.api.llm import LLMClientPool
+
+
+def parse_finding(text: str) -> tuple[str | None, float | None]:
+    """
+    Extract ``(root_cause, confidence)`` from an agent's answer.
+    
+    Reads the outermost JSON object in the text, so prose or code fences
+    around it are tolerated. Confidence is clamped to 0-100. Answers
+    without a usable object give ``(None, None)``.
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        return None, None
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return None, None
+    if not isinstance(data, dict):
+        return None, None
+    root_cause = data.get("root_cause")
+    confidence = data.get("confidence")
+    if not isinstance(root_cause, str) or not root_cause.strip():
+        root_cause = None
+    if isinstance(confidence, (int, float)) and not isinstance(confidence, bool):
+        confidence = min(100.0, max(0.0, float(confidence)))
+    else:
+        confidence = None
+    return root_cause, confidence
+
+
+class AgentBackend(ABC):
+    """Answers one agent's request."""
+    
+    @abstractmethod
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        """Return the agent's response to the request."""
+    
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class SimulatedBackend(AgentBackend):
+    """
+    Stand-in for real agents: a canned finding after ``latency_seconds``.
+    
+    Every agent names the same root cause (derived from the ticket's first
+    line) with ``confidence``, so simulated swarms agree.
+    """
+    
+    def __init__(self, latency_seconds: float = 0.1, confidence: float = 90.0) -> None:
+        self.latency_seconds = latency_seconds
+        self.confidence = confidence
+        self.calls = 0
+    
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        start = time.perf_counter()
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        prompt = request.messages[-1]["content"]
+        title = prompt.split("\n", 1)[0]
+        text = json.dumps({
+            "root_cause": f"Fault behind: {title}",
+            "confidence": self.confidence,
+            "summary": f"{agent_type.value} investigated the reported symptoms",
+        })
+        return LLMResponse(
+            provider="simulated",
+            model=request.model,
+            text=text,
+            input_tokens=len(prompt) // 4,
+            output_tokens=len(text) // 4,
+            stop_reason="end_turn",
+            latency_ms=(time.perf_counter() - start) * 1000,
+        )
+
+
+class LLMBackend(AgentBackend):
+    """Sends agent requests to LLM providers through a shared client pool."""
+    
+    def __init__(self, pool: LLMClientPool) -> None:
+        self.pool = pool
+    
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        return await self.pool.complete(request)
+    
+    async def close(self) -> None:
+        await self.pool.close()
+
+
+def create_agent_backend(config: HACIConfig) -> AgentBackend:
+    """Build the backend selected by ``execution.agent_backend``."""
+    if config.execution.agent_backend == "llm":
+        from haci.integrations.api.llm import LLMClientPool
+        
+        return LLMBackend(LLMClientPool(config))
+    return SimulatedBackend()
@@ -0,0 +1,313 @@
+"""
+Pending human-approval queue for the HACI Harness.
+
+``ApprovalQueue`` keeps pending ``HumanApprovalRequest``s in creation order
+with secondary indexes by task, recommending agent, risk level and expiry,
+so reviewers can list and bulk-decide a slice of a large queue in time
+proportional to the slice rather than to the whole queue.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from typing import Callable, Iterable, Iterator
+
+from haci.types import AgentType, HumanApprovalRequest
+
+_FILTER_TERM = re.compile(r"(\w+)\s*(=|<|>)\s*(\S+)")
+
+
+@dataclass
+class ApprovalFilter:
+    """
+    Selection of pending approvals. Empty fields match everything.
+    
+    Multiple values within one field are alternatives; different fields must
+    all match.
+    """
+    
+    task_ids: set[str] = field(default_factory=set)
+    agent_types: set[AgentType] = field(default_factory=set)
+    risk_levels: set[str] = field(default_factory=set)
+    expires_before: datetime | None = None
+    expires_after: datetime | None = None
+    
+    @classmethod
+    def parse(cls, expression: str) -> ApprovalFilter:
+        """
+        Build a filter from a whitespace- or ``and``-separated expression.
+        
+        Supported terms are ``task=...``, ``agent=...``, ``risk=...`` (each
+        taking comma-separated alternatives) and ``expires<ISO-8601`` /
+        ``expires>ISO-8601``, e.g.
+        ``"agent=security_analyst risk=high,critical and expires<2025-01-01T12:00"``.
+        
+        Raises:
+            ValueError: If a term is malformed or names an unknown field.
+        """
+        result = cls()
+        remainder = expression
+        for match in _FILTER_TERM.finditer(expression):
+            name, op, value = match.groups()
+            remainder = remainder.replace(match.group(0), " ", 1)
+            values = {v for v in value.split(",") if v}
+            if name == "expires" and op in "<>":
+                when = datetime.fromisoformat(value)
+                if op == "<":
+                    result.expires_before = when
+                else:
+                    result.expires_after = when
+            elif op != "=":
+                raise ValueError(f"Operator {op!r} not supported for {name!r}")
+            elif name in ("task", "task_id"):
+                result.task_ids |= values
+            elif name in ("agent", "agent_type"):
+                result.agent_types |= {AgentType(v) for v in values}
+            elif name in ("risk", "risk_level"):
+                result.risk_levels |= {v.lower() for v in values}
+            else:
+                raise ValueError(f"Unknown approval filter field: {name!r}")
+        leftover = [w for w in remainder.split() if w.lower() != "and"]
+        if leftover:
+            raise ValueError(f"Could not parse approval filter near {leftover[0]!r}")
+        return result
+    
+    @property
+    def empty(self) -> bool:
+        """True if no field is set, so the filter matches every approval."""
+        return not (
+            self.task_ids
+            or self.agent_types
+            or self.risk_levels
+            or self.expires_before is not None
+            or self.expires_after is not None
+        )
+    
+    def matches(self, request: HumanApprovalRequest) -> bool:
+        """Return True if the request satisfies every set field."""
+        if self.task_ids and request.task_id not in self.task_ids:
+            return False
+        if self.agent_types and not self.agent_types.intersection(
+            request.agents_recommending
+        ):
+            return False
+        if self.risk_levels and request.risk_assessment.lower() not in self.risk_levels:
+            return False
+        if self.expires_before is not None and request.expires_at >= self.expires_before:
+            return False
+        if self.expires_after is not None and request.expires_at <= self.expires_after:
+            return False
+        return True
+
+
+@dataclass
+class ApprovalPage:
+    """One page of a pending-approval listing."""
+    
+    items: list[HumanApprovalRequest]
+    next_cursor: str | None
+    total: int
+
+
+class ApprovalQueue:
+    """
+    Pending approvals with secondary indexes.
+    
+    Each index maps a key to the approval IDs carrying it in creation order,
+    and expiry is kept in a sorted list, so a filtered listing starts from the
+    narrowest matching index instead of scanning every pending approval.
+    Listings are ordered by creation and paginated with an opaque cursor.
+    """
+    
+    def __init__(self) -> None:
+        self._requests: dict[str, HumanApprovalRequest] = {}
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+        self._by_task: dict[str, dict[str, None]] = {}
+        self._by_agent: dict[AgentType, dict[str, None]] = {}
+        self._by_risk: dict[str, dict[str, None]] = {}
+        self._by_expiry: list[tuple[datetime, int, str]] = []
+    
+    def __len__(self) -> int:
+        return len(self._requests)
+    
+    def __contains__(self, approval_id: object) -> bool:
+        return approval_id in self._requests
+    
+    def __iter__(self) -> Iterator[HumanApprovalRequest]:
+        return iter(list(self._requests.values()))
+    
+    def get(self, approval_id: str) -> HumanApprovalRequest | None:
+        """Return a pending approval, or None."""
+        return self._requests.get(approval_id)
+    
+    def add(self, request: HumanApprovalRequest) -> None:
+        """Add a pending approval to the queue and its indexes."""
+        if request.id in self._requests:
+            self.pop(request.id)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._requests[request.id] = request
+        self._seq[request.id] = seq
+        self._by_task.setdefault(request.task_id, {})[request.id] = None
+        for agent in request.agents_recommending:
+            self._by_agent.setdefault(agent, {})[request.id] = None
+        self._by_risk.setdefault(request.risk_assessment.lower(), {})[request.id] = None
+        bisect.insort(self._by_expiry, (request.expires_at, seq, request.id))
+    
+    def pop(self, approval_id: str) -> HumanApprovalRequest | None:
+        """Remove a pending approval and return it, or None if unknown."""
+        request = self._requests.pop(approval_id, None)
+        if request is None:
+            return None
+        seq = self._seq.pop(approval_id)
+        _discard(self._by_task, request.task_id, approval_id)
+        for agent in request.agents_recommending:
+            _discard(self._by_agent, agent, approval_id)
+        _discard(self._by_risk, request.risk_assessment.lower(), approval_id)
+        self._remove_expiry(request.expires_at, seq, approval_id)
+        return request
+    
+    def update_expiry(self, approval_id: str, expires_at: datetime) -> None:
+        """Move a pending approval to a new expiry time."""
+        request = self._requests.get(approval_id)
+        if request is None:
+            return
+        seq = self._seq[approval_id]
+        self._remove_expiry(request.expires_at, seq, approval_id)
+        request.expires_at = expires_at
+        bisect.insort(self._by_expiry, (expires_at, seq, approval_id))
+    
+    def select(self, approval_filter: ApprovalFilter | None = None) -> list[str]:
+        """Return IDs of matching approvals in creation order."""
+        return [request.id for request in self._iter_matching(approval_filter)]
+    
+    def page(
+        self,
+        approval_filter: ApprovalFilter | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> ApprovalPage:
+        """
+        Return one page of matching approvals in creation order.
+        
+        Args:
+            approval_filter: Which approvals to include; None for all.
+            limit: Maximum number of items on the page.
+            cursor: ``next_cursor`` from the previous page, if any.
+        
+        Raises:
+            ValueError: If ``limit`` is not positive or the cursor is invalid.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        try:
+            after = int(cursor) if cursor else -1
+        except ValueError:
+            raise ValueError(f"Invalid approval cursor: {cursor!r}") from None
+        
+        matches = self._iter_matching(approval_filter)
+        # Matches are in creation (sequence) order, so the cursor is a bisect
+        start = bisect.bisect_right(
+            matches, after, key=lambda request: self._seq[request.id]
+        )
+        items = matches[start:start + limit]
+        has_more = start + limit < len(matches)
+        next_cursor = str(self._seq[items[-1].id]) if has_more else None
+        return ApprovalPage(items=items, next_cursor=next_cursor, total=len(matches))
+    
+    def _iter_matching(
+        self,
+        approval_filter: ApprovalFilter | None,
+    ) -> list[HumanApprovalRequest]:
+        requests = self._requests
+        if approval_filter is None:
+            return list(requests.values())
+        
+        # (size, ids in creation order, membership test) per filtered field
+        sources: list[tuple[int, Callable[[], Iterable[str]], Callable[[str], bool]]] = []
+        for keys, index in (
+            (approval_filter.task_ids, self._by_task),
+            (approval_filter.agent_types, self._by_agent),
+            ({r.lower() for r in approval_filter.risk_levels}, self._by_risk),
+        ):
+            if keys:
+                buckets = [index[key] for key in keys if key in index]
+                sources.append((
+                    sum(len(bucket) for bucket in buckets),
+                    partial(self._merge_buckets, buckets),
+                    partial(_in_any, buckets),
+                ))
+        if approval_filter.expires_before or approval_filter.expires_after:
+            lo, hi = self._expiry_bounds(
+                approval_filter.expires_after, approval_filter.expires_before
+            )
+            sources.append((
+                hi - lo,
+                partial(self._expiry_ids, lo, hi),
+                lambda approval_id: approval_filter.matches(requests[approval_id]),
+            ))
+        if not sources:
+            return list(requests.values())
+        
+        # Walk the narrowest index; the others are only probed
+        sources.sort(key=lambda source: source[0])
+        candidates = sources[0][1]()
+        checks = [contains for _, _, contains in sources[1:]]
+        if not checks:
+            return [requests[approval_id] for approval_id in candidates]
+        return [
+            requests[approval_id]
+            for approval_id in candidates
+            if all(check(approval_id) for check in checks)
+        ]
+    
+    def _merge_buckets(self, buckets: list[dict[str, None]]) -> Iterable[str]:
+        # Each bucket is already in creation order; one needs no merging
+        if len(buckets) == 1:
+            return list(buckets[0])
+        merged = heapq.merge(*buckets, key=self._seq.__getitem__)
+        return list(dict.fromkeys(merged))
+    
+    def _expiry_bounds(
+        self,
+        after: datetime | None,
+        before: datetime | None,
+    ) -> tuple[int, int]:
+        lo = 0
+        hi = len(self._by_expiry)
+        if after is not None:
+            lo = bisect.bisect_right(self._by_expiry, (after, float("inf"), ""))
+        if before is not None:
+            hi = bisect.bisect_left(self._by_expiry, (before, -1, ""))
+        return lo, max(lo, hi)
+    
+    def _expiry_ids(self, lo: int, hi: int) -> list[str]:
+        entries = self._by_expiry[lo:hi]
+        entries.sort(key=lambda entry: entry[1])
+        return [approval_id for _, _, approval_id in entries]
+    
+    def _remove_expiry(self, expires_at: datetime, seq: int, approval_id: str) -> None:
+        i = bisect.bisect_left(self._by_expiry, (expires_at, seq, approval_id))
+        if i < len(self._by_expiry) and self._by_expiry[i][2] == approval_id:
+            del self._by_expiry[i]
+
+
+def _discard(index: dict, key: object, approval_id: str) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.pop(approval_id, None)
+        if not ids:
+            del index[key]
+
+
+def _in_any(buckets: list[dict[str, None]], approval_id: str) -> bool:
+    for bucket in buckets:
+        if approval_id in bucket:
+            return True
+    return False
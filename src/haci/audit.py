@@ -0,0 +1,489 @@
+"""
+Audit log storage for the HACI Harness.
+
+The in-memory store is a bounded ring buffer with secondary indexes by task
+and by event type, so per-task lookups cost O(entries for that task) rather
+than O(every entry ever written). Entries pushed out of the ring are handed
+to an optional archive for durable, queryable storage.
+
+Emission of each entry goes through an ``AuditSink``. The default sink logs
+inline through structlog; ``BatchedAuditSink`` instead queues entries for a
+background writer thread that appends them in batches to rotating segment
+files, keeping disk and log formatting off the gating hot path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable
+
+import structlog
+
+logger = structlog.get_logger()
+
+AuditEntry = dict[str, Any]
+
+FSYNC_MODES = ("batch", "interval")
+
+
+class AuditArchive:
+    """
+    SQLite archive for audit entries evicted from memory.
+    
+    Entries are stored as JSON alongside indexed ``task_id`` and ``event``
+    columns, and come back in insertion order.
+    """
+    
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS audit_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                task_id TEXT,
+                event TEXT NOT NULL,
+                entry TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS audit_log_task ON audit_log (task_id);
+            CREATE INDEX IF NOT EXISTS audit_log_event ON audit_log (event);
+            """
+        )
+        self._conn.commit()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()
+        return int(row[0])
+    
+    def write_many(self, entries: Iterable[AuditEntry]) -> int:
+        """Append entries in a single transaction."""
+        rows = [
+            (e.get("task_id"), e["event"], json.dumps(e, default=str))
+            for e in entries
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO audit_log (task_id, event, entry) VALUES (?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+    
+    def query(
+        self,
+        task_id: str | None = None,
+        event: str | None = None,
+    ) -> list[AuditEntry]:
+        """Return archived entries, optionally filtered by task and event."""
+        clauses, params = [], []
+        if task_id is not None:
+            clauses.append("task_id = ?")
+            params.append(task_id)
+        if event is not None:
+            clauses.append("event = ?")
+            params.append(event)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT entry FROM audit_log{where} ORDER BY seq", params
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class AuditStore:
+    """
+    Bounded, indexed in-memory audit log.
+    
+    Holds at most ``capacity`` entries. Because eviction is strictly oldest
+    first, the evicted entry is always at the head of its task and event
+    indexes, so eviction and appends are O(1). Evicted entries are buffered
+    and written to the archive in batches of ``archive_batch_size``. On an
+    event loop each full batch is written from a worker thread, so appends
+    never wait for SQLite; ``flush`` writes whatever is outstanding inline.
+    """
+    
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        archive: AuditArchive | None = None,
+        archive_batch_size: int = 1000,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.archive = archive
+        self.archive_batch_size = archive_batch_size
+        self._entries: deque[AuditEntry] = deque()
+        self._by_task: dict[str, deque[AuditEntry]] = {}
+        self._by_event: dict[str, deque[AuditEntry]] = {}
+        self._evicted: list[AuditEntry] = []
+        # Full batches waiting for the archive, oldest first
+        self._unarchived: deque[list[AuditEntry]] = deque()
+        # Held while writing so batches reach the archive in order
+        self._archive_lock = threading.Lock()
+        self._writer: asyncio.Task[None] | None = None
+        self.evicted_count = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def append(self, entry: AuditEntry) -> None:
+        """Add an entry, evicting the oldest one if the store is full."""
+        self._entries.append(entry)
+        task_id = entry.get("task_id")
+        if task_id is not None:
+            self._by_task.setdefault(task_id, deque()).append(entry)
+        self._by_event.setdefault(entry["event"], deque()).append(entry)
+        
+        if len(self._entries) > self.capacity:
+            self._evict_oldest()
+    
+    def extend(self, entries: Iterable[AuditEntry]) -> None:
+        """Add several entries in order."""
+        for entry in entries:
+            self.append(entry)
+    
+    def query(
+        self,
+        task_id: str | None = None,
+        event: str | None = None,
+        include_archived: bool = False,
+    ) -> list[AuditEntry]:
+        """
+        Return entries in write order, optionally filtered.
+        
+        Args:
+            task_id: Only entries for this task
+            event: Only entries of this event type
+            include_archived: Also return entries already evicted to the archive
+        
+        Returns:
+            Matching entries, oldest first
+        """
+        if task_id is not None:
+            candidates: Iterable[AuditEntry] = self._by_task.get(task_id, ())
+            if event is not None:
+                candidates = (e for e in candidates if e["event"] == event)
+        elif event is not None:
+            candidates = self._by_event.get(event, ())
+        else:
+            candidates = self._entries
+        entries = list(candidates)
+        
+        if include_archived and self.archive is not None:
+            self.flush()
+            entries = self.archive.query(task_id=task_id, event=event) + entries
+        return entries
+    
+    def flush(self) -> int:
+        """Write all buffered evicted entries to the archive now."""
+        if self._evicted:
+            self._unarchived.append(self._evicted)
+            self._evicted = []
+        return self._write_unarchived()
+    
+    def _schedule_archive(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_unarchived()
+            return
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._archive_in_background())
+    
+    async def _archive_in_background(self) -> None:
+        while self._unarchived:
+            try:
+                await asyncio.to_thread(self._write_unarchived)
+            except Exception as e:
+                # Batches stay queued for the next flush or eviction
+                logger.error("audit_archive_failed", error=str(e))
+                return
+    
+    def _write_unarchived(self) -> int:
+        written = 0
+        with self._archive_lock:
+            while self._unarchived:
+                if self.archive is not None:
+                    written += self.archive.write_many(self._unarchived[0])
+                self._unarchived.popleft()
+        return written
+    
+    def _evict_oldest(self) -> None:
+        entry = self._entries.popleft()
+        self.evicted_count += 1
+        
+        task_id = entry.get("task_id")
+        if task_id is not None:
+            task_entries = self._by_task[task_id]
+            task_entries.popleft()
+            if not task_entries:
+                del self._by_task[task_id]
+        event_entries = self._by_event[entry["event"]]
+        event_entries.popleft()
+        if not event_entries:
+            del self._by_event[entry["event"]]
+        
+        if self.archive is not None:
+            self._evicted.append(entry)
+            if len(self._evicted) >= self.archive_batch_size:
+                self._unarchived.append(self._evicted)
+                self._evicted = []
+                self._schedule_archive()
+
+
+class AuditSink(ABC):
+    """Destination for audit entries as they are written."""
+    
+    @abstractmethod
+    def emit(self, entry: AuditEntry) -> None:
+        """Accept an entry. Must not block on I/O in async-facing sinks."""
+    
+    def emit_many(self, entries: list[AuditEntry]) -> None:
+        """Accept several entries written together."""
+        for entry in entries:
+            self.emit(entry)
+    
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until emitted entries are written. Returns False on timeout."""
+        return True
+    
+    def close(self) -> None:
+        """Flush and release resources."""
+
+
+class LoggingAuditSink(AuditSink):
+    """Emit each entry inline as a structlog event."""
+    
+    def emit(self, entry: AuditEntry) -> None:
+        fields = {k: v for k, v in entry.items() if k not in ("event", "timestamp")}
+        logger.info(entry["event"], **fields)
+
+
+class SegmentedFileWriter:
+    """
+    Append-only JSON-lines writer over rotating segment files.
+    
+    Segments are named ``audit-00000001.jsonl`` and so on; a new segment is
+    started once the current one reaches ``max_segment_bytes``, and a
+    restarted writer always opens a fresh segment after the highest existing
+    one. With ``fsync_mode="batch"`` every batch is fsynced before
+    ``write_batch`` returns; with ``"interval"`` fsyncs are grouped to at most
+    one per ``fsync_interval_seconds``.
+    """
+    
+    def __init__(
+        self,
+        directory: str | Path,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        fsync_mode: str = "batch",
+        fsync_interval_seconds: float = 1.0,
+    ) -> None:
+        if fsync_mode not in FSYNC_MODES:
+            raise ValueError(f"fsync_mode must be one of {FSYNC_MODES}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync_mode = fsync_mode
+        self.fsync_interval_seconds = fsync_interval_seconds
+        
+        existing = sorted(self.directory.glob("audit-*.jsonl"))
+        self._segment_index = int(existing[-1].stem.split("-")[1]) if existing else 0
+        self._file = self._open_next_segment()
+        self._segment_bytes = 0
+        self._dirty = False
+        self._last_fsync = time.monotonic()
+        self.fsync_count = 0
+    
+    @property
+    def current_segment(self) -> Path:
+        """Path of the segment currently being appended to."""
+        return Path(self._file.name)
+    
+    def write_batch(self, entries: list[AuditEntry]) -> None:
+        """Append a batch of entries, rotating and fsyncing per policy."""
+        data = "".join(
+            json.dumps(e, default=str, separators=(",", ":")) + "\n"
+            for e in entries
+        ).encode()
+        segment_full = self._segment_bytes + len(data) > self.max_segment_bytes
+        if self._segment_bytes and segment_full:
+            self._rotate()
+        
+        self._file.write(data)
+        self._file.flush()
+        self._segment_bytes += len(data)
+        self._dirty = True
+        
+        if self.fsync_mode == "batch":
+            self.sync()
+        else:
+            self.maybe_sync()
+    
+    def maybe_sync(self) -> None:
+        """Fsync if the interval has elapsed since the last one."""
+        if time.monotonic() - self._last_fsync >= self.fsync_interval_seconds:
+            self.sync()
+    
+    def sync(self) -> None:
+        """Fsync the current segment if it has unsynced writes."""
+        if self._dirty:
+            os.fsync(self._file.fileno())
+            self.fsync_count += 1
+            self._dirty = False
+        self._last_fsync = time.monotonic()
+    
+    def close(self) -> None:
+        """Fsync and close the current segment."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+    
+    def _rotate(self) -> None:
+        self.close()
+        self._file = self._open_next_segment()
+        self._segment_bytes = 0
+    
+    def _open_next_segment(self) -> Any:
+        self._segment_index += 1
+        path = self.directory / f"audit-{self._segment_index:08d}.jsonl"
+        return open(path, "ab")
+
+
+class BatchedAuditSink(AuditSink):
+    """
+    Queue entries and write them in batches from a background thread.
+    
+    ``emit`` is a lock-free queue put, so callers on the event loop never
+    wait for disk or log formatting. The writer thread drains up to
+    ``max_batch`` entries at a time into a ``SegmentedFileWriter`` and,
+    when ``log_entries`` is set, also forwards them to structlog.
+    """
+    
+    _STOP = object()
+    
+    def __init__(
+        self,
+        writer: SegmentedFileWriter,
+        max_batch: int = 1000,
+        log_entries: bool = False,
+    ) -> None:
+        self.writer = writer
+        self.max_batch = max_batch
+        self._log_sink = LoggingAuditSink() if log_entries else None
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self.entries_written = 0
+        self.batches_written = 0
+        self.write_errors = 0
+    
+    @property
+    def pending(self) -> int:
+        """Approximate number of entries waiting to be written."""
+        return self._queue.qsize()
+    
+    def emit(self, entry: AuditEntry) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put(entry)
+    
+    def emit_many(self, entries: list[AuditEntry]) -> None:
+        # One queue operation; the writer keeps the entries in one batch
+        if not entries:
+            return
+        if self._thread is None:
+            self._start()
+        self._queue.put(list(entries))
+    
+    def flush(self, timeout: float | None = None) -> bool:
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        self.writer.close()
+    
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="haci-audit-writer", daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.writer.fsync_interval_seconds)
+            except queue.Empty:
+                self.writer.maybe_sync()
+                continue
+            
+            batch: list[AuditEntry] = []
+            waiters: list[threading.Event] = []
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif isinstance(item, list):
+                    batch.extend(item)
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                # A flush must never be left waiting on a dead writer
+                for waiter in waiters:
+                    waiter.set()
+    
+    def _write(self, batch: list[AuditEntry]) -> None:
+        try:
+            self.writer.write_batch(batch)
+            self.entries_written += len(batch)
+            self.batches_written += 1
+        except Exception as e:
+            # Disk errors and unserialisable entries drop this batch only
+            self.write_errors += 1
+            logger.error("audit_write_failed", error=str(e), entries=len(batch))
+        if self._log_sink is not None:
+            for entry in batch:
+                self._log_sink.emit(entry)
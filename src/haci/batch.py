@@ -0,0 +1,130 @@
+"""
+Bulk task submission from a stream of JSON lines.
+
+Backs ``haci submit-batch``. Tasks are read lazily from any iterable of
+lines and fed through one orchestrator with a bounded number in flight.
+Each result is written as a JSON line as soon as it completes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterable
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+
+
+@dataclass
+class BatchStats:
+    """Outcome counts and latencies of a batch run."""
+    
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    invalid: int = 0
+    elapsed_seconds: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+    
+    def summary_lines(self) -> list[str]:
+        """Human-readable summary of the run."""
+        latencies = sorted(self.latencies_ms)
+        rate = self.submitted / self.elapsed_seconds if self.elapsed_seconds else 0.0
+        lines = [
+            f"Tasks: {self.submitted} submitted, {self.completed} completed, "
+            f"{self.failed} failed, {self.invalid} invalid",
+            f"Elapsed: {self.elapsed_seconds:.2f}s ({rate:.1f} tasks/sec)",
+        ]
+        if latencies:
+            lines.append(
+                "Latency: "
+                f"p50={percentile(latencies, 50):.1f}ms "
+                f"p95={percentile(latencies, 95):.1f}ms "
+                f"p99={percentile(latencies, 99):.1f}ms "
+                f"max={latencies[-1]:.1f}ms"
+            )
+        return lines
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def run_batch(
+    config: HACIConfig,
+    lines: Iterable[str],
+    output: IO[str],
+    concurrency: int,
+    default_mode: str,
+    timeout: float,
+) -> BatchStats:
+    """Stream tasks from ``lines`` into one orchestrator and write their results."""
+    orchestrator = HACIOrchestrator(config)
+    stats = BatchStats()
+    slots = asyncio.Semaphore(concurrency)
+    waiters: set[asyncio.Task[None]] = set()
+    
+    def write(record: dict[str, Any]) -> None:
+        output.write(json.dumps(record) + "\n")
+    
+    async def collect(line_no: int, task_id: str, submitted_at: float) -> None:
+        try:
+            result = await orchestrator.await_result(task_id, timeout=timeout)
+        except TimeoutError as e:
+            stats.failed += 1
+            write({"line": line_no, "task_id": task_id, "error": str(e)})
+            # Hold the slot until the task has really stopped
+            orchestrator.cancel(task_id)
+            with contextlib.suppress(Exception):
+                await orchestrator.await_result(task_id)
+        except Exception as e:
+            # One task's failure must not abort the rest of the batch
+            stats.failed += 1
+            write({"line": line_no, "task_id": task_id, "error": f"Task failed: {e}"})
+        else:
+            stats.latencies_ms.append((time.perf_counter() - submitted_at) * 1000)
+            if result.status.value == "completed":
+                stats.completed += 1
+            else:
+                stats.failed += 1
+            write({"line": line_no, **result.model_dump(mode="json")})
+        finally:
+            slots.release()
+    
+    start = time.perf_counter()
+    try:
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            await slots.acquire()
+            try:
+                task_data = json.loads(line)
+                if not isinstance(task_data, dict):
+                    raise ValueError("task must be a JSON object")
+                metadata = task_data.setdefault("metadata", {})
+                if default_mode != "auto":
+                    metadata.setdefault("mode", default_mode)
+                task = orchestrator.submit(task_data)
+            except Exception as e:
+                slots.release()
+                stats.invalid += 1
+                write({"line": line_no, "error": f"Invalid task: {e}"})
+                continue
+            stats.submitted += 1
+            waiter = asyncio.create_task(
+                collect(line_no, task.id, time.perf_counter())
+            )
+            waiters.add(waiter)
+            waiter.add_done_callback(waiters.discard)
+        if waiters:
+            await asyncio.gather(*waiters)
+    finally:
+        stats.elapsed_seconds = time.perf_counter() - start
+        await orchestrator.close()
+    return stats
@@ -1,33 +1,66 @@
-"""HACI Command Line Interface."""
+"""
+HACI Command Line Interface.
+
+Only click is imported at start-up. Configuration (pydantic), the
+orchestrator and structlog are loaded by the commands that need them, so
+informational commands such as ``haci mode info`` start quickly.
+"""
+
+from __future__ import annotations
 
-import asyncio
-import json
 import sys
-from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING
 
 import click
-import structlog
-
-from haci import HACIOrchestrator, HACIConfig, __version__
-
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+
+from haci import __version__
+
+if TYPE_CHECKING:
+    from haci.config import HACIConfig
+    from haci.types import TaskResult, TaskStatus
+
+
+def _configure_logging() -> None:
+    """Configure structured logging; done once, by commands that run tasks."""
+    import structlog
+    
+    if structlog.is_configured():
+        return
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.dev.ConsoleRenderer(),
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
+def _load_config(ctx: click.Context) -> HACIConfig:
+    """Load the configuration on first use and set up logging."""
+    obj = ctx.ensure_object(dict)
+    if "config" not in obj:
+        from haci.config import HACIConfig
+        
+        _configure_logging()
+        config_path = obj.get("config_path")
+        if config_path:
+            config = HACIConfig.from_yaml(config_path)
+        else:
+            config = HACIConfig.from_env()
+        if obj.get("debug"):
+            config.debug = True
+            config.log_level = "DEBUG"
+        obj["config"] = config
+    return obj["config"]
 
 
 @click.group()
@@ -39,28 +72,25 @@ def main(ctx: click.Context, config: str | None, debug: bool) -> None:
     """HACI - Harness-Enhanced Agentic Collaborative Intelligence CLI."""
     ctx.ensure_object(dict)
     
-    # Load configuration
-    if config:
-        ctx.obj["config"] = HACIConfig.from_yaml(config)
-    else:
-        ctx.obj["config"] = HACIConfig.from_env()
-    
-    if debug:
-        ctx.obj["config"].debug = True
-        ctx.obj["config"].log_level = "DEBUG"
+    # Configuration is loaded by the commands that use it
+    ctx.obj["config_path"] = config
+    ctx.obj["debug"] = debug
 
 
 @main.command()
+@click.option("--host", default=None, help="Bind address (default: server.host)")
+@click.option("--port", type=int, default=None, help="Port (default: server.port)")
 @click.pass_context
-def server(ctx: click.Context) -> None:
-    """Start the HACI server."""
-    import uvicorn
-    
-    config = ctx.obj["config"]
-    click.echo(f"Starting HACI server (debug={config.debug})")
+def server(ctx: click.Context, host: str | None, port: int | None) -> None:
+    """Start the HACI HTTP server with one long-lived orchestrator."""
+    from haci.server import run
     
-    # In production, this would start the FastAPI server
-    click.echo("Server starting... (placeholder)")
+    config = _load_config(ctx)
+    click.echo(
+        f"Starting HACI server on {host or config.server.host}:"
+        f"{port if port is not None else config.server.port} (debug={config.debug})"
+    )
+    run(config, host=host, port=port)
 
 
 @main.command()
@@ -68,8 +98,8 @@ def server(ctx: click.Context) -> None:
 @click.option("--description", "-d", default="", help="Task description")
 @click.option("--priority", "-p", default="medium", help="Task priority")
 @click.option("--mode", "-m", default="auto", help="Execution mode")
-@click.option("--wait", is_flag=True, help="Wait for completion")
-@click.option("--timeout", default=300, help="Timeout in seconds (with --wait)")
+@click.option("--wait", is_flag=True, help="Print the full result, not just the status")
+@click.option("--timeout", default=300, help="Timeout in seconds")
 @click.pass_context
 def submit(
     ctx: click.Context,
@@ -80,9 +110,18 @@ def submit(
     wait: bool,
     timeout: int,
 ) -> None:
-    """Submit a task to HACI."""
-    config = ctx.obj["config"]
-    orchestrator = HACIOrchestrator(config)
+    """
+    Submit a task to HACI and run it to completion.
+    
+    The orchestrator lives only as long as this command, so the task is
+    always run before it exits. With a persistent ``task_store`` backend
+    ``haci status`` can look it up afterwards.
+    """
+    import asyncio
+    
+    from haci.orchestrator import HACIOrchestrator
+    
+    config = _load_config(ctx)
     
     task_data = {
         "type": "cli_task",
@@ -92,37 +131,115 @@ def submit(
         "metadata": {"mode": mode} if mode != "auto" else {},
     }
     
-    task = orchestrator.submit(task_data)
-    click.echo(f"Task submitted: {task.id}")
+    async def run() -> TaskResult:
+        orchestrator = HACIOrchestrator(config)
+        try:
+            task = orchestrator.submit(task_data)
+            click.echo(f"Task submitted: {task.id}")
+            click.echo("Waiting for completion...")
+            return await orchestrator.await_result(task.id, timeout=timeout)
+        finally:
+            # Flushes the task store so later commands see the task
+            await orchestrator.close()
+    
+    try:
+        result = asyncio.run(run())
+    except TimeoutError:
+        click.echo(f"Task did not complete within {timeout}s")
+        sys.exit(1)
     
     if wait:
-        click.echo("Waiting for completion...")
-        try:
-            result = asyncio.run(
-                orchestrator.await_result(task.id, timeout=timeout)
-            )
-            click.echo(f"\nResult:")
-            click.echo(f"  Status: {result.status.value}")
-            click.echo(f"  Mode: {result.mode.value}")
-            click.echo(f"  Confidence: {result.confidence}%")
-            click.echo(f"  Summary: {result.summary}")
-            click.echo(f"  Time: {result.execution_time_ms}ms")
-            click.echo(f"  Cost: ${result.cost_usd:.4f}")
-        except TimeoutError:
-            click.echo(f"Task did not complete within {timeout}s")
-            sys.exit(1)
+        click.echo(f"\nResult:")
+        click.echo(f"  Status: {result.status.value}")
+        click.echo(f"  Mode: {result.mode.value}")
+        click.echo(f"  Confidence: {result.confidence}%")
+        click.echo(f"  Summary: {result.summary}")
+        click.echo(f"  Time: {result.execution_time_ms}ms")
+        click.echo(f"  Cost: ${result.cost_usd:.4f}")
+    else:
+        click.echo(f"Task {result.task_id}: {result.status.value}")
+
+
+@main.command("submit-batch")
+@click.argument("input_file", type=click.File("r"))
+@click.option(
+    "--output", "-o", type=click.File("w"), default="-",
+    help="Where to write results as JSONL (default: stdout)",
+)
+@click.option(
+    "--concurrency", "-j", type=click.IntRange(min=1), default=None,
+    help="Maximum tasks in flight (default: execution.max_concurrent_tasks)",
+)
+@click.option("--mode", "-m", default="auto", help="Execution mode for tasks that set none")
+@click.option("--timeout", default=300, help="Per-task timeout in seconds")
+@click.pass_context
+def submit_batch(
+    ctx: click.Context,
+    input_file: IO[str],
+    output: IO[str],
+    concurrency: int | None,
+    mode: str,
+    timeout: int,
+) -> None:
+    """
+    Submit every task in a JSONL file through one orchestrator.
+    
+    Each line of INPUT_FILE ("-" for stdin) is a task object with the same
+    fields as ``submit`` (title, description, priority, type, metadata). The
+    file is read as tasks are submitted, never all at once. Results are
+    written as JSONL in completion order, each tagged with its input line,
+    followed by a throughput and latency summary.
+    """
+    import asyncio
+    
+    from haci.batch import run_batch
+    
+    config = _load_config(ctx)
+    window = concurrency or config.execution.max_concurrent_tasks
+    # Let the orchestrator run as many tasks as we keep in flight
+    config.execution.max_concurrent_tasks = max(
+        config.execution.max_concurrent_tasks, window
+    )
+    
+    stats = asyncio.run(
+        run_batch(config, input_file, output, window, mode, timeout)
+    )
+    output.flush()
+    
+    # Keep the summary out of the results when they go to stdout
+    to_stderr = output is sys.stdout or getattr(output, "name", "") == "<stdout>"
+    for line in stats.summary_lines():
+        click.echo(line, err=to_stderr)
+    if stats.failed or stats.invalid:
+        sys.exit(1)
 
 
 @main.command()
 @click.argument("task_id")
 @click.pass_context
 def status(ctx: click.Context, task_id: str) -> None:
-    """Check the status of a task."""
-    config = ctx.obj["config"]
-    orchestrator = HACIOrchestrator(config)
+    """Check the status of a task in the persistent task store."""
+    import asyncio
+    
+    from haci.orchestrator import HACIOrchestrator
+    
+    config = _load_config(ctx)
+    if config.task_store.backend == "memory":
+        click.echo(
+            "Task status needs a persistent task store; "
+            "set task_store.backend to 'sqlalchemy'"
+        )
+        sys.exit(1)
+    
+    async def lookup() -> TaskStatus:
+        orchestrator = HACIOrchestrator(config)
+        try:
+            return await orchestrator.fetch_status(task_id)
+        finally:
+            await orchestrator.close()
     
     try:
-        task_status = orchestrator.get_status(task_id)
+        task_status = asyncio.run(lookup())
         click.echo(f"Task {task_id}: {task_status.value}")
     except KeyError:
         click.echo(f"Task not found: {task_id}")
@@ -133,7 +250,7 @@ def status(ctx: click.Context, task_id: str) -> None:
 @click.pass_context
 def validate(ctx: click.Context) -> None:
     """Validate configuration."""
-    config = ctx.obj["config"]
+    config = _load_config(ctx)
     
     click.echo("Validating HACI configuration...")
     
@@ -188,8 +305,6 @@ def mode() -> None:
 @click.argument("mode_name")
 def mode_info(mode_name: str) -> None:
     """Show information about an execution mode."""
-    from haci.types import ExecutionMode
-    
     mode_details = {
         "single_agent": {
             "agents": "1",
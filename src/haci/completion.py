@@ -0,0 +1,209 @@
+"""
+Task completion channel for the HACI orchestrator.
+
+Every finished ``TaskResult`` is published once to a ``CompletionChannel``,
+which fans it out to whoever is waiting: one-shot futures for
+``await_result`` callers, per-caller subscriptions for ``as_completed`` and
+filtered streams for ``stream_results``. Waiters exist only while someone is
+waiting, so submitting a task allocates nothing here. Publishing costs
+O(waiters for that task + open streams). Closing a subscription or the
+channel wakes every reader still blocked on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Iterable, Union
+
+import structlog
+
+from haci.types import TaskResult
+
+logger = structlog.get_logger()
+
+ResultFilter = Callable[[TaskResult], bool]
+
+# Queued after the last result of a closed subscription
+_CLOSED = object()
+
+
+class CompletionSubscription:
+    """
+    Buffered feed of results from a ``CompletionChannel``.
+    
+    With a ``max_buffer`` the oldest undelivered result is dropped when the
+    buffer is full, so a slow consumer never blocks publishers;
+    ``dropped`` counts the losses. After ``close``, results already
+    buffered are still returned; then iteration ends and ``get`` raises
+    ``RuntimeError``.
+    """
+    
+    def __init__(
+        self,
+        channel: CompletionChannel,
+        task_ids: frozenset[str] | None = None,
+        result_filter: ResultFilter | None = None,
+        max_buffer: int = 0,
+    ) -> None:
+        self._channel = channel
+        self.task_ids = task_ids
+        self.result_filter = result_filter
+        # Unbounded so the close marker always fits; max_buffer is enforced
+        # in _deliver
+        self._queue: asyncio.Queue[Union[TaskResult, object]] = asyncio.Queue()
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self.closed = False
+    
+    def __aiter__(self) -> CompletionSubscription:
+        return self
+    
+    async def __anext__(self) -> TaskResult:
+        try:
+            return await self.get()
+        except RuntimeError:
+            if self.closed:
+                raise StopAsyncIteration from None
+            raise
+    
+    async def get(self) -> TaskResult:
+        """
+        Wait for the next result.
+        
+        Raises:
+            RuntimeError: If the subscription is closed and drained
+        """
+        item = await self._queue.get()
+        if item is _CLOSED:
+            # Leave the marker for any other reader
+            self._queue.put_nowait(_CLOSED)
+            raise RuntimeError("Result subscription is closed")
+        return item  # type: ignore[return-value]
+    
+    def close(self) -> None:
+        """Stop receiving results and wake any reader waiting for one."""
+        if not self.closed:
+            self.closed = True
+            self._channel.unsubscribe(self)
+            self._queue.put_nowait(_CLOSED)
+    
+    def _deliver(self, result: TaskResult) -> None:
+        if self.closed:
+            return
+        if self.result_filter is not None and not self.result_filter(result):
+            return
+        if self.max_buffer and self._queue.qsize() >= self.max_buffer:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(result)
+
+
+class CompletionChannel:
+    """Single fan-out point for finished task results."""
+    
+    def __init__(self) -> None:
+        self._waiters: dict[str, list[asyncio.Future[TaskResult]]] = {}
+        self._by_task: dict[str, list[CompletionSubscription]] = {}
+        self._streams: list[CompletionSubscription] = []
+        self.published = 0
+        self.closed = False
+    
+    @property
+    def subscriber_count(self) -> int:
+        """Open subscriptions, counting each task-set subscription once."""
+        task_subs = {id(s) for subs in self._by_task.values() for s in subs}
+        return len(task_subs) + len(self._streams)
+    
+    def wait(self, task_id: str) -> asyncio.Future[TaskResult]:
+        """Return a future resolved with the task's result when it is published."""
+        future: asyncio.Future[TaskResult] = asyncio.get_running_loop().create_future()
+        if self.closed:
+            future.set_exception(RuntimeError("Completion channel is closed"))
+            return future
+        self._waiters.setdefault(task_id, []).append(future)
+        future.add_done_callback(lambda f: self._discard_waiter(task_id, f))
+        return future
+    
+    def subscribe_tasks(self, task_ids: Iterable[str]) -> CompletionSubscription:
+        """Subscribe to the results of specific tasks."""
+        ids = frozenset(task_ids)
+        subscription = CompletionSubscription(self, task_ids=ids)
+        if self.closed:
+            subscription.close()
+            return subscription
+        for task_id in ids:
+            self._by_task.setdefault(task_id, []).append(subscription)
+        return subscription
+    
+    def subscribe(
+        self,
+        result_filter: ResultFilter | None = None,
+        max_buffer: int = 0,
+    ) -> CompletionSubscription:
+        """Subscribe to every published result accepted by ``result_filter``."""
+        subscription = CompletionSubscription(
+            self, result_filter=result_filter, max_buffer=max_buffer
+        )
+        if self.closed:
+            subscription.close()
+            return subscription
+        self._streams.append(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: CompletionSubscription) -> None:
+        """Detach a subscription; pending results stay readable."""
+        if subscription.task_ids is None:
+            if subscription in self._streams:
+                self._streams.remove(subscription)
+            return
+        for task_id in subscription.task_ids:
+            subs = self._by_task.get(task_id)
+            if subs is None:
+                continue
+            if subscription in subs:
+                subs.remove(subscription)
+            if not subs:
+                del self._by_task[task_id]
+    
+    def close(self) -> None:
+        """
+        Release everyone still waiting: one-shot waiters fail with
+        ``RuntimeError`` and subscriptions end once drained.
+        """
+        self.closed = True
+        waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(RuntimeError("Completion channel is closed"))
+        subscriptions = {
+            id(s): s for subs in self._by_task.values() for s in subs
+        }
+        for subscription in [*subscriptions.values(), *self._streams]:
+            subscription.close()
+    
+    def publish(self, result: TaskResult) -> None:
+        """Deliver a finished task's result to everyone waiting for it."""
+        self.published += 1
+        for future in self._waiters.pop(result.task_id, ()):
+            if not future.done():
+                future.set_result(result)
+        for subscription in self._by_task.get(result.task_id, ()):
+            subscription._deliver(result)
+        for subscription in self._streams:
+            try:
+                subscription._deliver(result)
+            except Exception as e:
+                logger.error("result_filter_failed", error=str(e))
+    
+    def _discard_waiter(self, task_id: str, future: asyncio.Future[TaskResult]) -> None:
+        # Drops waiters abandoned by a timeout or cancellation
+        waiters = self._waiters.get(task_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(future)
+        except ValueError:
+            return
+        if not waiters:
+            del self._waiters[task_id]
@@ -20,6 +20,24 @@ class ConfidenceThresholds(BaseModel):
     human_led: int = Field(default=0, ge=0, le=100)
 
 
+class QuorumPolicy(BaseModel):
+    """Stop a swarm once enough agents agree on a root cause."""
+    
+    enabled: bool = Field(default=True)
+    agents: int = Field(default=3, ge=1)  # agreeing agents needed
+    min_confidence: float = Field(default=85.0, ge=0, le=100)  # per agent
+
+
+class HedgeConfig(BaseModel):
+    """Race a single agent against a micro-swarm for borderline tickets."""
+    
+    enabled: bool = Field(default=False)
+    min_score: int = Field(default=3, ge=1, le=10)  # complexity scores hedged
+    max_score: int = Field(default=4, ge=1, le=10)
+    delay_seconds: float = Field(default=2.0, ge=0)  # before launching the swarm
+    min_confidence: float = Field(default=85.0, ge=0, le=100)  # acceptable answer
+
+
 class ExecutionConfig(BaseModel):
     """Configuration for execution modes."""
     
@@ -29,6 +47,68 @@ class ExecutionConfig(BaseModel):
     )
     max_swarm_agents: int = Field(default=10)
     timeout_seconds: int = Field(default=300)
+    max_concurrent_tasks: int = Field(default=50, ge=1)  # per process
+    worker_processes: int = Field(default=0, ge=0)  # 0: run tasks in-process
+    agent_backend: str = Field(default="simulated", pattern="^(simulated|llm)$")
+    # Keyed by swarm execution mode; modes without an enabled entry wait for
+    # every agent. Off by default since stopping early changes results
+    quorum: dict[str, QuorumPolicy] = Field(
+        default_factory=lambda: {
+            "micro_swarm": QuorumPolicy(enabled=False, agents=2, min_confidence=90.0),
+            "full_swarm": QuorumPolicy(enabled=False, agents=3, min_confidence=85.0),
+        }
+    )
+    hedge: HedgeConfig = Field(default_factory=HedgeConfig)
+
+
+class RetentionConfig(BaseModel):
+    """Retention of finished tasks in orchestrator memory."""
+    
+    ttl_seconds: int = Field(default=3600, ge=0)  # 0 disables TTL expiry
+    max_completed_tasks: int = Field(default=10_000, ge=0)
+    # SQLite file for evicted results; None drops them from this process,
+    # leaving only what a persistent task store holds
+    spill_path: str | None = Field(default=None)
+
+
+class ComplexityCacheConfig(BaseModel):
+    """Cache of complexity scores for repeated tasks."""
+    
+    enabled: bool = Field(default=True)
+    max_entries: int = Field(default=10_000, ge=1)
+    ttl_seconds: int = Field(default=900, ge=0)  # 0 disables TTL expiry
+    persist_path: str | None = Field(default=None)
+
+
+class ResponseCacheConfig(BaseModel):
+    """Exact-match cache of LLM responses to agent calls."""
+    
+    enabled: bool = Field(default=True)
+    memory_max_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    disk_path: str | None = Field(default=None)  # None: memory only
+    disk_max_bytes: int = Field(default=1024 * 1024 * 1024, ge=0)
+    ttl_seconds: int = Field(default=86_400, ge=0)  # 0 disables TTL expiry
+    # Hotter requests bypass; matches AgentConfig's default temperature
+    max_temperature: float = Field(default=0.1, ge=0)
+
+
+class TaskStoreConfig(BaseModel):
+    """Persistent storage of task status and results."""
+    
+    backend: str = Field(default="memory", pattern="^(memory|sqlalchemy)$")
+    url: str | None = Field(default=None)  # None: use database.url
+    batch_size: int = Field(default=500, ge=1)
+    flush_interval_seconds: float = Field(default=0.05, gt=0)
+
+
+class ServerConfig(BaseModel):
+    """HTTP server settings for ``haci server``."""
+    
+    host: str = Field(default="127.0.0.1")
+    port: int = Field(default=8000, ge=0, le=65535)
+    keep_alive_seconds: int = Field(default=30, ge=1)
+    event_loop: str = Field(default="auto", pattern="^(auto|uvloop|asyncio)$")
+    access_log: bool = Field(default=False)
 
 
 class AgentConfig(BaseModel):
@@ -47,6 +127,9 @@ class MCPServerConfig(BaseModel):
     url: str
     enabled: bool = Field(default=True)
     timeout_seconds: int = Field(default=30)
+    sessions: int = Field(default=2, ge=1)  # warm sessions kept per server
+    max_in_flight_per_session: int = Field(default=16, ge=1)
+    health_check_seconds: float = Field(default=30.0, ge=0)  # 0 disables pings
 
 
 class APIProviderConfig(BaseModel):
@@ -58,6 +141,21 @@ class APIProviderConfig(BaseModel):
     enabled: bool = Field(default=True)
 
 
+class LLMProviderConfig(BaseModel):
+    """Connection pool and limits for one LLM provider."""
+    
+    name: str  # anthropic | openai, or any name with ``kind`` set
+    kind: str | None = Field(default=None, pattern="^(anthropic|openai)$")  # None: name
+    base_url: str | None = Field(default=None)  # None: the provider's public API
+    api_key: str = Field(default="")  # empty: the matching top-level *_api_key
+    enabled: bool = Field(default=True)
+    max_concurrency: int = Field(default=16, ge=1)  # requests in flight
+    max_connections: int = Field(default=32, ge=1)
+    keepalive_seconds: float = Field(default=30.0, gt=0)
+    timeout_seconds: float = Field(default=120.0, gt=0)
+    http2: bool = Field(default=True)
+
+
 class IntegrationsConfig(BaseModel):
     """Configuration for integrations."""
     
@@ -65,6 +163,12 @@ class IntegrationsConfig(BaseModel):
     mcp_servers: list[MCPServerConfig] = Field(default_factory=list)
     api_enabled: bool = Field(default=True)
     api_providers: list[APIProviderConfig] = Field(default_factory=list)
+    llm_providers: list[LLMProviderConfig] = Field(
+        default_factory=lambda: [
+            LLMProviderConfig(name="anthropic"),
+            LLMProviderConfig(name="openai"),
+        ]
+    )
 
 
 class DatabaseConfig(BaseModel):
@@ -103,7 +207,14 @@ class HACIConfig(BaseSettings):
     
     # Component configs
     execution: ExecutionConfig = Field(default_factory=ExecutionConfig)
+    retention: RetentionConfig = Field(default_factory=RetentionConfig)
+    complexity_cache: ComplexityCacheConfig = Field(
+        default_factory=ComplexityCacheConfig
+    )
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    task_store: TaskStoreConfig = Field(default_factory=TaskStoreConfig)
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+    server: ServerConfig = Field(default_factory=ServerConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
     integrations: IntegrationsConfig = Field(default_factory=IntegrationsConfig)
     
@@ -153,7 +264,8 @@ class HACIConfig(BaseSettings):
     
     def get_agent_config(self, agent_type: str) -> AgentConfig:
         """Get configuration for a specific agent type."""
-        return self.agents.get(agent_type, AgentConfig())
+        config = self.agents.get(agent_type) or DEFAULT_AGENT_CONFIGS.get(agent_type)
+        return config or AgentConfig()
     
     def validate_api_keys(self) -> list[str]:
         """Validate that required API keys are present."""
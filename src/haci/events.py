@@ -0,0 +1,247 @@
+"""
+Task status-transition events for the HACI orchestrator.
+
+Every ``TaskStatus`` change the orchestrator makes is published to a
+``StatusEventBus`` as a ``StatusEvent``. Consumers such as dashboards
+subscribe instead of polling ``get_status``. Subscriptions can be narrowed
+by task, status and mode. Each one has a bounded buffer that drops its
+oldest event when full, so a slow consumer can never stall task processing.
+When nobody is subscribed the orchestrator does not build events at all.
+Closing a subscription, or the whole bus, ends iterators blocked on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, Union
+
+from haci.types import AgentType, ExecutionMode, TaskStatus
+
+# Queued after the last event of a closed subscription
+_CLOSED = object()
+
+
+@dataclass(frozen=True)
+class StatusEvent:
+    """One status transition of a task."""
+    
+    task_id: str
+    status: TaskStatus
+    previous_status: TaskStatus | None
+    mode: ExecutionMode
+    agents: tuple[AgentType, ...] = ()
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly representation."""
+        return {
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "previous_status": self.previous_status.value if self.previous_status else None,
+            "mode": self.mode.value,
+            "agents": [agent.value for agent in self.agents],
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+class StatusSubscription:
+    """
+    Buffered, filtered feed of status events.
+    
+    Empty filters match everything; different filters must all match. Once
+    ``max_buffer`` events are waiting the oldest is dropped and counted in
+    ``dropped``. Iterate with ``async for``; ``close()`` (or leaving a
+    ``with`` block) detaches it from the bus. Events already buffered are
+    still returned after that; then iteration ends and ``get`` raises
+    ``RuntimeError``.
+    """
+    
+    def __init__(
+        self,
+        bus: StatusEventBus,
+        task_ids: frozenset[str] = frozenset(),
+        statuses: frozenset[TaskStatus] = frozenset(),
+        modes: frozenset[ExecutionMode] = frozenset(),
+        max_buffer: int = 1000,
+    ) -> None:
+        if max_buffer < 1:
+            raise ValueError("max_buffer must be at least 1")
+        self._bus = bus
+        self.task_ids = task_ids
+        self.statuses = statuses
+        self.modes = modes
+        # Unbounded so the close marker always fits; max_buffer is enforced
+        # in _deliver
+        self._queue: asyncio.Queue[Union[StatusEvent, object]] = asyncio.Queue()
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self.closed = False
+    
+    def __enter__(self) -> StatusSubscription:
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    def __aiter__(self) -> StatusSubscription:
+        return self
+    
+    async def __anext__(self) -> StatusEvent:
+        try:
+            return await self.get()
+        except RuntimeError:
+            if self.closed:
+                raise StopAsyncIteration from None
+            raise
+    
+    async def get(self) -> StatusEvent:
+        """
+        Wait for the next event.
+        
+        Raises:
+            RuntimeError: If the subscription is closed and drained
+        """
+        event = await self._queue.get()
+        if event is _CLOSED:
+            # Leave the marker for any other reader
+            self._queue.put_nowait(_CLOSED)
+            raise RuntimeError("Status subscription is closed")
+        return event  # type: ignore[return-value]
+    
+    def get_nowait(self) -> StatusEvent | None:
+        """Return the next buffered event, or None if there is none."""
+        try:
+            event = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+        if event is _CLOSED:
+            self._queue.put_nowait(_CLOSED)
+            return None
+        return event  # type: ignore[return-value]
+    
+    def close(self) -> None:
+        """Stop receiving events; buffered events stay readable."""
+        if not self.closed:
+            self._bus.unsubscribe(self)
+    
+    def matches(self, event: StatusEvent) -> bool:
+        """Return True if the event passes every set filter."""
+        if self.task_ids and event.task_id not in self.task_ids:
+            return False
+        if self.statuses and event.status not in self.statuses:
+            return False
+        if self.modes and event.mode not in self.modes:
+            return False
+        return True
+    
+    def _deliver(self, event: StatusEvent) -> None:
+        if self.closed or not self.matches(event):
+            return
+        if self._queue.qsize() >= self.max_buffer:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+    
+    def _end(self) -> None:
+        # Wakes readers blocked in get() once the buffer is drained
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(_CLOSED)
+
+
+class StatusEventBus:
+    """
+    In-process pub/sub of task status transitions.
+    
+    Subscriptions limited to specific tasks are indexed by task ID, so an
+    event is only offered to those for its own task plus the unscoped ones.
+    Must be used from the event loop thread.
+    """
+    
+    def __init__(self) -> None:
+        self._by_task: dict[str, list[StatusSubscription]] = {}
+        self._global: list[StatusSubscription] = []
+        self._count = 0
+        self.published = 0
+        self.closed = False
+    
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return self._count
+    
+    def subscribe(
+        self,
+        task_ids: Iterable[str] | None = None,
+        statuses: Iterable[TaskStatus] | None = None,
+        modes: Iterable[ExecutionMode] | None = None,
+        max_buffer: int = 1000,
+    ) -> StatusSubscription:
+        """
+        Subscribe to status events.
+        
+        Args:
+            task_ids: Only events for these tasks; None for all tasks
+            statuses: Only transitions into these statuses; None for all
+            modes: Only events for tasks in these modes; None for all
+            max_buffer: Undelivered events kept before the oldest is dropped
+        """
+        subscription = StatusSubscription(
+            self,
+            task_ids=frozenset(task_ids or ()),
+            statuses=frozenset(TaskStatus(s) for s in statuses or ()),
+            modes=frozenset(ExecutionMode(m) for m in modes or ()),
+            max_buffer=max_buffer,
+        )
+        if self.closed:
+            subscription._end()
+            return subscription
+        if subscription.task_ids:
+            for task_id in subscription.task_ids:
+                self._by_task.setdefault(task_id, []).append(subscription)
+        else:
+            self._global.append(subscription)
+        self._count += 1
+        return subscription
+    
+    def unsubscribe(self, subscription: StatusSubscription) -> None:
+        """Detach and close a subscription."""
+        subscription._end()
+        if not subscription.task_ids:
+            if subscription not in self._global:
+                return
+            self._global.remove(subscription)
+        else:
+            found = False
+            for task_id in subscription.task_ids:
+                subs = self._by_task.get(task_id)
+                if subs is None or subscription not in subs:
+                    continue
+                found = True
+                subs.remove(subscription)
+                if not subs:
+                    del self._by_task[task_id]
+            if not found:
+                return
+        self._count -= 1
+    
+    def close(self) -> None:
+        """Close every subscription; later ones start out closed."""
+        self.closed = True
+        scoped = {id(s): s for subs in self._by_task.values() for s in subs}
+        for subscription in [*scoped.values(), *self._global]:
+            self.unsubscribe(subscription)
+    
+    def wants(self, task_id: str) -> bool:
+        """Return True if any subscription could receive events for the task."""
+        return bool(self._global) or task_id in self._by_task
+    
+    def publish(self, event: StatusEvent) -> None:
+        """Offer an event to every matching subscription."""
+        self.published += 1
+        for subscription in self._by_task.get(event.task_id, ()):
+            subscription._deliver(event)
+        for subscription in self._global:
+            subscription._deliver(event)
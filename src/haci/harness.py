@@ -9,15 +9,31 @@ across all execution modes.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import inspect
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, TypeVar
+from typing import Any, Awaitable, Callable, TypeVar, Union
 
 import structlog
 from pydantic import BaseModel, Field
 
+from haci.approvals import ApprovalFilter, ApprovalPage, ApprovalQueue
+from haci.audit import (
+    AuditArchive,
+    AuditEntry,
+    AuditSink,
+    AuditStore,
+    BatchedAuditSink,
+    LoggingAuditSink,
+    SegmentedFileWriter,
+)
+from haci.shared.rate_limit import RateLimitStats, TokenBucket
+from haci.shared.timing_wheel import TimingWheel
 from haci.types import (
     AgentType,
     ConfidenceLevel,
@@ -30,6 +46,17 @@ logger = structlog.get_logger()
 
 T = TypeVar("T")
 
+# How long a thread waits for the event loop to apply an approval decision
+_LOOP_CALL_TIMEOUT_SECONDS = 10.0
+
+# An approval handler decides (True/False) or returns None to defer the
+# decision to a later Harness.approve()/reject() call. It may be sync or async.
+ApprovalHandler = Callable[
+    [HumanApprovalRequest],
+    Union[bool, None, Awaitable[Union[bool, None]]],
+]
+ApprovalDecision = tuple[bool, str]
+
 
 class HarnessConfig(BaseModel):
     """Configuration for the Harness."""
@@ -43,13 +70,32 @@ class HarnessConfig(BaseModel):
     approval_timeout_seconds: int = Field(default=3600)
     action_timeout_seconds: int = Field(default=300)
     
-    # Rate limits
-    max_actions_per_minute: int = Field(default=60)
+    # Approval expiry: "reject" fails expired approvals; "escalate" extends
+    # them by another timeout up to approval_max_escalations, then rejects
+    approval_expiry_policy: str = Field(default="reject", pattern="^(reject|escalate)$")
+    approval_max_escalations: int = Field(default=1, ge=0)
+    approval_expiry_tick_seconds: float = Field(default=1.0, gt=0)
+    
+    # Rate limits (token buckets; a per-minute limit of 0 disables that bucket)
+    max_actions_per_minute: int = Field(default=60)  # per task
+    max_global_actions_per_minute: int = Field(default=600)
+    rate_limit_mode: str = Field(default="wait", pattern="^(wait|reject)$")
+    rate_limit_max_wait_seconds: float = Field(default=30.0, ge=0)
     max_tool_calls_per_task: int = Field(default=100)
     
     # Audit settings
     audit_all_actions: bool = Field(default=True)
     log_tool_outputs: bool = Field(default=True)
+    audit_max_entries: int = Field(default=100_000, ge=1)
+    audit_archive_path: str | None = Field(default=None)  # None: evicted entries only in logs
+    
+    # Audit sink: with a segment directory, entries are written in batches
+    # by a background thread instead of being logged inline
+    audit_segment_dir: str | None = Field(default=None)
+    audit_segment_max_bytes: int = Field(default=64 * 1024 * 1024, ge=1)
+    audit_fsync_mode: str = Field(default="batch", pattern="^(batch|interval)$")
+    audit_fsync_interval_seconds: float = Field(default=1.0, gt=0)
+    audit_batch_size: int = Field(default=1000, ge=1)
 
 
 @dataclass
@@ -63,6 +109,7 @@ class HarnessContext:
     actions_taken: list[dict[str, Any]] = field(default_factory=list)
     pending_approvals: list[str] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.utcnow)
+    rate_limiter: TokenBucket | None = None
     
     def elapsed_seconds(self) -> float:
         """Get elapsed time in seconds."""
@@ -99,14 +146,39 @@ class Harness:
     def __init__(
         self,
         config: HarnessConfig | None = None,
-        approval_handler: Callable[[HumanApprovalRequest], bool] | None = None,
+        approval_handler: ApprovalHandler | None = None,
+        audit_sink: AuditSink | None = None,
     ) -> None:
         self.config = config or HarnessConfig()
         self._approval_handler = approval_handler
         self._contexts: dict[str, HarnessContext] = {}
-        self._pending_approvals: dict[str, HumanApprovalRequest] = {}
-        self._audit_log: list[dict[str, Any]] = []
-        
+        self._pending_approvals = ApprovalQueue()
+        self._approval_futures: dict[str, asyncio.Future[ApprovalDecision]] = {}
+        self._approval_expiry = TimingWheel(
+            tick_seconds=self.config.approval_expiry_tick_seconds,
+        )
+        self._approval_escalations: dict[str, int] = {}
+        # Loop the gated coroutines wait on; decisions are applied there
+        self._approval_loop: asyncio.AbstractEventLoop | None = None
+        # list_approvals() may run on other threads; guards queue and wheel
+        self._approval_lock = threading.Lock()
+        self._expiry_task: asyncio.Task[None] | None = None
+        self._audit_log = AuditStore(
+            capacity=self.config.audit_max_entries,
+            archive=(
+                AuditArchive(self.config.audit_archive_path)
+                if self.config.audit_archive_path
+                else None
+            ),
+        )
+        self._audit_sink = audit_sink or self._create_audit_sink()
+        self._global_rate_limiter = (
+            TokenBucket.per_minute(self.config.max_global_actions_per_minute)
+            if self.config.max_global_actions_per_minute > 0
+            else None
+        )
+        self.rate_limit_stats = RateLimitStats()
+    
     def create_context(
         self,
         task_id: str,
@@ -114,6 +186,10 @@ class Harness:
     ) -> HarnessContext:
         """Create a new Harness context for a task."""
         context = HarnessContext(task_id=task_id, mode=mode)
+        if self.config.max_actions_per_minute > 0:
+            context.rate_limiter = TokenBucket.per_minute(
+                self.config.max_actions_per_minute
+            )
         self._contexts[task_id] = context
         self._log_audit("context_created", task_id=task_id, mode=mode.value)
         return context
@@ -158,6 +234,9 @@ class Harness:
         if context.tool_calls_count >= self.config.max_tool_calls_per_task:
             return False, "Tool call limit exceeded"
         
+        if not await self._acquire_rate_limit(context, action):
+            return False, "Rate limit exceeded"
+        
         # Mode-specific gating
         if context.mode == ExecutionMode.HUMAN_LED:
             # Always require approval in human-led mode
@@ -183,12 +262,64 @@ class Harness:
             case ConfidenceLevel.HUMAN_LED:
                 return await self._request_approval(context, action)
     
+    async def _acquire_rate_limit(
+        self,
+        context: HarnessContext,
+        action: HarnessAction,
+    ) -> bool:
+        """
+        Take a token from the task and global buckets.
+        
+        In "wait" mode, sleeps until both buckets have a token unless that
+        would exceed ``rate_limit_max_wait_seconds``; in "reject" mode,
+        fails immediately when either bucket is empty.
+        """
+        buckets = [
+            b for b in (context.rate_limiter, self._global_rate_limiter) if b
+        ]
+        if not buckets:
+            return True
+        
+        self.rate_limit_stats.checks += 1
+        waited = 0.0
+        while True:
+            wait = max(b.wait_time() for b in buckets)
+            if wait <= 0:
+                for bucket in buckets:
+                    bucket.try_acquire()
+                if waited:
+                    self.rate_limit_stats.record_wait(waited)
+                return True
+            
+            if (
+                self.config.rate_limit_mode == "reject"
+                or waited + wait > self.config.rate_limit_max_wait_seconds
+            ):
+                self.rate_limit_stats.rejections += 1
+                self._log_audit(
+                    "action_rate_limited",
+                    task_id=context.task_id,
+                    action_id=action.id,
+                    retry_after_seconds=round(wait, 3),
+                )
+                return False
+            
+            await asyncio.sleep(wait)
+            waited += wait
+    
     async def _request_approval(
         self,
         context: HarnessContext,
         action: HarnessAction,
     ) -> tuple[bool, str]:
-        """Request human approval for an action."""
+        """
+        Request human approval for an action and wait for the decision.
+        
+        Each pending approval is backed by an ``asyncio.Future`` that
+        ``approve()``/``reject()`` resolve, so the gated coroutine suspends
+        without polling and without blocking other tasks. Async handlers are
+        awaited; sync handlers run in a worker thread.
+        """
         approval_request = HumanApprovalRequest(
             id=str(uuid.uuid4()),
             task_id=context.task_id,
@@ -201,8 +332,17 @@ class Harness:
             ),
         )
         
-        self._pending_approvals[approval_request.id] = approval_request
         context.pending_approvals.append(approval_request.id)
+        with self._approval_lock:
+            self._pending_approvals.add(approval_request)
+            self._approval_expiry.schedule(
+                approval_request.id,
+                time.monotonic() + self.config.approval_timeout_seconds,
+            )
+        self._ensure_expiry_task()
+        self._approval_loop = asyncio.get_running_loop()
+        future: asyncio.Future[ApprovalDecision] = self._approval_loop.create_future()
+        self._approval_futures[approval_request.id] = future
         
         self._log_audit(
             "approval_requested",
@@ -211,40 +351,303 @@ class Harness:
             action_id=action.id,
         )
         
-        # If we have an approval handler, use it
-        if self._approval_handler:
-            try:
-                approved = self._approval_handler(approval_request)
-                if approved:
-                    return True, "Human approved"
-                else:
-                    return False, "Human rejected"
-            except Exception as e:
-                logger.error("Approval handler error", error=str(e))
-                return False, f"Approval handler error: {e}"
-        
-        # Otherwise, return pending status
-        return False, f"Awaiting approval: {approval_request.id}"
+        try:
+            # If we have an approval handler, let it decide or defer
+            if self._approval_handler:
+                try:
+                    approved = await self._call_approval_handler(approval_request)
+                except Exception as e:
+                    logger.error("Approval handler error", error=str(e))
+                    self._pop_pending_approval(approval_request.id)
+                    return False, f"Approval handler error: {e}"
+                
+                if approved is True:
+                    self.approve(approval_request.id)
+                elif approved is False:
+                    self.reject(approval_request.id, "Rejected by approval handler")
+            
+            # Wait for approve()/reject() to resolve the decision
+            return await future
+        finally:
+            self._approval_futures.pop(approval_request.id, None)
+    
+    async def _call_approval_handler(
+        self,
+        approval_request: HumanApprovalRequest,
+    ) -> bool | None:
+        """Invoke the approval handler without blocking the event loop."""
+        assert self._approval_handler is not None
+        if inspect.iscoroutinefunction(self._approval_handler):
+            decision = await self._approval_handler(approval_request)
+        else:
+            decision = await asyncio.to_thread(self._approval_handler, approval_request)
+            if inspect.isawaitable(decision):
+                decision = await decision
+        return None if decision is None else bool(decision)
     
     def approve(self, approval_id: str) -> bool:
-        """Approve a pending approval request."""
-        if approval_id in self._pending_approvals:
-            self._log_audit("approval_granted", approval_id=approval_id)
-            del self._pending_approvals[approval_id]
-            return True
-        return False
+        """
+        Approve a pending approval request.
+        
+        May be called from any thread: the decision is applied on the event
+        loop the gated action waits on, and a caller on another thread
+        blocks until it has been, raising ``TimeoutError`` if the loop
+        stalls.
+        """
+        return bool(self._on_approval_loop(
+            self._decide_approvals, [approval_id], approved=True
+        ))
     
     def reject(self, approval_id: str, reason: str = "") -> bool:
-        """Reject a pending approval request."""
-        if approval_id in self._pending_approvals:
+        """Reject a pending approval request. May be called from any thread."""
+        return bool(self._on_approval_loop(
+            self._decide_approvals, [approval_id], approved=False, reason=reason
+        ))
+    
+    def list_approvals(
+        self,
+        approval_filter: ApprovalFilter | str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> ApprovalPage:
+        """
+        List pending approvals, oldest first, one page at a time.
+        
+        Args:
+            approval_filter: An ``ApprovalFilter`` or a filter expression such
+                as ``"agent=security_analyst risk=high"``; None lists all.
+            limit: Maximum number of approvals per page.
+            cursor: ``next_cursor`` of the previous page.
+        """
+        approval_filter = _as_filter(approval_filter)
+        with self._approval_lock:
+            return self._pending_approvals.page(
+                approval_filter, limit=limit, cursor=cursor
+            )
+    
+    def approve_many(self, approval_filter: ApprovalFilter | str) -> list[str]:
+        """
+        Approve every pending approval matching the filter.
+        
+        Returns:
+            IDs of the approvals granted, oldest first.
+        
+        Raises:
+            ValueError: If the filter is malformed or empty; an empty filter
+                would match every pending approval.
+        """
+        return self._on_approval_loop(
+            lambda: self._decide_approvals(
+                self._select_approvals(approval_filter), approved=True
+            )
+        )
+    
+    def reject_many(
+        self,
+        approval_filter: ApprovalFilter | str,
+        reason: str = "",
+    ) -> list[str]:
+        """
+        Reject every pending approval matching the filter.
+        
+        Returns:
+            IDs of the approvals rejected, oldest first.
+        
+        Raises:
+            ValueError: If the filter is malformed or empty.
+        """
+        return self._on_approval_loop(
+            lambda: self._decide_approvals(
+                self._select_approvals(approval_filter), approved=False, reason=reason
+            )
+        )
+    
+    def _on_approval_loop(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``fn`` on the loop gated actions wait on.
+        
+        Approval state and the audit store are only mutated on that loop.
+        Called from another thread, this hands ``fn`` to the loop and waits
+        for its result; with no loop running it is called directly.
+        
+        Raises:
+            TimeoutError: If the loop does not get to ``fn`` in time, e.g.
+                because it is stopping; ``fn`` is then never run
+        """
+        loop = self._approval_loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            return fn(*args, **kwargs)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            return fn(*args, **kwargs)
+        
+        done: concurrent.futures.Future[T] = concurrent.futures.Future()
+        
+        def run() -> None:
+            # Skipped if the caller has already given up
+            if not done.set_running_or_notify_cancel():
+                return
+            try:
+                done.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                done.set_exception(e)
+        
+        try:
+            loop.call_soon_threadsafe(run)
+        except RuntimeError:  # closed between the check and the call
+            return fn(*args, **kwargs)
+        try:
+            return done.result(timeout=_LOOP_CALL_TIMEOUT_SECONDS)
+        except concurrent.futures.TimeoutError:
+            if not done.cancel():
+                # The loop started it just now; it finishes without awaiting
+                return done.result()
+            raise TimeoutError(
+                f"Event loop did not apply the decision within "
+                f"{_LOOP_CALL_TIMEOUT_SECONDS}s; it may be stopping"
+            ) from None
+    
+    def _select_approvals(self, approval_filter: ApprovalFilter | str) -> list[str]:
+        approval_filter = _as_filter(approval_filter)
+        if approval_filter is None or approval_filter.empty:
+            raise ValueError("Bulk approval decisions need a non-empty filter")
+        with self._approval_lock:
+            return self._pending_approvals.select(approval_filter)
+    
+    def _decide_approvals(
+        self,
+        approval_ids: list[str],
+        approved: bool,
+        reason: str = "",
+    ) -> list[str]:
+        """Resolve pending approvals in one pass with one batched audit write."""
+        if approved:
+            decision = (True, "Human approved")
+        else:
+            decision = (False, f"Human rejected: {reason}" if reason else "Human rejected")
+        timestamp = datetime.utcnow().isoformat()
+        entries: list[AuditEntry] = []
+        decided: list[str] = []
+        for approval_id in approval_ids:
+            request = self._pop_pending_approval(approval_id)
+            if request is None:
+                continue
+            entry: AuditEntry = {
+                "event": "approval_granted" if approved else "approval_rejected",
+                "timestamp": timestamp,
+                "task_id": request.task_id,
+                "approval_id": approval_id,
+            }
+            if not approved:
+                entry["reason"] = reason
+            entries.append(entry)
+            decided.append(approval_id)
+            self._settle_approval(approval_id, decision)
+        self._log_audit_many(entries)
+        return decided
+    
+    def expire_approvals(self, now: float | None = None) -> list[str]:
+        """
+        Apply the expiry policy to approvals whose deadline has passed.
+        
+        Deadlines live in a timing wheel on the ``time.monotonic`` clock, so
+        each call only visits the wheel slots that elapsed since the last one,
+        however many approvals are pending. Runs automatically once per tick
+        while approvals are pending; ``now`` overrides the clock.
+        
+        Returns:
+            IDs of the approvals that expired (rejected or escalated).
+        """
+        with self._approval_lock:
+            expired = self._approval_expiry.advance(now)
+        for approval_id in expired:
+            request = self._pending_approvals.get(approval_id)
+            if request is None:
+                continue
+            escalations = self._approval_escalations.get(approval_id, 0)
+            if (
+                self.config.approval_expiry_policy == "escalate"
+                and escalations < self.config.approval_max_escalations
+            ):
+                self._escalate_approval(request, escalations + 1, now)
+                continue
+            self._pop_pending_approval(approval_id)
             self._log_audit(
-                "approval_rejected",
+                "approval_expired",
+                task_id=request.task_id,
                 approval_id=approval_id,
-                reason=reason,
+                escalations=escalations,
             )
-            del self._pending_approvals[approval_id]
-            return True
-        return False
+            self._settle_approval(approval_id, (False, "Approval expired"))
+        return expired
+    
+    def _escalate_approval(
+        self,
+        request: HumanApprovalRequest,
+        level: int,
+        now: float | None,
+    ) -> None:
+        """Extend an expired approval by another timeout and record it."""
+        timeout = self.config.approval_timeout_seconds
+        self._approval_escalations[request.id] = level
+        with self._approval_lock:
+            self._pending_approvals.update_expiry(
+                request.id, datetime.utcnow() + timedelta(seconds=timeout)
+            )
+            self._approval_expiry.schedule(
+                request.id,
+                (time.monotonic() if now is None else now) + timeout,
+            )
+        self._log_audit(
+            "approval_escalated",
+            task_id=request.task_id,
+            approval_id=request.id,
+            escalation_level=level,
+        )
+        logger.warning(
+            "Approval escalated after expiry",
+            approval_id=request.id,
+            task_id=request.task_id,
+            escalation_level=level,
+        )
+    
+    def _ensure_expiry_task(self) -> None:
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.get_running_loop().create_task(
+                self._run_approval_expiry()
+            )
+    
+    async def _run_approval_expiry(self) -> None:
+        """Tick the expiry wheel while any approval is pending."""
+        while len(self._approval_expiry):
+            await asyncio.sleep(self.config.approval_expiry_tick_seconds)
+            self.expire_approvals()
+    
+    def _pop_pending_approval(self, approval_id: str) -> HumanApprovalRequest | None:
+        with self._approval_lock:
+            request = self._pending_approvals.pop(approval_id)
+            if request is not None:
+                self._approval_expiry.cancel(approval_id)
+                self._approval_escalations.pop(approval_id, None)
+        return request
+    
+    def _settle_approval(self, approval_id: str, decision: ApprovalDecision) -> None:
+        """Resolve the future a gated coroutine is waiting on, from any thread."""
+        future = self._approval_futures.get(approval_id)
+        if future is None or future.done():
+            return
+        loop = future.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            future.set_result(decision)
+        else:
+            loop.call_soon_threadsafe(_set_result_if_pending, future, decision)
     
     def record_action(
         self,
@@ -279,23 +682,79 @@ class Harness:
             **kwargs,
         }
         self._audit_log.append(entry)
-        logger.info(event, **kwargs)
+        self._audit_sink.emit(entry)
+    
+    def _log_audit_many(self, entries: list[AuditEntry]) -> None:
+        """Log several audit entries as one batch."""
+        if entries:
+            self._audit_log.extend(entries)
+            self._audit_sink.emit_many(entries)
+    
+    def _create_audit_sink(self) -> AuditSink:
+        """Build the audit sink described by the configuration."""
+        if not self.config.audit_segment_dir:
+            return LoggingAuditSink()
+        return BatchedAuditSink(
+            SegmentedFileWriter(
+                self.config.audit_segment_dir,
+                max_segment_bytes=self.config.audit_segment_max_bytes,
+                fsync_mode=self.config.audit_fsync_mode,
+                fsync_interval_seconds=self.config.audit_fsync_interval_seconds,
+            ),
+            max_batch=self.config.audit_batch_size,
+        )
+    
+    def flush_audit(self, timeout: float | None = None) -> bool:
+        """Wait for queued audit entries to reach the sink's storage."""
+        self._audit_log.flush()
+        return self._audit_sink.flush(timeout)
+    
+    def close(self) -> None:
+        """Flush audit storage and stop any background writer."""
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+        self._audit_log.flush()
+        self._audit_sink.close()
     
     def get_audit_log(
         self,
         task_id: str | None = None,
-    ) -> list[dict[str, Any]]:
-        """Get audit log entries, optionally filtered by task."""
-        if task_id:
-            return [e for e in self._audit_log if e.get("task_id") == task_id]
-        return self._audit_log.copy()
+        event: str | None = None,
+        include_archived: bool = False,
+    ) -> list[AuditEntry]:
+        """
+        Get audit log entries, optionally filtered by task and event type.
+        
+        Lookups by task or event use secondary indexes, so their cost is
+        proportional to the number of matching entries.
+        """
+        return self._audit_log.query(
+            task_id=task_id or None,
+            event=event,
+            include_archived=include_archived,
+        )
     
     def cleanup_context(self, task_id: str) -> None:
         """Clean up resources for a completed task."""
         if task_id in self._contexts:
             context = self._contexts[task_id]
-            # Clean up any pending approvals
+            # Clean up any pending approvals, releasing anything awaiting them
             for approval_id in context.pending_approvals:
-                self._pending_approvals.pop(approval_id, None)
+                if self._pop_pending_approval(approval_id) is not None:
+                    self._settle_approval(approval_id, (False, "Task cleaned up"))
             del self._contexts[task_id]
             self._log_audit("context_cleaned_up", task_id=task_id)
+
+
+def _as_filter(approval_filter: ApprovalFilter | str | None) -> ApprovalFilter | None:
+    if isinstance(approval_filter, str):
+        return ApprovalFilter.parse(approval_filter)
+    return approval_filter
+
+
+def _set_result_if_pending(
+    future: asyncio.Future[ApprovalDecision],
+    decision: ApprovalDecision,
+) -> None:
+    if not future.done():
+        future.set_result(decision)
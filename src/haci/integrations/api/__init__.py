@@ -0,0 +1,22 @@
+"""Clients for external HTTP APIs, including pooled LLM provider clients."""
+
+from haci.integrations.api.cache import CacheStats, ResponseCache
+from haci.integrations.api.llm import (
+    LLMClientPool,
+    LLMProviderError,
+    LLMRequest,
+    LLMResponse,
+    LLMStream,
+    ProviderClient,
+)
+
+__all__ = [
+    "CacheStats",
+    "LLMClientPool",
+    "LLMProviderError",
+    "LLMRequest",
+    "LLMResponse",
+    "LLMStream",
+    "ProviderClient",
+    "ResponseCache",
+]
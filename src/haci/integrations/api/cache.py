@@ -0,0 +1,348 @@
+"""
+Exact-match cache of LLM responses.
+
+Incident tickets repeat. Re-fired alerts and duplicate reports send agents
+the same prompt again, and the swarm modes often put the same question to
+several agents at once. ``ResponseCache`` answers those repeats without a
+provider call.
+
+The key is a SHA-256 of the model, the canonicalized prompt (system text
+and messages, Unicode-normalized with runs of whitespace collapsed), the
+temperature and ``max_tokens``. Only near-deterministic requests are
+cached: anything sampled hotter than ``max_temperature`` (0.1 by default,
+the agents' default temperature) bypasses the cache, since a stored answer
+would hide the variation the caller asked for.
+
+Entries live in an in-memory LRU bounded by bytes. With ``disk_path`` set
+they are also written through to SQLite, bounded by ``disk_max_bytes``, so
+a restarted process and other processes sharing the file start warm. The
+disk tier evicts least recently *promoted* rows first: hits served from
+memory do not touch the disk. Concurrent misses for the same key share a
+single provider call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+
+if TYPE_CHECKING:
+    from haci.config import ResponseCacheConfig
+
+# Rows removed per statement when the disk tier is over budget
+_DISK_EVICT_BATCH = 64
+
+
+@dataclass
+class CacheStats:
+    """Lookup counts for one label (an agent type)."""
+    
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def record(self, outcome: str) -> None:
+        if outcome == "hit":
+            self.hits += 1
+        elif outcome == "miss":
+            self.misses += 1
+        else:
+            self.bypassed += 1
+    
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def _canonical(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class ResponseCache:
+    """
+    Two-tier (memory, then optional SQLite) exact-match LLM response cache.
+    
+    Use ``get_or_call`` around provider calls; ``get`` and ``put`` are the
+    underlying lookups. Each lookup is attributed to a label so hit rates
+    can be reported per agent type.
+    """
+    
+    def __init__(
+        self,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        disk_path: str | None = None,
+        disk_max_bytes: int = 1024 * 1024 * 1024,
+        ttl_seconds: float = 86_400,
+        max_temperature: float = 0.1,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_temperature = max_temperature
+        self._clock = clock
+        # key -> (stored_at, response, size), least recently used first
+        self._entries: OrderedDict[str, tuple[float, LLMResponse, int]] = OrderedDict()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._stats: dict[str, CacheStats] = {}
+        self._inflight: dict[str, asyncio.Future[LLMResponse]] = {}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if disk_path:
+            self._conn = sqlite3.connect(disk_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_response_cache "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, size INTEGER NOT NULL, "
+                "response TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_response_cache_accessed "
+                "ON llm_response_cache (accessed_at)"
+            )
+            self._conn.commit()
+            self.disk_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM llm_response_cache"
+            ).fetchone()[0]
+    
+    @classmethod
+    def from_config(cls, config: ResponseCacheConfig) -> ResponseCache:
+        return cls(
+            memory_max_bytes=config.memory_max_bytes,
+            disk_path=config.disk_path,
+            disk_max_bytes=config.disk_max_bytes,
+            ttl_seconds=config.ttl_seconds,
+            max_temperature=config.max_temperature,
+        )
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def make_key(request: LLMRequest) -> str:
+        """Hash of the model, canonical prompt, temperature and max_tokens."""
+        canonical = json.dumps(
+            [
+                request.model,
+                _canonical(request.system or ""),
+                [[m["role"], _canonical(m["content"])] for m in request.messages],
+                round(request.temperature, 6),
+                request.max_tokens,
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    def cacheable(self, request: LLMRequest) -> bool:
+        """Whether the request is deterministic enough to serve from cache."""
+        return request.temperature <= self.max_temperature
+    
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-label lookup counts and hit rates."""
+        return {label: s.snapshot() for label, s in sorted(self._stats.items())}
+    
+    async def get_or_call(
+        self,
+        request: LLMRequest,
+        call: Callable[[], Awaitable[LLMResponse]],
+        label: str = "default",
+    ) -> tuple[LLMResponse, str]:
+        """
+        Return a cached response, or make the call and cache its result.
+        
+        Concurrent misses for the same key wait for the first caller's
+        call instead of making their own, and count as hits.
+        
+        Returns:
+            The response and the lookup outcome: ``"hit"``, ``"miss"`` or
+            ``"bypass"`` (not cacheable; the call was made uncached)
+        """
+        stats = self._stats.setdefault(label, CacheStats())
+        if not self.cacheable(request):
+            stats.record("bypass")
+            return await call(), "bypass"
+        
+        key = self.make_key(request)
+        while True:
+            cached = await self._lookup(key)
+            if cached is not None:
+                stats.record("hit")
+                return cached, "hit"
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                response = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    continue  # the leading caller was cancelled; try again
+                raise
+            stats.record("hit")
+            return dataclasses.replace(response, cached=True), "hit"
+        
+        stats.record("miss")
+        future: asyncio.Future[LLMResponse] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await call()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # mark retrieved when nobody was waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(response)
+        await self._store(key, response)
+        return response, "miss"
+    
+    async def get(self, request: LLMRequest) -> LLMResponse | None:
+        """Return a cached response for the request, or None."""
+        if not self.cacheable(request):
+            return None
+        return await self._lookup(self.make_key(request))
+    
+    async def put(self, request: LLMRequest, response: LLMResponse) -> None:
+        """Cache a response; requests that are not cacheable are ignored."""
+        if self.cacheable(request):
+            await self._store(self.make_key(request), response)
+    
+    def clear(self) -> None:
+        """Drop all entries, including those on disk."""
+        self._entries.clear()
+        self.memory_bytes = 0
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM llm_response_cache")
+            self.disk_bytes = 0
+    
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+    
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and self._clock() - stored_at > self.ttl_seconds
+    
+    async def _lookup(self, key: str) -> LLMResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not self._expired(entry[0]):
+                self._entries.move_to_end(key)
+                return dataclasses.replace(entry[1], cached=True)
+            self._drop_memory(key)
+        if self._conn is None:
+            return None
+        
+        row = await asyncio.to_thread(self._disk_read, key)
+        if row is None:
+            return None
+        stored_at, payload = row
+        response = LLMResponse(**json.loads(payload))
+        self._remember(key, stored_at, response, len(payload.encode()))
+        return dataclasses.replace(response, cached=True)
+    
+    async def _store(self, key: str, response: LLMResponse) -> None:
+        payload = json.dumps(dataclasses.asdict(dataclasses.replace(response, cached=False)))
+        size = len(payload.encode())
+        stored_at = self._clock()
+        self._remember(key, stored_at, response, size)
+        if self._conn is not None and size <= self.disk_max_bytes:
+            await asyncio.to_thread(self._disk_write, key, stored_at, size, payload)
+    
+    def _remember(self, key: str, stored_at: float, response: LLMResponse, size: int) -> None:
+        if size > self.memory_max_bytes:
+            return
+        self._drop_memory(key)
+        self._entries[key] = (stored_at, response, size)
+        self.memory_bytes += size
+        while self.memory_bytes > self.memory_max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.memory_bytes -= evicted
+    
+    def _drop_memory(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.memory_bytes -= entry[2]
+    
+    def _disk_read(self, key: str) -> tuple[float, str] | None:
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT stored_at, response FROM llm_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                if self._expired(row[0]):
+                    self._disk_delete(key)
+                    return None
+                self._conn.execute(
+                    "UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?",
+                    (self._clock(), key),
+                )
+            return row
+    
+    def _disk_write(self, key: str, stored_at: float, size: int, payload: str) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._disk_delete(key)
+                self._conn.execute(
+                    "INSERT INTO llm_response_cache VALUES (?, ?, ?, ?, ?)",
+                    (key, stored_at, stored_at, size, payload),
+                )
+                self.disk_bytes += size
+                while self.disk_bytes > self.disk_max_bytes:
+                    victims = self._conn.execute(
+                        "SELECT key, size FROM llm_response_cache "
+                        "ORDER BY accessed_at LIMIT ?",
+                        (_DISK_EVICT_BATCH,),
+                    ).fetchall()
+                    for victim, victim_size in victims:
+                        if self.disk_bytes <= self.disk_max_bytes:
+                            break
+                        self._conn.execute(
+                            "DELETE FROM llm_response_cache WHERE key = ?", (victim,)
+                        )
+                        self.disk_bytes -= victim_size
+    
+    def _disk_delete(self, key: str) -> None:
+        # Caller holds the lock
+        assert self._conn is not None
+        row = self._conn.execute(
+            "SELECT size FROM llm_response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+            self.disk_bytes -= row[0]
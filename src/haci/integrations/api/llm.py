@@ -0,0 +1,587 @@
+"""
+Pooled async clients for LLM provider APIs.
+
+Each provider gets one long-lived ``httpx.AsyncClient``. It keeps
+connections alive between calls and uses HTTP/2 when ``h2`` is installed,
+so concurrent agent calls share a few connections instead of each opening
+its own. A per-provider semaphore caps requests in flight; callers beyond
+the cap wait for a slot. Every call is timed, and token usage reported by
+the provider is accumulated per provider and per model.
+
+Providers differ only in wire format, which is handled by a small
+``ProviderAdapter`` per API family (Anthropic Messages, OpenAI Chat
+Completions). Anything speaking one of those formats, including a local
+stub server, can be used by pointing ``base_url`` at it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+import httpx
+import structlog
+
+from haci.shared.latency import LatencyHistogram
+
+if TYPE_CHECKING:
+    from haci.config import AgentConfig, HACIConfig, LLMProviderConfig
+
+logger = structlog.get_logger()
+
+DEFAULT_BASE_URLS: dict[str, str] = {
+    "anthropic": "https://api.anthropic.com",
+    "openai": "https://api.openai.com",
+}
+
+# Model-name prefixes used to route a request when no provider is named
+MODEL_PREFIXES: dict[str, tuple[str, ...]] = {
+    "anthropic": ("claude",),
+    "openai": ("gpt", "o1", "o3", "o4"),
+}
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class LLMProviderError(RuntimeError):
+    """Raised when a provider call fails or returns an error status."""
+    
+    def __init__(self, provider: str, message: str, status_code: int | None = None) -> None:
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.status_code = status_code
+
+
+@dataclass
+class LLMRequest:
+    """A provider-agnostic chat completion request."""
+    
+    model: str
+    messages: list[dict[str, str]]
+    max_tokens: int = 1024
+    temperature: float = 0.0
+    system: str | None = None
+    
+    @classmethod
+    def from_agent_config(
+        cls,
+        config: AgentConfig,
+        prompt: str,
+        system: str | None = None,
+    ) -> LLMRequest:
+        """Build a single-turn request using an agent's model settings."""
+        return cls(
+            model=config.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=config.max_tokens,
+            temperature=config.temperature,
+            system=system,
+        )
+
+
+@dataclass
+class LLMResponse:
+    """A completed response with its accounting."""
+    
+    provider: str
+    model: str
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    stop_reason: str | None = None
+    latency_ms: float = 0.0
+    time_to_first_token_ms: float | None = None
+    cached: bool = False
+
+
+@dataclass
+class ProviderStats:
+    """Running counters for one provider."""
+    
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tokens_by_model: dict[str, tuple[int, int]] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    time_to_first_token: LatencyHistogram = field(default_factory=LatencyHistogram)
+    
+    def record(self, response: LLMResponse) -> None:
+        self.input_tokens += response.input_tokens
+        self.output_tokens += response.output_tokens
+        prev_in, prev_out = self.tokens_by_model.get(response.model, (0, 0))
+        self.tokens_by_model[response.model] = (
+            prev_in + response.input_tokens,
+            prev_out + response.output_tokens,
+        )
+        self.latency.observe(response.latency_ms)
+        if response.time_to_first_token_ms is not None:
+            self.time_to_first_token.observe(response.time_to_first_token_ms)
+    
+    def snapshot(self) -> dict[str, Any]:
+        """Summary suitable for metrics export."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "tokens_by_model": {
+                model: {"input": i, "output": o}
+                for model, (i, o) in self.tokens_by_model.items()
+            },
+            "latency": self.latency.snapshot(),
+            "time_to_first_token": self.time_to_first_token.snapshot(),
+        }
+
+
+@dataclass
+class _StreamState:
+    text: list[str] = field(default_factory=list)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    stop_reason: str | None = None
+
+
+class ProviderAdapter(ABC):
+    """Wire format of one API family."""
+    
+    kind: str
+    path: str
+    
+    @abstractmethod
+    def headers(self, api_key: str) -> dict[str, str]:
+        """Authentication and version headers."""
+    
+    @abstractmethod
+    def payload(self, request: LLMRequest, stream: bool) -> dict[str, Any]:
+        """Request body."""
+    
+    @abstractmethod
+    def parse(self, data: dict[str, Any]) -> _StreamState:
+        """Parse a complete (non-streaming) response body."""
+    
+    @abstractmethod
+    def parse_event(self, data: dict[str, Any], state: _StreamState) -> str | None:
+        """Fold one streamed event into ``state``; return its text delta, if any."""
+
+
+class AnthropicAdapter(ProviderAdapter):
+    """Anthropic Messages API."""
+    
+    kind = "anthropic"
+    path = "/v1/messages"
+    
+    def headers(self, api_key: str) -> dict[str, str]:
+        return {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+    
+    def payload(self, request: LLMRequest, stream: bool) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            "model": request.model,
+            "messages": request.messages,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+        }
+        if request.system:
+            body["system"] = request.system
+        if stream:
+            body["stream"] = True
+        return body
+    
+    def parse(self, data: dict[str, Any]) -> _StreamState:
+        usage = data.get("usage", {})
+        return _StreamState(
+            text=[b.get("text", "") for b in data.get("content", []) if b.get("type") == "text"],
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            stop_reason=data.get("stop_reason"),
+        )
+    
+    def parse_event(self, data: dict[str, Any], state: _StreamState) -> str | None:
+        kind = data.get("type")
+        if kind == "content_block_delta":
+            delta = data.get("delta", {})
+            if delta.get("type") == "text_delta":
+                return delta.get("text", "")
+        elif kind == "message_start":
+            usage = data.get("message", {}).get("usage", {})
+            state.input_tokens = usage.get("input_tokens", 0)
+            state.output_tokens = usage.get("output_tokens", 0)
+        elif kind == "message_delta":
+            state.output_tokens = data.get("usage", {}).get("output_tokens", state.output_tokens)
+            state.stop_reason = data.get("delta", {}).get("stop_reason", state.stop_reason)
+        elif kind == "error":
+            raise ValueError(data.get("error", {}).get("message", "stream error"))
+        return None
+
+
+class OpenAIAdapter(ProviderAdapter):
+    """OpenAI Chat Completions API."""
+    
+    kind = "openai"
+    path = "/v1/chat/completions"
+    
+    def headers(self, api_key: str) -> dict[str, str]:
+        return {"authorization": f"Bearer {api_key}"}
+    
+    def payload(self, request: LLMRequest, stream: bool) -> dict[str, Any]:
+        messages = request.messages
+        if request.system:
+            messages = [{"role": "system", "content": request.system}, *messages]
+        body: dict[str, Any] = {
+            "model": request.model,
+            "messages": messages,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+        }
+        if stream:
+            body["stream"] = True
+            body["stream_options"] = {"include_usage": True}
+        return body
+    
+    def parse(self, data: dict[str, Any]) -> _StreamState:
+        usage = data.get("usage") or {}
+        choices = data.get("choices") or [{}]
+        return _StreamState(
+            text=[choices[0].get("message", {}).get("content") or ""],
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            stop_reason=choices[0].get("finish_reason"),
+        )
+    
+    def parse_event(self, data: dict[str, Any], state: _StreamState) -> str | None:
+        usage = data.get("usage")
+        if usage:
+            state.input_tokens = usage.get("prompt_tokens", 0)
+            state.output_tokens = usage.get("completion_tokens", 0)
+        choices = data.get("choices") or []
+        if not choices:
+            return None
+        if choices[0].get("finish_reason"):
+            state.stop_reason = choices[0]["finish_reason"]
+        return choices[0].get("delta", {}).get("content")
+
+
+ADAPTERS: dict[str, type[ProviderAdapter]] = {
+    "anthropic": AnthropicAdapter,
+    "openai": OpenAIAdapter,
+}
+
+
+class ProviderClient:
+    """
+    Pooled, concurrency-capped client for one provider.
+    
+    The underlying ``httpx.AsyncClient`` is created on first use and reused
+    until ``close()``.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        adapter: ProviderAdapter,
+        base_url: str,
+        api_key: str = "",
+        max_concurrency: int = 16,
+        max_connections: int = 32,
+        keepalive_seconds: float = 30.0,
+        timeout_seconds: float = 120.0,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.name = name
+        self.adapter = adapter
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        if http2 and not _HTTP2_AVAILABLE:
+            logger.debug("llm_http2_unavailable", provider=name)
+        self._api_key = api_key
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_seconds,
+        )
+        self._timeout = httpx.Timeout(timeout_seconds, connect=min(10.0, timeout_seconds))
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self.stats = ProviderStats()
+    
+    @classmethod
+    def from_config(
+        cls,
+        config: LLMProviderConfig,
+        api_key: str = "",
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> ProviderClient:
+        """Build a client from provider configuration."""
+        kind = config.kind or config.name
+        if kind not in ADAPTERS:
+            raise ValueError(f"Unknown LLM provider kind: {kind!r}")
+        base_url = config.base_url or DEFAULT_BASE_URLS[kind]
+        return cls(
+            name=config.name,
+            adapter=ADAPTERS[kind](),
+            base_url=base_url,
+            api_key=config.api_key or api_key,
+            max_concurrency=config.max_concurrency,
+            max_connections=config.max_connections,
+            keepalive_seconds=config.keepalive_seconds,
+            timeout_seconds=config.timeout_seconds,
+            http2=config.http2,
+            transport=transport,
+        )
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.adapter.headers(self._api_key),
+                limits=self._limits,
+                timeout=self._timeout,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._client
+    
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """Send a request and return the whole response."""
+        async with self._slot():
+            start = time.perf_counter()
+            try:
+                response = await self.client.post(
+                    self.adapter.path, json=self.adapter.payload(request, stream=False)
+                )
+                if response.status_code >= 400:
+                    raise _status_error(self.name, response.status_code, response.text)
+                state = self.adapter.parse(response.json())
+            except LLMProviderError:
+                self.stats.errors += 1
+                raise
+            except (httpx.HTTPError, ValueError) as e:
+                self.stats.errors += 1
+                raise LLMProviderError(self.name, str(e) or type(e).__name__) from e
+            result = LLMResponse(
+                provider=self.name,
+                model=request.model,
+                text="".join(state.text),
+                input_tokens=state.input_tokens,
+                output_tokens=state.output_tokens,
+                stop_reason=state.stop_reason,
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+            self.stats.record(result)
+            return result
+    
+    def stream(self, request: LLMRequest) -> LLMStream:
+        """
+        Stream a response as text deltas.
+        
+        Use as ``async with client.stream(req) as stream: async for delta in
+        stream: ...``; ``stream.response`` holds the totals afterwards. The
+        concurrency slot is held until the block exits.
+        """
+        return LLMStream(self, request)
+    
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _slot(self) -> _Slot:
+        return _Slot(self)
+
+
+class _Slot:
+    """Concurrency slot of a provider, tracked in its stats."""
+    
+    def __init__(self, provider: ProviderClient) -> None:
+        self._provider = provider
+    
+    async def __aenter__(self) -> None:
+        stats = self._provider.stats
+        stats.waiting += 1
+        try:
+            await self._provider._slots.acquire()
+        finally:
+            stats.waiting -= 1
+        stats.in_flight += 1
+        stats.requests += 1
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._provider.stats.in_flight -= 1
+        self._provider._slots.release()
+
+
+class LLMStream:
+    """A streaming response; iterate for text deltas."""
+    
+    def __init__(self, provider: ProviderClient, request: LLMRequest) -> None:
+        self._provider = provider
+        self._request = request
+        self._slot = provider._slot()
+        self._response: httpx.Response | None = None
+        self._state = _StreamState()
+        self._start = 0.0
+        self._first_token_ms: float | None = None
+        self.response: LLMResponse | None = None
+    
+    async def __aenter__(self) -> LLMStream:
+        provider = self._provider
+        await self._slot.__aenter__()
+        self._start = time.perf_counter()
+        try:
+            http_request = provider.client.build_request(
+                "POST",
+                provider.adapter.path,
+                json=provider.adapter.payload(self._request, stream=True),
+            )
+            self._response = await provider.client.send(http_request, stream=True)
+            if self._response.status_code >= 400:
+                body = (await self._response.aread()).decode(errors="replace")
+                raise _status_error(provider.name, self._response.status_code, body)
+        except httpx.HTTPError as e:
+            await self._abort()
+            raise LLMProviderError(provider.name, str(e) or type(e).__name__) from e
+        except BaseException:
+            await self._abort()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        try:
+            if self._response is not None:
+                await self._response.aclose()
+        finally:
+            if exc is not None:
+                self._provider.stats.errors += 1
+            await self._slot.__aexit__(exc_type, exc, tb)
+    
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._deltas()
+    
+    async def text(self) -> str:
+        """Consume the rest of the stream and return the full text."""
+        async for _ in self:
+            pass
+        return "".join(self._state.text)
+    
+    async def _deltas(self) -> AsyncIterator[str]:
+        assert self._response is not None, "use LLMStream inside 'async with'"
+        adapter = self._provider.adapter
+        try:
+            async for line in self._response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                delta = adapter.parse_event(json.loads(data), self._state)
+                if delta:
+                    if self._first_token_ms is None:
+                        self._first_token_ms = (time.perf_counter() - self._start) * 1000
+                    self._state.text.append(delta)
+                    yield delta
+        except (httpx.HTTPError, ValueError) as e:
+            raise LLMProviderError(self._provider.name, str(e) or type(e).__name__) from e
+        self.response = LLMResponse(
+            provider=self._provider.name,
+            model=self._request.model,
+            text="".join(self._state.text),
+            input_tokens=self._state.input_tokens,
+            output_tokens=self._state.output_tokens,
+            stop_reason=self._state.stop_reason,
+            latency_ms=(time.perf_counter() - self._start) * 1000,
+            time_to_first_token_ms=self._first_token_ms,
+        )
+        self._provider.stats.record(self.response)
+    
+    async def _abort(self) -> None:
+        # __aexit__ is not called when __aenter__ fails
+        self._provider.stats.errors += 1
+        try:
+            if self._response is not None:
+                await self._response.aclose()
+        finally:
+            await self._slot.__aexit__(None, None, None)
+
+
+class LLMClientPool:
+    """
+    One pooled ``ProviderClient`` per enabled LLM provider.
+    
+    Requests are routed by explicit provider name or by model-name prefix
+    (``claude-*`` to Anthropic, ``gpt-*`` to OpenAI).
+    """
+    
+    def __init__(
+        self,
+        config: HACIConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        keys = {"anthropic": config.anthropic_api_key, "openai": config.openai_api_key}
+        self.providers: dict[str, ProviderClient] = {}
+        for provider_config in config.integrations.llm_providers:
+            if not provider_config.enabled:
+                continue
+            kind = provider_config.kind or provider_config.name
+            self.providers[provider_config.name] = ProviderClient.from_config(
+                provider_config, api_key=keys.get(kind, ""), transport=transport
+            )
+    
+    def provider_for(self, model: str, provider: str | None = None) -> ProviderClient:
+        """
+        Return the client for a provider name, or the one serving ``model``.
+        
+        Raises:
+            LLMProviderError: If no enabled provider matches.
+        """
+        if provider is not None:
+            client = self.providers.get(provider)
+            if client is None:
+                raise LLMProviderError(provider, "provider not configured or disabled")
+            return client
+        for client in self.providers.values():
+            if model.startswith(MODEL_PREFIXES.get(client.adapter.kind, ())):
+                return client
+        raise LLMProviderError(model, "no configured provider serves this model")
+    
+    async def complete(self, request: LLMRequest, provider: str | None = None) -> LLMResponse:
+        """Send a request to its provider and return the whole response."""
+        return await self.provider_for(request.model, provider).complete(request)
+    
+    def stream(self, request: LLMRequest, provider: str | None = None) -> LLMStream:
+        """Stream a response from its provider; see ``ProviderClient.stream``."""
+        return self.provider_for(request.model, provider).stream(request)
+    
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-provider request, token and latency statistics."""
+        return {name: client.stats.snapshot() for name, client in self.providers.items()}
+    
+    async def close(self) -> None:
+        """Close every provider's connections."""
+        await asyncio.gather(*(client.close() for client in self.providers.values()))
+
+
+def _status_error(provider: str, status_code: int, body: str) -> LLMProviderError:
+    message = body[:500]
+    try:
+        data = json.loads(body)
+        error = data.get("error")
+        if isinstance(error, dict):
+            message = error.get("message", message)
+    except ValueError:
+        pass
+    return LLMProviderError(provider, f"HTTP {status_code}: {message}", status_code)
@@ -0,0 +1,19 @@
+"""Pooled client sessions for MCP (Model Context Protocol) servers."""
+
+from haci.integrations.mcp.client import (
+    MCPClientManager,
+    MCPError,
+    MCPServerPool,
+    MCPSession,
+    MCPTimeoutError,
+    ToolResult,
+)
+
+__all__ = [
+    "MCPClientManager",
+    "MCPError",
+    "MCPServerPool",
+    "MCPSession",
+    "MCPTimeoutError",
+    "ToolResult",
+]
@@ -0,0 +1,610 @@
+"""
+Pooled client sessions for MCP servers.
+
+Agents call tools on MCP servers (Jira, GitHub, Slack, ...) many times per
+task. Setting up an MCP session costs an ``initialize`` round trip and an
+``initialized`` notification, so ``MCPServerPool`` keeps a few sessions
+per server open and reuses them.
+
+Sessions speak the Streamable HTTP transport: JSON-RPC requests POSTed to
+the server URL, answered with JSON or a short event stream. Each session
+carries many requests in flight at once. A call goes to the least loaded
+healthy session. When every session is at ``max_in_flight_per_session``,
+callers wait for a free slot. All sessions of a server share one
+keep-alive ``httpx.AsyncClient``, which uses HTTP/2 when ``h2`` is
+installed.
+
+Each call, including any wait for a slot, is bounded by the server's
+``timeout_seconds``. A call that times out or is cancelled is reported to
+the server with ``notifications/cancelled``. A background task pings idle
+sessions every ``health_check_seconds``. It replaces sessions that fail
+the ping or that the server has expired (HTTP 404), so the pool stays warm.
+Tool-call latencies are recorded per server and per tool in
+``LatencyHistogram`` buckets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import itertools
+import json
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import structlog
+
+from haci import __version__
+from haci.shared.latency import LatencyHistogram
+
+if TYPE_CHECKING:
+    from haci.config import HACIConfig, MCPServerConfig
+
+logger = structlog.get_logger()
+
+PROTOCOL_VERSION = "2025-03-26"
+CLIENT_INFO = {"name": "haci", "version": __version__}
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class MCPError(Exception):
+    """An MCP server could not be reached or returned an error."""
+    
+    def __init__(self, server: str, message: str, code: int | None = None) -> None:
+        super().__init__(f"{server}: {message}")
+        self.server = server
+        self.code = code
+
+
+class MCPTimeoutError(MCPError):
+    """A call did not complete within the server's ``timeout_seconds``."""
+
+
+class _SessionExpired(MCPError):
+    """The server no longer knows the session (HTTP 404)."""
+
+
+@dataclass
+class ToolResult:
+    """Result of one ``tools/call``."""
+    
+    server: str
+    tool: str
+    content: list[dict[str, Any]]
+    is_error: bool = False
+    structured: dict[str, Any] | None = None
+    latency_ms: float = 0.0
+    
+    @property
+    def text(self) -> str:
+        """Concatenated text content items."""
+        return "".join(item.get("text", "") for item in self.content if item.get("type") == "text")
+
+
+@dataclass
+class MCPServerStats:
+    """Call counts and latency distributions for one server."""
+    
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    sessions_opened: int = 0
+    sessions_replaced: int = 0
+    health_checks: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    tools: dict[str, LatencyHistogram] = field(default_factory=dict)
+    
+    def observe(self, tool: str, latency_ms: float) -> None:
+        self.latency.observe(latency_ms)
+        self.tools.setdefault(tool, LatencyHistogram()).observe(latency_ms)
+    
+    def snapshot(self) -> dict[str, Any]:
+        """Summary suitable for metrics export."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "sessions_opened": self.sessions_opened,
+            "sessions_replaced": self.sessions_replaced,
+            "health_checks": self.health_checks,
+            "latency": self.latency.snapshot(),
+            "tools": {tool: h.snapshot() for tool, h in sorted(self.tools.items())},
+        }
+
+
+class MCPSession:
+    """One initialized MCP session; carries many requests at once."""
+    
+    def __init__(self, pool: MCPServerPool) -> None:
+        self._pool = pool
+        self.session_id: str | None = None
+        self.protocol_version: str | None = None
+        self.server_info: dict[str, Any] = {}
+        self.in_flight = 0
+        self.healthy = False
+        self.last_ok = 0.0
+    
+    async def open(self) -> None:
+        """Run the initialize handshake."""
+        result = await self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": CLIENT_INFO,
+        })
+        self.protocol_version = result.get("protocolVersion", PROTOCOL_VERSION)
+        self.server_info = result.get("serverInfo", {})
+        await self.notify("notifications/initialized")
+        self.healthy = True
+    
+    async def request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Send a JSON-RPC request and return its result.
+        
+        Raises:
+            MCPError: On transport failures and JSON-RPC errors.
+        """
+        pool = self._pool
+        request_id = next(pool._ids)
+        message: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            response = await pool.client.post(pool.url, json=message, headers=self._headers())
+        except asyncio.CancelledError:
+            if method != "initialize":
+                pool._notify_cancelled(self, request_id)
+            raise
+        except httpx.HTTPError as e:
+            self.healthy = False
+            raise MCPError(pool.name, str(e) or type(e).__name__) from e
+        
+        if method == "initialize":
+            self.session_id = response.headers.get("mcp-session-id")
+        elif response.status_code == 404 and self.session_id:
+            self.healthy = False
+            raise _SessionExpired(pool.name, f"session {self.session_id} expired", 404)
+        if response.status_code >= 400:
+            raise MCPError(
+                pool.name, f"HTTP {response.status_code}: {response.text[:500]}",
+                response.status_code,
+            )
+        reply = self._reply(response, request_id)
+        error = reply.get("error")
+        if error is not None:
+            raise MCPError(pool.name, error.get("message", "error"), error.get("code"))
+        self.last_ok = time.monotonic()
+        return reply.get("result") or {}
+    
+    async def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a JSON-RPC notification (no response expected)."""
+        message: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            response = await self._pool.client.post(
+                self._pool.url, json=message, headers=self._headers()
+            )
+        except httpx.HTTPError as e:
+            raise MCPError(self._pool.name, str(e) or type(e).__name__) from e
+        if response.status_code >= 400:
+            raise MCPError(
+                self._pool.name, f"HTTP {response.status_code} for {method}",
+                response.status_code,
+            )
+    
+    async def close(self) -> None:
+        """End the session on the server (best effort)."""
+        self.healthy = False
+        if self.session_id is None:
+            return
+        try:
+            await self._pool.client.delete(self._pool.url, headers=self._headers(), timeout=5)
+        except httpx.HTTPError:
+            pass
+    
+    def _headers(self) -> dict[str, str]:
+        headers = {"Accept": "application/json, text/event-stream"}
+        if self.session_id:
+            headers["Mcp-Session-Id"] = self.session_id
+        if self.protocol_version:
+            headers["MCP-Protocol-Version"] = self.protocol_version
+        return headers
+    
+    def _reply(self, response: httpx.Response, request_id: int) -> dict[str, Any]:
+        try:
+            if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                return response.json()
+            for event in response.text.split("\n\n"):
+                data = "\n".join(
+                    line[5:].lstrip() for line in event.splitlines() if line.startswith("data:")
+                )
+                if not data:
+                    continue
+                message = json.loads(data)
+                if message.get("id") == request_id and ("result" in message or "error" in message):
+                    return message
+        except ValueError as e:
+            raise MCPError(self._pool.name, f"invalid response: {e}") from e
+        raise MCPError(self._pool.name, f"no reply to request {request_id} in event stream")
+
+
+class MCPServerPool:
+    """
+    Warm, health-checked MCP sessions for one server.
+    
+    Use ``start()`` to open the sessions up front; otherwise they are opened
+    on first use.
+    """
+    
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.name = config.name
+        self.url = config.url
+        self.timeout_seconds = config.timeout_seconds
+        self.max_sessions = config.sessions
+        self.max_in_flight_per_session = config.max_in_flight_per_session
+        self.health_check_seconds = config.health_check_seconds
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._sessions: list[MCPSession] = []
+        self._opening = 0
+        self._capacity = asyncio.Condition()
+        self._ids = itertools.count(1)
+        self._health_task: asyncio.Task[None] | None = None
+        self._background: set[asyncio.Task[Any]] = set()
+        self._closed = False
+        self.stats = MCPServerStats()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, created on first use."""
+        if self._client is None:
+            connections = self.max_sessions * self.max_in_flight_per_session
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                ),
+                timeout=httpx.Timeout(
+                    self.timeout_seconds, connect=min(10.0, self.timeout_seconds)
+                ),
+                http2=_HTTP2_AVAILABLE,
+                transport=self._transport,
+            )
+        return self._client
+    
+    @property
+    def sessions(self) -> int:
+        """Number of open sessions."""
+        return len(self._sessions)
+    
+    async def start(self) -> None:
+        """
+        Open sessions up to the configured count and start health checks.
+        
+        Raises:
+            MCPError: If no session could be opened.
+        """
+        missing = self.max_sessions - len(self._sessions) - self._opening
+        results = await asyncio.gather(
+            *(self._open_session() for _ in range(missing)), return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures and not self._sessions:
+            raise failures[0]
+        if self.health_check_seconds > 0 and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+    
+    async def call_tool(
+        self,
+        tool: str,
+        arguments: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> ToolResult:
+        """
+        Call a tool and return its result.
+        
+        A result with ``is_error`` set is the tool reporting failure and is
+        returned, not raised.
+        
+        Raises:
+            MCPTimeoutError: If the call exceeds ``timeout`` (default: the
+                server's ``timeout_seconds``).
+            MCPError: On transport or protocol errors.
+        """
+        start = time.perf_counter()
+        self.stats.calls += 1
+        self.stats.in_flight += 1
+        try:
+            result = await self.request(
+                "tools/call", {"name": tool, "arguments": arguments or {}}, timeout
+            )
+        except MCPError as e:
+            self.stats.errors += 1
+            if isinstance(e, MCPTimeoutError):
+                self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.in_flight -= 1
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.stats.observe(tool, latency_ms)
+        return ToolResult(
+            server=self.name,
+            tool=tool,
+            content=result.get("content", []),
+            is_error=bool(result.get("isError")),
+            structured=result.get("structuredContent"),
+            latency_ms=latency_ms,
+        )
+    
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """Every tool the server offers, following pagination."""
+        tools: list[dict[str, Any]] = []
+        cursor: str | None = None
+        while True:
+            result = await self.request("tools/list", {"cursor": cursor} if cursor else None)
+            tools.extend(result.get("tools", []))
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
+    
+    async def request(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send a request on the least loaded session.
+        
+        The timeout covers waiting for a session slot. A request on a
+        session the server has expired is retried once on a new session.
+        """
+        timeout = timeout if timeout is not None else self.timeout_seconds
+        try:
+            async with asyncio.timeout(timeout):
+                try:
+                    return await self._request_once(method, params)
+                except _SessionExpired:
+                    return await self._request_once(method, params, new_session=True)
+        except TimeoutError as e:
+            raise MCPTimeoutError(self.name, f"{method} timed out after {timeout}s") from e
+    
+    async def check_health(self) -> int:
+        """
+        Ping sessions idle for a health-check interval and replace failures.
+        
+        Sessions that completed a request within the interval are not
+        pinged. Missing sessions are reopened afterwards.
+        
+        Returns:
+            Number of sessions replaced.
+        """
+        cutoff = time.monotonic() - self.health_check_seconds
+        idle = [s for s in self._sessions if s.in_flight == 0 and s.last_ok <= cutoff]
+        self.stats.health_checks += 1
+        
+        async def ping(session: MCPSession) -> bool:
+            try:
+                async with asyncio.timeout(self.timeout_seconds):
+                    await session.request("ping")
+                return True
+            except (MCPError, TimeoutError):
+                return False
+        
+        results = await asyncio.gather(*(ping(s) for s in idle))
+        failed = [s for s, ok in zip(idle, results) if not ok]
+        for session in failed:
+            logger.warning("mcp_session_unhealthy", server=self.name)
+            session.healthy = False
+            await self._discard(session)
+        if failed or len(self._sessions) < self.max_sessions:
+            try:
+                await self.start()
+            except MCPError as e:
+                logger.warning("mcp_reconnect_failed", server=self.name, error=str(e))
+        return len(failed)
+    
+    async def close(self) -> None:
+        """End every session and close connections."""
+        self._closed = True
+        tasks = [t for t in (self._health_task, *self._background) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._health_task = None
+        async with self._capacity:
+            self._capacity.notify_all()
+        sessions, self._sessions = self._sessions, []
+        if self._client is not None:
+            await asyncio.gather(*(s.close() for s in sessions))
+            await self._client.aclose()
+            self._client = None
+    
+    async def _request_once(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        new_session: bool = False,
+    ) -> dict[str, Any]:
+        session = await self._acquire(new_session)
+        try:
+            return await session.request(method, params)
+        finally:
+            await self._release(session)
+    
+    async def _acquire(self, new_session: bool = False) -> MCPSession:
+        async with self._capacity:
+            while True:
+                if self._closed:
+                    raise MCPError(self.name, "client is closed")
+                has_room = len(self._sessions) + self._opening < self.max_sessions
+                if new_session and has_room:
+                    break
+                session = min(
+                    (
+                        s for s in self._sessions
+                        if s.healthy and s.in_flight < self.max_in_flight_per_session
+                    ),
+                    key=lambda s: s.in_flight,
+                    default=None,
+                )
+                if session is not None:
+                    session.in_flight += 1
+                    return session
+                if has_room:
+                    break
+                self.stats.waiting += 1
+                try:
+                    await self._capacity.wait()
+                finally:
+                    self.stats.waiting -= 1
+        return await self._open_session(reserve=True)
+    
+    async def _release(self, session: MCPSession) -> None:
+        session.in_flight -= 1
+        if not session.healthy:
+            await self._discard(session)
+            return
+        async with self._capacity:
+            self._capacity.notify()
+    
+    async def _open_session(self, reserve: bool = False) -> MCPSession:
+        self._opening += 1
+        session = MCPSession(self)
+        try:
+            await session.open()
+        except MCPError as e:
+            logger.warning("mcp_session_open_failed", server=self.name, error=str(e))
+            raise
+        else:
+            if reserve:
+                session.in_flight = 1
+            self._sessions.append(session)
+            self.stats.sessions_opened += 1
+            return session
+        finally:
+            self._opening -= 1
+            # New capacity, or another caller may now try to open a session
+            async with self._capacity:
+                self._capacity.notify_all()
+    
+    async def _discard(self, session: MCPSession) -> None:
+        if session in self._sessions:
+            self._sessions.remove(session)
+            self.stats.sessions_replaced += 1
+            self._spawn(session.close())
+        async with self._capacity:
+            self._capacity.notify_all()
+    
+    def _notify_cancelled(self, session: MCPSession, request_id: int) -> None:
+        self._spawn(session.notify(
+            "notifications/cancelled",
+            {"requestId": request_id, "reason": "client cancelled or timed out"},
+        ))
+    
+    def _spawn(self, coro: Any) -> None:
+        if self._closed:
+            coro.close()
+            return
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+    
+    def _background_done(self, task: asyncio.Task[Any]) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("mcp_background_failed", server=self.name, error=str(task.exception()))
+    
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_seconds)
+            try:
+                await self.check_health()
+            except Exception as e:  # keep checking on unexpected failures
+                logger.error("mcp_health_check_failed", server=self.name, error=str(e))
+
+
+class MCPClientManager:
+    """
+    One ``MCPServerPool`` per enabled MCP server.
+    
+    Use as ``async with MCPClientManager(config) as mcp:`` to warm every
+    pool on entry and close them on exit.
+    """
+    
+    def __init__(
+        self,
+        config: HACIConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        integrations = config.integrations
+        self.pools: dict[str, MCPServerPool] = {}
+        if integrations.mcp_enabled:
+            for server in integrations.mcp_servers:
+                if server.enabled and server.url:
+                    self.pools[server.name] = MCPServerPool(server, transport=transport)
+    
+    async def __aenter__(self) -> MCPClientManager:
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+    
+    def pool(self, server: str) -> MCPServerPool:
+        """
+        Return the pool for a server.
+        
+        Raises:
+            MCPError: If the server is not configured or is disabled.
+        """
+        pool = self.pools.get(server)
+        if pool is None:
+            raise MCPError(server, "server not configured or disabled")
+        return pool
+    
+    async def start(self) -> None:
+        """Warm every pool; servers that cannot be reached are retried on use."""
+        names = list(self.pools)
+        results = await asyncio.gather(
+            *(self.pools[name].start() for name in names), return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning("mcp_warmup_failed", server=name, error=str(result))
+    
+    async def call_tool(
+        self,
+        server: str,
+        tool: str,
+        arguments: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> ToolResult:
+        """Call a tool on a server; see ``MCPServerPool.call_tool``."""
+        return await self.pool(server).call_tool(tool, arguments, timeout)
+    
+    async def list_tools(self, server: str) -> list[dict[str, Any]]:
+        """List a server's tools."""
+        return await self.pool(server).list_tools()
+    
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-server call counts, sessions and latency histograms."""
+        return {
+            name: {**pool.stats.snapshot(), "sessions": pool.sessions}
+            for name, pool in self.pools.items()
+        }
+    
+    async def close(self) -> None:
+        """Close every pool."""
+        await asyncio.gather(*(pool.close() for pool in self.pools.values()))
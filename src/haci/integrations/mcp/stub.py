@@ -0,0 +1,145 @@
+"""
+In-process stub MCP server for tests and benchmarks.
+
+``StubMCPServer`` speaks enough of the Streamable HTTP transport for
+``MCPServerPool``. It supports session creation and deletion, ping,
+``tools/list`` and ``tools/call``, and records cancellation notifications.
+It can answer with plain JSON or a one-event stream. Tools are async
+callables taking the call's arguments; ``echo`` and ``sleep`` are built in.
+``running()`` serves it with uvicorn on a free local port:
+
+    stub = StubMCPServer()
+    async with stub.running() as url:
+        config = MCPServerConfig(name="stub", url=url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+async def _echo(arguments: dict[str, Any]) -> str:
+    return str(arguments.get("text", ""))
+
+
+async def _sleep(arguments: dict[str, Any]) -> str:
+    await asyncio.sleep(float(arguments.get("seconds", 0)))
+    return "slept"
+
+
+class StubMCPServer:
+    """Minimal MCP server; counts sessions, methods and concurrency."""
+    
+    def __init__(self, event_stream: bool = False) -> None:
+        self.event_stream = event_stream
+        self.tools: dict[str, ToolHandler] = {"echo": _echo, "sleep": _sleep}
+        self.sessions: set[str] = set()
+        self.methods: Counter[str] = Counter()
+        self.cancelled: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self.app = Starlette(routes=[
+            Route("/mcp", self.handle, methods=["POST", "DELETE"]),
+        ])
+    
+    def add_tool(self, name: str, handler: ToolHandler) -> None:
+        self.tools[name] = handler
+    
+    def expire_sessions(self) -> None:
+        """Forget every session, as a restarted server would."""
+        self.sessions.clear()
+    
+    @asynccontextmanager
+    async def running(self, host: str = "127.0.0.1") -> AsyncIterator[str]:
+        """Serve on a free port; yields the endpoint URL."""
+        import uvicorn
+        
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            port = sock.getsockname()[1]
+        server = uvicorn.Server(uvicorn.Config(
+            self.app, host=host, port=port, log_level="warning", access_log=False
+        ))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        try:
+            yield f"http://{host}:{port}/mcp"
+        finally:
+            server.should_exit = True
+            await serving
+    
+    async def handle(self, request: Request) -> Response:
+        session_id = request.headers.get("mcp-session-id")
+        if request.method == "DELETE":
+            self.sessions.discard(session_id or "")
+            return Response(status_code=200)
+        
+        message = await request.json()
+        method = message.get("method", "")
+        self.methods[method] += 1
+        if method != "initialize" and session_id not in self.sessions:
+            return JSONResponse({"error": "unknown session"}, status_code=404)
+        if "id" not in message:
+            if method == "notifications/cancelled":
+                self.cancelled.append(message["params"]["requestId"])
+            return Response(status_code=202)
+        
+        headers: dict[str, str] = {}
+        if method == "initialize":
+            session_id = uuid.uuid4().hex
+            self.sessions.add(session_id)
+            headers["Mcp-Session-Id"] = session_id
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            reply = await self._dispatch(message)
+        finally:
+            self.active -= 1
+        reply = {"jsonrpc": "2.0", "id": message["id"], **reply}
+        if self.event_stream:
+            return Response(
+                f"event: message\ndata: {json.dumps(reply)}\n\n",
+                media_type="text/event-stream",
+                headers=headers,
+            )
+        return JSONResponse(reply, headers=headers)
+    
+    async def _dispatch(self, message: dict[str, Any]) -> dict[str, Any]:
+        method = message["method"]
+        params = message.get("params") or {}
+        if method == "initialize":
+            return {"result": {
+                "protocolVersion": params.get("protocolVersion"),
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "stub-mcp", "version": "0"},
+            }}
+        if method == "ping":
+            return {"result": {}}
+        if method == "tools/list":
+            return {"result": {"tools": [
+                {"name": name, "inputSchema": {"type": "object"}} for name in self.tools
+            ]}}
+        if method == "tools/call":
+            handler = self.tools.get(params.get("name"))
+            if handler is None:
+                return {"error": {"code": -32602, "message": f"Unknown tool: {params.get('name')}"}}
+            try:
+                output = await handler(params.get("arguments") or {})
+            except Exception as e:
+                return {"result": {"content": [{"type": "text", "text": str(e)}], "isError": True}}
+            return {"result": {"content": [{"type": "text", "text": str(output)}], "isError": False}}
+        return {"error": {"code": -32601, "message": f"Method not found: {method}"}}
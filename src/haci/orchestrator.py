@@ -11,15 +11,34 @@ The Meta-Orchestrator is responsible for:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import os
+import sqlite3
+import statistics
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
 
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from haci.config import HACIConfig
+from haci.agents import create_agent_backend, parse_finding
+from haci.completion import CompletionChannel, ResultFilter
+from haci.config import HACIConfig, QuorumPolicy
+from haci.events import StatusEvent, StatusEventBus, StatusSubscription
 from haci.harness import Harness, HarnessConfig
+from haci.integrations.api.cache import CacheStats, ResponseCache
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+from haci.quorum import Quorum, QuorumTally
+from haci.retention import ResultSpillStore, TaskRetention
+from haci.shared.matching import KeywordMatcher
+from haci.task_store import TaskRecord, TaskStore, create_task_store
 from haci.types import (
     AgentType,
     ComplexityScore,
@@ -28,6 +47,7 @@ from haci.types import (
     TaskResult,
     TaskStatus,
 )
+from haci.worker_pool import WorkerPool
 
 logger = structlog.get_logger()
 
@@ -41,11 +61,454 @@ class TaskState(BaseModel):
     complexity_score: ComplexityScore | None = None
     assigned_agents: list[AgentType] = Field(default_factory=list)
     findings: list[dict[str, Any]] = Field(default_factory=list)
+    # Response-cache lookups made for this task, by agent type
+    cache_stats: dict[str, CacheStats] = Field(default_factory=dict)
     result: TaskResult | None = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+# Keywords that indicate each investigation domain. Matched as whole words
+# (plural and verb endings allowed) by the orchestrator's KeywordMatcher.
+DOMAIN_KEYWORDS: dict[str, list[str]] = {
+    "logs": ["log", "error", "trace", "debug"],
+    "code": ["code", "function", "bug", "syntax", "deploy"],
+    "database": ["database", "query", "sql", "table", "schema"],
+    "infrastructure": ["server", "network", "cloud", "kubernetes", "docker"],
+    "security": [
+        "security", "vulnerability", "auth", "authentication", "authorization",
+        "permission",
+    ],
+    "api": ["api", "endpoint", "rest", "graphql", "502", "404"],
+    "performance": ["slow", "latency", "throughput", "memory", "cpu"],
+}
+
+HIGH_RISK_KEYWORDS: list[str] = ["production", "critical", "security", "data loss"]
+
+# Keywords whose verb forms mean something else ("resting"); these match
+# only as written or in the plural
+NOUN_KEYWORDS: list[str] = ["rest"]
+
+AGENT_SYSTEM_PROMPT = (
+    "You are the HACI {agent} agent. Investigate the incident below within "
+    "your specialty. Reply with a JSON object with keys root_cause (one "
+    "sentence), confidence (0-100), summary and steps (a list of strings)."
+)
+
+# USD for a micro-swarm whose every agent answered
+MICRO_SWARM_COST = 0.025
+
+# Validates a whole batch of task dicts in one call for submit_many
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+
+# Lower rank is dispatched first; unknown priorities are treated as medium.
+PRIORITY_RANKS: dict[str, int] = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+
+@dataclass
+class AgentFanOut:
+    """Outcome of asking a swarm's agents concurrently."""
+    
+    timings_ms: dict[str, float] = field(default_factory=dict)  # agents that answered
+    confidences: dict[str, float] = field(default_factory=dict)  # parsed, by agent
+    quorum: Quorum | None = None
+    cancelled: list[str] = field(default_factory=list)
+    
+    def confidence(self, default: float) -> float:
+        """
+        The quorum's confidence, or without one the mean parsed confidence
+        of the agents that answered; ``default`` if none could be parsed.
+        """
+        if self.quorum is not None:
+            return self.quorum.confidence
+        if self.confidences:
+            return statistics.fmean(self.confidences.values())
+        return default
+    
+    def charged(self, cost: float, agents: int) -> float:
+        """Share of a swarm's ``cost`` owed for the agents that answered."""
+        return round(cost * len(self.timings_ms) / agents, 6)
+    
+    def metadata(self) -> dict[str, Any]:
+        metadata: dict[str, Any] = {"agent_timings_ms": self.timings_ms}
+        if self.quorum is not None:
+            metadata["quorum"] = self.quorum.to_dict()
+            metadata["cancelled_agents"] = self.cancelled
+        return metadata
+
+
+@dataclass
+class SchedulerStats:
+    """Point-in-time snapshot of the task scheduler."""
+    
+    max_in_flight: int
+    in_flight: int
+    queue_depth: int
+    queue_depth_by_priority: dict[str, int]
+    dispatched: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_wait_ms_by_priority: dict[str, float] = field(default_factory=dict)
+
+
+class TaskScheduler:
+    """
+    Bounded-concurrency priority scheduler for task pipelines.
+    
+    Tasks are queued by priority (critical > high > medium > low) and
+    dispatched FIFO within a priority, with at most ``max_in_flight``
+    pipelines running at once. Enqueueing never requires a running event
+    loop; queued work is dispatched as soon as one is available.
+    """
+    
+    def __init__(
+        self,
+        runner: Callable[[str], Awaitable[None]],
+        max_in_flight: int = 50,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self._runner = runner
+        self._queue: list[tuple[int, int, float, str, str]] = []
+        self._sequence = itertools.count()
+        # Running pipeline -> its task ID
+        self._running: dict[asyncio.Task[None], str] = {}
+        self._depth_by_priority: dict[str, int] = {}
+        self._dispatched = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._wait_by_priority: dict[str, tuple[int, float]] = {}
+        self._closed = False
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of task pipelines currently running."""
+        return len(self._running)
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks waiting for a free slot."""
+        return len(self._queue)
+    
+    def enqueue(self, task_id: str, priority: str) -> None:
+        """Queue a task for processing and dispatch if a slot is free."""
+        priority = priority if priority in PRIORITY_RANKS else "medium"
+        heapq.heappush(
+            self._queue,
+            (
+                PRIORITY_RANKS[priority],
+                next(self._sequence),
+                time.monotonic(),
+                priority,
+                task_id,
+            ),
+        )
+        self._depth_by_priority[priority] = (
+            self._depth_by_priority.get(priority, 0) + 1
+        )
+        self.dispatch()
+    
+    def enqueue_many(self, items: Iterable[tuple[str, str]]) -> int:
+        """
+        Queue many (task_id, priority) pairs with a single heap rebuild.
+        
+        Returns:
+            Number of tasks queued
+        """
+        now = time.monotonic()
+        added = 0
+        for task_id, priority in items:
+            priority = priority if priority in PRIORITY_RANKS else "medium"
+            self._queue.append(
+                (PRIORITY_RANKS[priority], next(self._sequence), now, priority, task_id)
+            )
+            self._depth_by_priority[priority] = (
+                self._depth_by_priority.get(priority, 0) + 1
+            )
+            added += 1
+        heapq.heapify(self._queue)
+        self.dispatch()
+        return added
+    
+    def dispatch(self) -> int:
+        """
+        Start queued tasks while capacity allows.
+        
+        This is a no-op outside a running event loop, so tasks submitted
+        from synchronous code are started on the next call made from
+        within one.
+        
+        Returns:
+            Number of tasks started
+        """
+        if self._closed:
+            return 0
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return 0
+        
+        started = 0
+        while self._queue and len(self._running) < self.max_in_flight:
+            _, _, enqueued_at, priority, task_id = heapq.heappop(self._queue)
+            self._depth_by_priority[priority] -= 1
+            self._record_wait(priority, (time.monotonic() - enqueued_at) * 1000)
+            
+            task = asyncio.create_task(self._runner(task_id))
+            self._running[task] = task_id
+            task.add_done_callback(self._on_done)
+            started += 1
+        return started
+    
+    def remove(self, task_id: str) -> bool:
+        """Drop a queued task before it starts; returns whether it was queued."""
+        for i, (_, _, _, priority, queued_id) in enumerate(self._queue):
+            if queued_id == task_id:
+                self._queue[i] = self._queue[-1]
+                self._queue.pop()
+                heapq.heapify(self._queue)
+                self._depth_by_priority[priority] -= 1
+                return True
+        return False
+    
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a running pipeline; returns whether one was running."""
+        for task, running_id in self._running.items():
+            if running_id == task_id:
+                task.cancel()
+                return True
+        return False
+    
+    async def shutdown(self) -> int:
+        """
+        Stop dispatching and cancel running pipelines, waiting for them to unwind.
+        
+        Queued tasks are left unstarted.
+        
+        Returns:
+            Number of running pipelines cancelled
+        """
+        self._closed = True
+        running = list(self._running)
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        return len(running)
+    
+    def stats(self) -> SchedulerStats:
+        """Return queue-depth and wait-time statistics."""
+        return SchedulerStats(
+            max_in_flight=self.max_in_flight,
+            in_flight=self.in_flight,
+            queue_depth=self.queue_depth,
+            queue_depth_by_priority={
+                p: d for p, d in self._depth_by_priority.items() if d
+            },
+            dispatched=self._dispatched,
+            avg_wait_ms=(
+                self._wait_total_ms / self._dispatched if self._dispatched else 0.0
+            ),
+            max_wait_ms=self._wait_max_ms,
+            avg_wait_ms_by_priority={
+                p: total / count
+                for p, (count, total) in self._wait_by_priority.items()
+            },
+        )
+    
+    def _record_wait(self, priority: str, wait_ms: float) -> None:
+        self._dispatched += 1
+        self._wait_total_ms += wait_ms
+        self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+        count, total = self._wait_by_priority.get(priority, (0, 0.0))
+        self._wait_by_priority[priority] = (count + 1, total + wait_ms)
+    
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        self._running.pop(task, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("task_runner_crashed", error=str(task.exception()))
+        self.dispatch()
+
+
+class ComplexityCache:
+    """
+    LRU + TTL cache of complexity scores keyed on normalized task text.
+    
+    The key is a SHA-256 of the lowercased, whitespace-collapsed title and
+    description plus the priority, so re-fired alerts with cosmetic
+    differences share one entry. With ``persist_path`` set, entries are
+    also written to SQLite and reloaded on start, subject to the TTL. The
+    table is held to ``max_entries`` rows, oldest dropped first. Rows are
+    written in batches by a background task through ``asyncio.to_thread``
+    (immediately when no event loop is running), so a miss never waits on
+    a commit.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 900,
+        persist_path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (stored_at, score), least recently used first
+        self._entries: OrderedDict[str, tuple[float, ComplexityScore]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # key -> (stored_at, score JSON) not yet written to SQLite
+        self._unwritten: dict[str, tuple[float, str]] = {}
+        self._writer: asyncio.Task[None] | None = None
+        if persist_path:
+            self._conn = sqlite3.connect(persist_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS complexity_cache "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, score TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS complexity_cache_stored_at "
+                "ON complexity_cache (stored_at)"
+            )
+            self._conn.commit()
+            self._load()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def make_key(task: Task) -> str:
+        """Hash of the normalized title, description and priority."""
+        text = " ".join(f"{task.title} {task.description}".lower().split())
+        return hashlib.sha256(f"{task.priority}\x00{text}".encode()).hexdigest()
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def get(self, task: Task) -> ComplexityScore | None:
+        """Return a cached score for the task, or None on a miss."""
+        key = self.make_key(task)
+        entry = self._entries.get(key)
+        if entry is not None and not self._expired(entry[0]):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+    
+    def put(self, task: Task, score: ComplexityScore) -> None:
+        """Cache a score, evicting the least recently used beyond capacity."""
+        key = self.make_key(task)
+        stored_at = self._clock()
+        self._entries[key] = (stored_at, score)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        
+        if self._conn is None:
+            return
+        self._unwritten[key] = (stored_at, score.model_dump_json())
+        if self._writer is not None and not self._writer.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_rows(self._take_unwritten())
+            return
+        self._writer = loop.create_task(self._write_unwritten())
+    
+    async def flush(self) -> None:
+        """Wait until every cached score has been written to SQLite."""
+        if self._writer is not None:
+            await self._writer
+        if self._unwritten:
+            await self._write_unwritten()
+    
+    def clear(self) -> None:
+        """Drop all entries, including persisted ones."""
+        self._entries.clear()
+        self._unwritten.clear()
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM complexity_cache")
+    
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+    
+    def _take_unwritten(self) -> list[tuple[str, float, str]]:
+        rows = [(key, stored_at, score) for key, (stored_at, score) in self._unwritten.items()]
+        self._unwritten.clear()
+        return rows
+    
+    async def _write_unwritten(self) -> None:
+        # Scores cached while a batch is being written go in the next batch
+        while self._unwritten:
+            rows = self._take_unwritten()
+            try:
+                await asyncio.to_thread(self._write_rows, rows)
+            except Exception as e:
+                logger.error("complexity_cache_write_failed", error=str(e), rows=len(rows))
+    
+    def _write_rows(self, rows: list[tuple[str, float, str]]) -> None:
+        """Upsert rows, then drop expired rows and the oldest beyond capacity."""
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO complexity_cache VALUES (?, ?, ?)", rows
+                )
+                if self.ttl_seconds > 0:
+                    self._conn.execute(
+                        "DELETE FROM complexity_cache WHERE stored_at < ?",
+                        (self._clock() - self.ttl_seconds,),
+                    )
+                (count,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM complexity_cache"
+                ).fetchone()
+                if count > self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM complexity_cache WHERE key IN ("
+                        "SELECT key FROM complexity_cache ORDER BY stored_at LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+    
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and self._clock() - stored_at > self.ttl_seconds
+    
+    def _load(self) -> None:
+        assert self._conn is not None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, stored_at, score FROM complexity_cache "
+                "ORDER BY stored_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+        for key, stored_at, score in reversed(rows):
+            if not self._expired(stored_at):
+                self._entries[key] = (
+                    stored_at,
+                    ComplexityScore.model_validate_json(score),
+                )
+
+
 class HACIOrchestrator:
     """
     HACI Meta-Orchestrator
@@ -58,7 +521,11 @@ class HACIOrchestrator:
     5. Ensures governance compliance
     """
     
-    def __init__(self, config: HACIConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: HACIConfig | None = None,
+        task_store: TaskStore | None = None,
+    ) -> None:
         self.config = config or HACIConfig()
         self.harness = Harness(
             config=HarnessConfig(
@@ -68,7 +535,47 @@ class HACIOrchestrator:
             )
         )
         self._tasks: dict[str, TaskState] = {}
-        self._completion_events: dict[str, asyncio.Event] = {}
+        # One channel delivers every finished result to awaiting callers
+        self._completions = CompletionChannel()
+        self.status_events = StatusEventBus()
+        # In worker-pool mode this process only schedules; workers execute
+        processes = self.config.execution.worker_processes
+        self.worker_pool = WorkerPool(self.config, processes) if processes else None
+        self.scheduler = TaskScheduler(
+            runner=self._process_task_in_worker if self.worker_pool else self._process_task,
+            max_in_flight=self.config.execution.max_concurrent_tasks * max(1, processes),
+        )
+        self.retention = TaskRetention(
+            ttl_seconds=self.config.retention.ttl_seconds,
+            max_tasks=self.config.retention.max_completed_tasks,
+        )
+        spill_path = self.config.retention.spill_path
+        self._spill_store = ResultSpillStore(spill_path) if spill_path else None
+        self.task_store = task_store or create_task_store(self.config)
+        cache_config = self.config.complexity_cache
+        self.complexity_cache = (
+            ComplexityCache(
+                max_entries=cache_config.max_entries,
+                ttl_seconds=cache_config.ttl_seconds,
+                persist_path=cache_config.persist_path,
+            )
+            if cache_config.enabled
+            else None
+        )
+        self.agent_backend = create_agent_backend(self.config)
+        response_cache_config = self.config.response_cache
+        self.response_cache = (
+            ResponseCache.from_config(response_cache_config)
+            if response_cache_config.enabled
+            else None
+        )
+        self._keyword_matcher = KeywordMatcher(
+            {
+                **{("domain", d): kws for d, kws in DOMAIN_KEYWORDS.items()},
+                ("risk", "high"): HIGH_RISK_KEYWORDS,
+            },
+            nouns=NOUN_KEYWORDS,
+        )
     
     def submit(self, task_data: dict[str, Any]) -> Task:
         """
@@ -76,7 +583,7 @@ class HACIOrchestrator:
         
         Args:
             task_data: Dictionary containing task details
-            
+        
         Returns:
             The created Task object
         """
@@ -91,7 +598,8 @@ class HACIOrchestrator:
         
         state = TaskState(task=task)
         self._tasks[task.id] = state
-        self._completion_events[task.id] = asyncio.Event()
+        self._persist(state)
+        self._publish_status(state, None)
         
         logger.info(
             "task_submitted",
@@ -100,11 +608,61 @@ class HACIOrchestrator:
             priority=task.priority,
         )
         
-        # Start processing asynchronously
-        asyncio.create_task(self._process_task(task.id))
+        # Queue for processing; the scheduler bounds concurrency
+        self.scheduler.enqueue(task.id, task.priority)
         
         return task
     
+    def submit_many(self, tasks_data: Iterable[dict[str, Any]]) -> list[Task]:
+        """
+        Submit a batch of tasks in one validation and scheduling pass.
+        
+        The batch is validated as a whole before anything is queued, so a
+        single invalid entry rejects the entire batch. One aggregate
+        ``tasks_submitted`` event is logged instead of one per task.
+        
+        Args:
+            tasks_data: Dictionaries containing task details
+        
+        Returns:
+            The created Task objects, in input order
+        
+        Raises:
+            pydantic.ValidationError: If any entry is invalid
+        """
+        tasks_data = list(tasks_data)
+        if not tasks_data:
+            return []
+        
+        random_bytes = os.urandom(16 * len(tasks_data))
+        tasks = _TASK_LIST_ADAPTER.validate_python([
+            {
+                "id": str(uuid.UUID(bytes=random_bytes[i * 16 : (i + 1) * 16], version=4)),
+                "type": data.get("type", "general"),
+                "title": data.get("title", "Untitled Task"),
+                "description": data.get("description", ""),
+                "priority": data.get("priority", "medium"),
+                "metadata": data.get("metadata", {}),
+            }
+            for i, data in enumerate(tasks_data)
+        ])
+        
+        priorities: dict[str, int] = {}
+        publish = self.status_events.subscriber_count > 0
+        for task in tasks:
+            state = TaskState(task=task)
+            self._tasks[task.id] = state
+            priorities[task.priority] = priorities.get(task.priority, 0) + 1
+            if publish:
+                self._publish_status(state, None)
+        self.task_store.record_many(TaskRecord(task=task) for task in tasks)
+        
+        logger.info("tasks_submitted", count=len(tasks), priorities=priorities)
+        
+        self.scheduler.enqueue_many((task.id, task.priority) for task in tasks)
+        
+        return tasks
+    
     async def await_result(
         self,
         task_id: str,
@@ -116,39 +674,299 @@ class HACIOrchestrator:
         Args:
             task_id: The task ID to wait for
             timeout: Optional timeout in seconds
-            
+        
         Returns:
             The TaskResult when complete
-            
+        
         Raises:
             TimeoutError: If timeout is exceeded
             KeyError: If task_id is not found
         """
-        if task_id not in self._tasks:
-            raise KeyError(f"Task not found: {task_id}")
+        state = self._tasks.get(task_id)
+        if state is None:
+            return await self._load_result(task_id)
+        self.retention.touch(task_id)
+        if state.result is not None:
+            return state.result
         
-        event = self._completion_events[task_id]
+        waiter = self._completions.wait(task_id)
+        # Start anything queued before an event loop was available
+        self.scheduler.dispatch()
         
         if timeout:
             try:
-                await asyncio.wait_for(event.wait(), timeout=timeout)
+                return await asyncio.wait_for(waiter, timeout=timeout)
             except asyncio.TimeoutError:
                 raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
-        else:
-            await event.wait()
+        return await waiter
+    
+    async def as_completed(
+        self,
+        task_ids: Iterable[str],
+        timeout: float | None = None,
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Yield results for the given tasks as they finish.
         
-        state = self._tasks[task_id]
-        if state.result is None:
-            raise RuntimeError(f"Task {task_id} completed but has no result")
+        Tasks that have already finished are yielded first, in the order
+        given; the rest follow in completion order. All unknown IDs are
+        reported before anything is yielded.
+        
+        Args:
+            task_ids: Task IDs to wait for; duplicates are ignored
+            timeout: Optional limit in seconds for the whole iteration
         
-        return state.result
+        Raises:
+            KeyError: If any task_id is not found
+            TimeoutError: If results are still outstanding after ``timeout``
+            RuntimeError: If the orchestrator is closed before they arrive
+        """
+        ids = list(dict.fromkeys(task_ids))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Subscribe before checking what has finished so nothing is missed
+        subscription = self._completions.subscribe_tasks(ids)
+        try:
+            finished: list[TaskResult] = []
+            remaining: set[str] = set()
+            for task_id in ids:
+                state = self._tasks.get(task_id)
+                if state is None:
+                    finished.append(await self._load_result(task_id))
+                elif state.result is not None:
+                    finished.append(state.result)
+                else:
+                    remaining.add(task_id)
+            
+            for result in finished:
+                yield result
+            
+            self.scheduler.dispatch()
+            while remaining:
+                wait = None if deadline is None else deadline - time.monotonic()
+                try:
+                    result = await asyncio.wait_for(subscription.get(), timeout=wait)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"{len(remaining)} task(s) did not complete within {timeout}s"
+                    )
+                if result.task_id in remaining:
+                    remaining.discard(result.task_id)
+                    self.retention.touch(result.task_id)
+                    yield result
+        finally:
+            subscription.close()
+    
+    async def stream_results(
+        self,
+        result_filter: ResultFilter | None = None,
+        max_buffer: int = 10_000,
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Yield the result of every task that finishes from now on.
+        
+        Runs until the consumer stops iterating or the orchestrator is
+        closed. Results are buffered per stream; once ``max_buffer`` are
+        waiting the oldest is dropped, so a slow consumer never holds up
+        task processing.
+        
+        Args:
+            result_filter: Optional predicate selecting which results to yield
+            max_buffer: Maximum number of undelivered results kept
+        """
+        subscription = self._completions.subscribe(result_filter, max_buffer=max_buffer)
+        try:
+            async for result in subscription:
+                yield result
+        finally:
+            subscription.close()
+            if subscription.dropped:
+                logger.warning("result_stream_dropped", dropped=subscription.dropped)
+    
+    def subscribe_status(
+        self,
+        task_ids: Iterable[str] | None = None,
+        statuses: Iterable[TaskStatus] | None = None,
+        modes: Iterable[ExecutionMode] | None = None,
+        max_buffer: int = 1000,
+    ) -> StatusSubscription:
+        """
+        Subscribe to task status transitions instead of polling ``get_status``.
+        
+        The subscription is active as soon as this returns. Iterate it with
+        ``async for`` and close it (or use it in a ``with`` block) when done.
+        In worker-pool mode only the transitions seen by this process are
+        published: EXECUTING and the final status.
+        
+        Args:
+            task_ids: Only events for these tasks; None for all tasks
+            statuses: Only transitions into these statuses; None for all
+            modes: Only events for tasks in these modes; None for all
+            max_buffer: Undelivered events kept before the oldest is dropped
+        """
+        return self.status_events.subscribe(
+            task_ids=task_ids,
+            statuses=statuses,
+            modes=modes,
+            max_buffer=max_buffer,
+        )
+    
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a queued or running task.
+        
+        The task finishes as failed, so anyone awaiting it is released.
+        
+        Args:
+            task_id: The task to cancel
+        
+        Returns:
+            False if the task is unknown or has already finished
+        """
+        state = self._tasks.get(task_id)
+        if state is None or state.result is not None:
+            return False
+        if self.scheduler.remove(task_id):
+            # Never started, so no pipeline will finish it
+            self._finish_task(task_id, state)
+            return True
+        return self.scheduler.cancel(task_id)
     
     def get_status(self, task_id: str) -> TaskStatus:
         """Get the current status of a task."""
         if task_id not in self._tasks:
-            raise KeyError(f"Task not found: {task_id}")
+            spilled = self._spill_store.get(task_id) if self._spill_store else None
+            if spilled is None:
+                raise KeyError(f"Task not found: {task_id}")
+            return spilled.status
+        self.retention.touch(task_id)
         return self._tasks[task_id].status
     
+    async def _load_result(self, task_id: str) -> TaskResult:
+        """Result of a task no longer (or never) held in memory."""
+        spilled = self._spill_store.get(task_id) if self._spill_store else None
+        if spilled is not None:
+            return spilled
+        record = await self.task_store.get(task_id)
+        if record is None:
+            raise KeyError(f"Task not found: {task_id}")
+        if record.result is None:
+            raise RuntimeError(
+                f"Task {task_id} is not running in this process "
+                f"(last status: {record.status.value})"
+            )
+        return record.result
+    
+    async def fetch_status(self, task_id: str) -> TaskStatus:
+        """
+        Get a task's status, also consulting the persistent task store.
+        
+        Unlike ``get_status`` this finds tasks submitted before a restart.
+        """
+        try:
+            return self.get_status(task_id)
+        except KeyError:
+            status = await self.task_store.get_status(task_id)
+            if status is None:
+                raise
+            return status
+    
+    async def run_task(self, task: Task) -> TaskResult:
+        """
+        Process a task in this process and return its result.
+        
+        Bypasses the scheduler and is not retained afterwards; worker
+        processes use this to execute tasks sent by the front end.
+        """
+        self._tasks[task.id] = TaskState(task=task)
+        try:
+            await self._process_task(task.id)
+            result = self._tasks[task.id].result
+        finally:
+            self._tasks.pop(task.id, None)
+        assert result is not None
+        return result
+    
+    async def close(self) -> None:
+        """
+        Stop processing, flush persisted task state and release resources.
+        
+        Tasks still running are cancelled and finish as failed; queued ones
+        are not started. Anyone still waiting on a result is then released:
+        ``await_result`` and ``as_completed`` raise ``RuntimeError`` and
+        ``stream_results`` and status subscriptions end.
+        """
+        cancelled = await self.scheduler.shutdown()
+        if cancelled:
+            logger.warning("tasks_cancelled_on_close", count=cancelled)
+        self._completions.close()
+        self.status_events.close()
+        if self.worker_pool is not None:
+            await asyncio.to_thread(self.worker_pool.close)
+        await self.task_store.close()
+        await self.agent_backend.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        self.harness.close()
+        if self.complexity_cache is not None:
+            await self.complexity_cache.flush()
+            self.complexity_cache.close()
+        if self._spill_store is not None:
+            await self._spill_store.flush()
+            self._spill_store.close()
+    
+    def evict_finished(self) -> int:
+        """
+        Move expired or over-capacity finished tasks out of memory.
+        
+        With ``retention.spill_path`` set, evicted results are handed to the
+        spill store, which writes them off the event loop, and remain
+        available through ``get_status`` and ``await_result``. Otherwise
+        only a persistent task store still answers for them.
+        
+        Returns:
+            Number of tasks evicted
+        """
+        evicted = self.retention.collect_evictions()
+        if not evicted:
+            return 0
+        
+        results = []
+        for task_id in evicted:
+            state = self._tasks.pop(task_id, None)
+            if state is not None and state.result is not None:
+                results.append(state.result)
+        if self._spill_store is not None:
+            self._spill_store.spill(results)
+        self.task_store.evict(evicted)
+        
+        logger.debug("tasks_evicted", count=len(evicted))
+        return len(evicted)
+    
+    def analyze_many(self, tasks: Iterable[Task]) -> list[ComplexityScore]:
+        """
+        Score many tasks at once, e.g. for backlog imports.
+        
+        Tasks with the same text and priority are scored once and share one
+        ComplexityScore instance, so batches of re-fired alerts cost one
+        keyword scan per distinct ticket. Distinct tickets cost the same as
+        scoring them one by one.
+        
+        Args:
+            tasks: Tasks to score
+        
+        Returns:
+            One ComplexityScore per task, in input order
+        """
+        scores: dict[tuple[str, str, str], ComplexityScore] = {}
+        results: list[ComplexityScore] = []
+        for task in tasks:
+            key = (task.title, task.description, task.priority)
+            score = scores.get(key)
+            if score is None:
+                score = scores[key] = self._compute_complexity(task)
+            results.append(score)
+        return results
+    
     async def _process_task(self, task_id: str) -> None:
         """Main task processing pipeline."""
         state = self._tasks[task_id]
@@ -156,27 +974,38 @@ class HACIOrchestrator:
         
         try:
             # Step 1: Analyze complexity
-            state.status = TaskStatus.ANALYZING
-            state.complexity_score = await self._analyze_complexity(state.task)
+            self._set_status(state, TaskStatus.ANALYZING)
+            self._persist(state)
+            state.complexity_score = await self._score_complexity(state.task)
             
             # Step 2: Select execution mode
+            hedged = False
             if state.task.metadata.get("mode"):
                 state.mode = ExecutionMode(state.task.metadata["mode"])
             else:
                 state.mode = state.complexity_score.recommended_mode
+                hedged = self._should_hedge(state.complexity_score)
             
             logger.info(
                 "mode_selected",
                 task_id=task_id,
                 mode=state.mode.value,
                 complexity=state.complexity_score.overall_score,
+                hedged=hedged,
             )
             
             # Step 3: Create harness context
             context = self.harness.create_context(task_id, state.mode)
             
-            # Step 4: Assign agents
-            state.assigned_agents = self._select_agents(state.complexity_score)
+            # Step 4: Assign agents (for a hedge, the single agent followed
+            # by the micro-swarm's)
+            complexity = state.complexity_score
+            if hedged:
+                complexity = complexity.model_copy(update={
+                    "recommended_mode": ExecutionMode.MICRO_SWARM,
+                    "estimated_agents_needed": max(3, complexity.estimated_agents_needed),
+                })
+            state.assigned_agents = self._select_agents(complexity)
             context.agents_active = state.assigned_agents
             
             logger.info(
@@ -186,9 +1015,12 @@ class HACIOrchestrator:
             )
             
             # Step 5: Execute based on mode
-            state.status = TaskStatus.EXECUTING
+            self._set_status(state, TaskStatus.EXECUTING)
+            self._persist(state)
             
             match state.mode:
+                case _ if hedged:
+                    result = await self._execute_hedged(state, context)
                 case ExecutionMode.SINGLE_AGENT:
                     result = await self._execute_single_agent(state, context)
                 case ExecutionMode.MICRO_SWARM:
@@ -201,6 +1033,12 @@ class HACIOrchestrator:
                     # Auto mode should have been resolved above
                     result = await self._execute_single_agent(state, context)
             
+            # Agents stopped by a quorum did not contribute to the result
+            cancelled = result.get("metadata", {}).get("cancelled_agents", [])
+            state.assigned_agents = [
+                agent for agent in state.assigned_agents if agent.value not in cancelled
+            ]
+            
             # Step 6: Complete task
             execution_time = int(
                 (datetime.utcnow() - start_time).total_seconds() * 1000
@@ -216,9 +1054,9 @@ class HACIOrchestrator:
                 resolution_steps=result.get("steps", []),
                 execution_time_ms=execution_time,
                 cost_usd=result.get("cost", 0.0),
-                metadata=result.get("metadata", {}),
+                metadata=self._result_metadata(state, result),
             )
-            state.status = TaskStatus.COMPLETED
+            self._set_status(state, TaskStatus.COMPLETED)
             
             logger.info(
                 "task_completed",
@@ -226,14 +1064,13 @@ class HACIOrchestrator:
                 confidence=state.result.confidence,
                 execution_time_ms=execution_time,
             )
-            
+        
         except Exception as e:
             logger.error(
                 "task_failed",
                 task_id=task_id,
                 error=str(e),
             )
-            state.status = TaskStatus.FAILED
             state.result = TaskResult(
                 task_id=task_id,
                 status=TaskStatus.FAILED,
@@ -246,11 +1083,107 @@ class HACIOrchestrator:
                     (datetime.utcnow() - start_time).total_seconds() * 1000
                 ),
             )
+            self._set_status(state, TaskStatus.FAILED)
         
         finally:
-            # Clean up and signal completion
-            self.harness.cleanup_context(task_id)
-            self._completion_events[task_id].set()
+            self._finish_task(task_id, state)
+    
+    async def _process_task_in_worker(self, task_id: str) -> None:
+        """Run a task in the worker pool and record its result here."""
+        state = self._tasks[task_id]
+        assert self.worker_pool is not None
+        try:
+            self._set_status(state, TaskStatus.EXECUTING)
+            self._persist(state)
+            result = await self.worker_pool.run(state.task)
+            state.mode = result.mode
+            state.assigned_agents = result.agents_used
+            state.result = result
+            self._set_status(state, result.status)
+        except Exception as e:
+            logger.error("task_failed", task_id=task_id, error=str(e))
+            state.result = TaskResult(
+                task_id=task_id,
+                status=TaskStatus.FAILED,
+                mode=state.mode,
+                summary=f"Task failed: {e}",
+                confidence=0.0,
+                agents_used=[],
+                resolution_steps=[],
+                execution_time_ms=0,
+            )
+            self._set_status(state, TaskStatus.FAILED)
+        finally:
+            self._finish_task(task_id, state)
+    
+    def _result_metadata(self, state: TaskState, result: dict[str, Any]) -> dict[str, Any]:
+        metadata = dict(result.get("metadata", {}))
+        if state.cache_stats:
+            metadata["response_cache"] = {
+                agent: stats.snapshot() for agent, stats in state.cache_stats.items()
+            }
+        return metadata
+    
+    def _finish_task(self, task_id: str, state: TaskState) -> None:
+        """Persist the final state, release the context and signal completion."""
+        if state.result is None:
+            # E.g. cancelled during shutdown; waiters still need an answer
+            state.result = TaskResult(
+                task_id=task_id,
+                status=TaskStatus.FAILED,
+                mode=state.mode,
+                summary="Task ended without a result",
+                confidence=0.0,
+                agents_used=state.assigned_agents,
+                resolution_steps=[],
+                execution_time_ms=0,
+            )
+            self._set_status(state, TaskStatus.FAILED)
+        self._persist(state)
+        self.harness.cleanup_context(task_id)
+        self._completions.publish(state.result)
+        self.retention.retain(task_id)
+        self.evict_finished()
+    
+    def _set_status(self, state: TaskState, status: TaskStatus) -> None:
+        """Move a task to a new status and announce the transition."""
+        previous = state.status
+        state.status = status
+        state.updated_at = datetime.utcnow()
+        self._publish_status(state, previous)
+    
+    def _publish_status(self, state: TaskState, previous: TaskStatus | None) -> None:
+        if not self.status_events.wants(state.task.id):
+            return
+        self.status_events.publish(StatusEvent(
+            task_id=state.task.id,
+            status=state.status,
+            previous_status=previous,
+            mode=state.mode,
+            agents=tuple(state.assigned_agents),
+            timestamp=state.updated_at,
+        ))
+    
+    def _persist(self, state: TaskState) -> None:
+        """Hand the task's current state to the task store (buffered, no I/O wait)."""
+        self.task_store.record(TaskRecord(
+            task=state.task,
+            status=state.status,
+            mode=state.mode,
+            result=state.result,
+            updated_at=state.updated_at,
+        ))
+    
+    async def _score_complexity(self, task: Task) -> ComplexityScore:
+        """Return the complexity score for a task, using the cache if enabled."""
+        if self.complexity_cache is None:
+            return await self._analyze_complexity(task)
+        
+        score = self.complexity_cache.get(task)
+        if score is None:
+            score = await self._analyze_complexity(task)
+            self.complexity_cache.put(task, score)
+        return score
     
     async def _analyze_complexity(self, task: Task) -> ComplexityScore:
         """
@@ -259,31 +1192,21 @@ class HACIOrchestrator:
         This is a simplified implementation. In production, this would use
         the Meta-Orchestrator LLM (Claude Opus) for sophisticated analysis.
         """
-        # Simple keyword-based complexity scoring for now
-        description = (task.title + " " + task.description).lower()
+        return self._compute_complexity(task)
+    
+    def _compute_complexity(self, task: Task) -> ComplexityScore:
+        """Keyword-based complexity scoring for a single task."""
+        # Simple keyword-based complexity scoring for now: one pass of the
+        # compiled matcher finds both domain and risk keywords
+        hits = self._keyword_matcher.scan(task.title + " " + task.description)
         
         # Domain detection
-        domains = []
-        domain_keywords = {
-            "logs": ["log", "error", "trace", "debug"],
-            "code": ["code", "function", "bug", "syntax", "deploy"],
-            "database": ["database", "query", "sql", "table", "schema"],
-            "infrastructure": ["server", "network", "cloud", "kubernetes", "docker"],
-            "security": ["security", "vulnerability", "auth", "permission"],
-            "api": ["api", "endpoint", "rest", "graphql", "502", "404"],
-            "performance": ["slow", "latency", "throughput", "memory", "cpu"],
-        }
-        
-        for domain, keywords in domain_keywords.items():
-            if any(kw in description for kw in keywords):
-                domains.append(domain)
-        
+        domains = [d for d in DOMAIN_KEYWORDS if ("domain", d) in hits]
         domain_count = max(1, len(domains))
         
         # Risk assessment
-        high_risk_keywords = ["production", "critical", "security", "data loss"]
         risk_level = "critical" if task.priority == "critical" else (
-            "high" if any(kw in description for kw in high_risk_keywords) else (
+            "high" if ("risk", "high") in hits else (
                 "medium" if domain_count > 2 else "low"
             )
         )
@@ -339,25 +1262,116 @@ class HACIOrchestrator:
         if complexity.estimated_agents_needed > 3:
             agents.append(AgentType.CODE_SPECIALIST)
         
-        # Add coordinator for swarm modes
+        # Deduplicate in selection order so the same ticket gets the same agents
+        specialists = list(dict.fromkeys(agents))
+        limit = complexity.estimated_agents_needed
+        
+        # Swarm modes always keep a coordinator within the agent budget
         if complexity.recommended_mode in [ExecutionMode.MICRO_SWARM, ExecutionMode.FULL_SWARM]:
-            if AgentType.SWARM_COORDINATOR not in agents:
-                agents.append(AgentType.SWARM_COORDINATOR)
+            return specialists[:max(1, limit - 1)] + [AgentType.SWARM_COORDINATOR]
+        return specialists[:limit]
+    
+    async def _ask_agent(self, state: TaskState, agent_type: AgentType) -> dict[str, Any]:
+        """
+        Put the task to one agent and record and return its finding.
+        
+        The request uses the agent's configured model, temperature and
+        max_tokens and goes through the response cache when it is enabled.
+        """
+        task = state.task
+        request = LLMRequest.from_agent_config(
+            self.config.get_agent_config(agent_type.value),
+            f"{task.title}\n\n{task.description}\n\nPriority: {task.priority}",
+            system=AGENT_SYSTEM_PROMPT.format(agent=agent_type.value.replace("_", " ")),
+        )
+        if self.response_cache is None:
+            response = await self.agent_backend.complete(agent_type, request)
+        else:
+            response, outcome = await self.response_cache.get_or_call(
+                request,
+                lambda: self.agent_backend.complete(agent_type, request),
+                label=agent_type.value,
+            )
+            state.cache_stats.setdefault(agent_type.value, CacheStats()).record(outcome)
+        root_cause, confidence = parse_finding(response.text)
+        finding = {
+            "agent": agent_type.value,
+            "finding": response.text,
+            "root_cause": root_cause,
+            "confidence": confidence,
+            "cached": response.cached,
+        }
+        state.findings.append(finding)
+        return finding
+    
+    async def _run_agents(
+        self,
+        state: TaskState,
+        agents: list[AgentType],
+        quorum: QuorumPolicy | None = None,
+        fan_out: AgentFanOut | None = None,
+    ) -> AgentFanOut:
+        """
+        Ask every agent at once; record each one's wall time in ms.
+        
+        Agents run in a TaskGroup, so the fan-out takes as long as the
+        slowest agent and findings are appended as each one answers. If an
+        agent fails, the others are cancelled and its error is raised. With
+        a quorum policy, agents still running are cancelled as soon as
+        enough confident agents agree on the root cause. A caller passing
+        ``fan_out`` can see who answered even if the fan-out is cancelled.
+        """
+        fan_out = fan_out if fan_out is not None else AgentFanOut()
+        tally = QuorumTally(quorum.agents, quorum.min_confidence) if quorum else None
+        running: dict[asyncio.Task[None], AgentType] = {}
         
-        return list(set(agents))[:complexity.estimated_agents_needed]
+        async def run(agent: AgentType) -> None:
+            start = time.perf_counter()
+            finding = await self._ask_agent(state, agent)
+            fan_out.timings_ms[agent.value] = round((time.perf_counter() - start) * 1000, 3)
+            if finding["confidence"] is not None:
+                fan_out.confidences[agent.value] = finding["confidence"]
+            if tally is None or not tally.add(
+                agent.value, finding["root_cause"], finding["confidence"]
+            ):
+                return
+            fan_out.quorum = tally.quorum
+            for task, other in running.items():
+                if not task.done() and task is not asyncio.current_task():
+                    task.cancel()
+                    fan_out.cancelled.append(other.value)
+        
+        try:
+            async with asyncio.TaskGroup() as group:
+                for agent in agents:
+                    running[group.create_task(run(agent))] = agent
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from e
+        if fan_out.quorum is not None:
+            logger.info(
+                "swarm_quorum_reached",
+                task_id=state.task.id,
+                agents=list(fan_out.quorum.agents),
+                cancelled=fan_out.cancelled,
+            )
+        return fan_out
+    
+    def _quorum_policy(self, mode: ExecutionMode) -> QuorumPolicy | None:
+        policy = self.config.execution.quorum.get(mode.value)
+        return policy if policy is not None and policy.enabled else None
     
     async def _execute_single_agent(
         self,
         state: TaskState,
         context: Any,
+        agents: list[AgentType] | None = None,
     ) -> dict[str, Any]:
         """Execute task with a single agent."""
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing
+        finding = await self._ask_agent(state, (agents or state.assigned_agents)[0])
         
         return {
             "summary": f"Investigated '{state.task.title}' using single agent mode.",
-            "confidence": 92.0,
+            "confidence": finding["confidence"] if finding["confidence"] is not None else 92.0,
             "steps": ["Analyzed task", "Investigated root cause", "Provided resolution"],
             "cost": 0.008,
             "metadata": {"mode": "single_agent"},
@@ -367,21 +1381,131 @@ class HACIOrchestrator:
         self,
         state: TaskState,
         context: Any,
+        agents: list[AgentType] | None = None,
+        fan_out: AgentFanOut | None = None,
     ) -> dict[str, Any]:
         """Execute task with a micro-swarm (2-3 agents)."""
-        await asyncio.sleep(0.2)
+        agents = agents or state.assigned_agents
+        fan_out = await self._run_agents(
+            state, agents, self._quorum_policy(ExecutionMode.MICRO_SWARM), fan_out
+        )
+        await asyncio.sleep(0.1)  # Placeholder: consolidate findings
         
         return {
             "summary": f"Resolved '{state.task.title}' with coordinated micro-swarm.",
-            "confidence": 88.0,
+            "confidence": fan_out.confidence(88.0),
             "steps": [
                 "Swarm coordinator dispatched agents",
                 "Parallel investigation across domains",
                 "Findings consolidated",
                 "Resolution implemented",
             ],
-            "cost": 0.025,
-            "metadata": {"mode": "micro_swarm", "agents": len(state.assigned_agents)},
+            # Cancelled agents cost nothing
+            "cost": fan_out.charged(MICRO_SWARM_COST, len(agents)),
+            "metadata": {
+                "mode": "micro_swarm",
+                "agents": len(agents),
+                **fan_out.metadata(),
+            },
+        }
+    
+    def _should_hedge(self, complexity: ComplexityScore) -> bool:
+        hedge = self.config.execution.hedge
+        return hedge.enabled and hedge.min_score <= complexity.overall_score <= hedge.max_score
+    
+    async def _execute_hedged(
+        self,
+        state: TaskState,
+        context: Any,
+    ) -> dict[str, Any]:
+        """
+        Race the single-agent path against a micro-swarm.
+        
+        The single agent (the first assigned agent) starts at once. The
+        micro-swarm of the remaining agents starts after
+        ``hedge.delay_seconds``, or earlier if the single agent answers below
+        ``hedge.min_confidence`` or fails. The first acceptable result wins
+        and the other path is cancelled. If neither is acceptable, the more
+        confident result is used. Both paths' findings are kept, and every
+        agent that answered is charged, including swarm agents that answered
+        before their path was cancelled.
+        """
+        hedge = self.config.execution.hedge
+        single_agents = state.assigned_agents[:1]
+        swarm_agents = state.assigned_agents[1:]
+        swarm_fan_out = AgentFanOut()
+        started = time.perf_counter()
+        paths: dict[asyncio.Task[dict[str, Any]], tuple[ExecutionMode, list[AgentType]]] = {
+            asyncio.create_task(
+                self._execute_single_agent(state, context, single_agents)
+            ): (ExecutionMode.SINGLE_AGENT, single_agents),
+        }
+        pending = set(paths)
+        finished: list[tuple[dict[str, Any], ExecutionMode, list[AgentType]]] = []
+        errors: list[BaseException] = []
+        winner: tuple[dict[str, Any], ExecutionMode, list[AgentType]] | None = None
+        swarm_launched_ms: float | None = None
+        cancelled: list[str] = []
+        try:
+            while pending and winner is None:
+                timeout = None
+                if swarm_launched_ms is None:
+                    timeout = max(0.0, hedge.delay_seconds - (time.perf_counter() - started))
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    mode, agents = paths[task]
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                        continue
+                    finished.append((task.result(), mode, agents))
+                    if task.result()["confidence"] >= hedge.min_confidence and winner is None:
+                        winner = finished[-1]
+                if winner is None and swarm_launched_ms is None:
+                    swarm_launched_ms = round((time.perf_counter() - started) * 1000, 3)
+                    swarm = asyncio.create_task(self._execute_micro_swarm(
+                        state, context, swarm_agents, swarm_fan_out
+                    ))
+                    paths[swarm] = (ExecutionMode.MICRO_SWARM, swarm_agents)
+                    pending.add(swarm)
+        finally:
+            for task, (mode, _) in paths.items():
+                if not task.done():
+                    task.cancel()
+                    cancelled.append(mode.value)
+            await asyncio.gather(*paths, return_exceptions=True)
+        
+        if winner is None:
+            if not finished:
+                raise errors[0]
+            winner = max(finished, key=lambda item: item[0]["confidence"])
+        result, state.mode, state.assigned_agents = winner
+        cost = sum(item[0].get("cost", 0.0) for item in finished)
+        if swarm_launched_ms is not None and all(
+            mode != ExecutionMode.MICRO_SWARM for _, mode, _ in finished
+        ):
+            # The swarm did not finish; pay for the agents that did answer
+            cost += swarm_fan_out.charged(MICRO_SWARM_COST, len(swarm_agents))
+        logger.info(
+            "hedge_resolved",
+            task_id=state.task.id,
+            winner=state.mode.value,
+            swarm_launched_ms=swarm_launched_ms,
+            cancelled=cancelled,
+        )
+        return {
+            **result,
+            "cost": round(cost, 6),
+            "metadata": {
+                **result.get("metadata", {}),
+                "hedge": {
+                    "winner": state.mode.value,
+                    "delay_seconds": hedge.delay_seconds,
+                    "swarm_launched_ms": swarm_launched_ms,
+                    "cancelled": cancelled,
+                },
+            },
         }
     
     async def _execute_full_swarm(
@@ -390,11 +1514,15 @@ class HACIOrchestrator:
         context: Any,
     ) -> dict[str, Any]:
         """Execute task with a full swarm (4+ agents)."""
-        await asyncio.sleep(0.5)
+        agents = state.assigned_agents
+        fan_out = await self._run_agents(
+            state, agents, self._quorum_policy(ExecutionMode.FULL_SWARM)
+        )
+        await asyncio.sleep(0.3)  # Placeholder: resolve disputes, consolidate
         
         return {
             "summary": f"Complex resolution for '{state.task.title}' via full swarm.",
-            "confidence": 85.0,
+            "confidence": fan_out.confidence(85.0),
             "steps": [
                 "Meta-orchestrator analyzed complexity",
                 "Full swarm activated",
@@ -402,8 +1530,12 @@ class HACIOrchestrator:
                 "Dispute resolution completed",
                 "Comprehensive resolution plan",
             ],
-            "cost": 0.15,
-            "metadata": {"mode": "full_swarm", "agents": len(state.assigned_agents)},
+            "cost": fan_out.charged(0.15, len(agents)),
+            "metadata": {
+                "mode": "full_swarm",
+                "agents": len(agents),
+                **fan_out.metadata(),
+            },
         }
     
     async def _execute_human_led(
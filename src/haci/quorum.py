@@ -0,0 +1,80 @@
+"""
+Quorum detection for swarm agents.
+
+Swarm agents report a root cause and a confidence. A ``QuorumTally``
+counts agreeing findings as they arrive. Once ``size`` agents have named
+the same root cause, each at ``min_confidence`` or above, it returns the
+``Quorum``, and the orchestrator cancels the agents still running.
+
+Agreement is exact after normalization (case, whitespace and trailing
+punctuation are ignored). Agents whose findings differ only in wording
+do not count as agreeing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+def normalize_root_cause(text: str) -> str:
+    """Lowercased, whitespace-collapsed root cause without trailing punctuation."""
+    return " ".join(text.lower().split()).rstrip(".!;:, ")
+
+
+@dataclass(frozen=True)
+class Quorum:
+    """The agents that agreed and what they agreed on."""
+    
+    root_cause: str
+    agents: tuple[str, ...]
+    confidence: float  # mean confidence of the agreeing agents
+    size: int
+    min_confidence: float
+    
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "root_cause": self.root_cause,
+            "agents": list(self.agents),
+            "confidence": round(self.confidence, 2),
+            "size": self.size,
+            "min_confidence": self.min_confidence,
+        }
+
+
+class QuorumTally:
+    """Counts confident, agreeing findings until a quorum is reached."""
+    
+    def __init__(self, size: int, min_confidence: float) -> None:
+        if size < 1:
+            raise ValueError("quorum size must be at least 1")
+        self.size = size
+        self.min_confidence = min_confidence
+        # normalized root cause -> [(agent, confidence, root cause as reported)]
+        self._votes: dict[str, list[tuple[str, float, str]]] = {}
+        self.quorum: Quorum | None = None
+    
+    def add(self, agent: str, root_cause: str | None, confidence: float | None) -> Quorum | None:
+        """
+        Record one agent's finding.
+        
+        Returns:
+            The quorum if this finding completed it, else None. Findings
+            after the quorum is reached are ignored.
+        """
+        if self.quorum is not None or not root_cause or confidence is None:
+            return None
+        if confidence < self.min_confidence:
+            return None
+        votes = self._votes.setdefault(normalize_root_cause(root_cause), [])
+        votes.append((agent, confidence, root_cause))
+        if len(votes) < self.size:
+            return None
+        self.quorum = Quorum(
+            root_cause=votes[0][2],
+            agents=tuple(vote[0] for vote in votes),
+            confidence=sum(vote[1] for vote in votes) / len(votes),
+            size=self.size,
+            min_confidence=self.min_confidence,
+        )
+        return self.quorum
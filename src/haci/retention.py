@@ -0,0 +1,231 @@
+"""
+Task retention for the HACI orchestrator.
+
+Terminal tasks are kept in memory only for a bounded time and count. Once a
+task falls out of the in-memory window its result is spilled to a SQLite
+store, when one is configured, so status and result lookups keep working
+for old task IDs without holding every ``TaskState`` in RAM.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable
+
+import structlog
+
+from haci.types import TaskResult
+
+logger = structlog.get_logger()
+
+
+class TaskRetention:
+    """
+    LRU + TTL bookkeeping for terminal tasks.
+    
+    Only tracks task IDs and last-use times; the owner decides what to do
+    with the IDs returned by ``collect_evictions``. A task expires once it
+    has gone ``ttl_seconds`` without being completed or looked up, and the
+    least recently used tasks are evicted beyond ``max_tasks``.
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_tasks: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_tasks < 0:
+            raise ValueError("max_tasks must not be negative")
+        self.ttl_seconds = ttl_seconds
+        self.max_tasks = max_tasks
+        self._clock = clock
+        # task_id -> last use, least recently used (and so oldest) first
+        self._entries: OrderedDict[str, float] = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._entries
+    
+    def retain(self, task_id: str) -> None:
+        """Start tracking a task that has reached a terminal status."""
+        self._entries[task_id] = self._clock()
+        self._entries.move_to_end(task_id)
+    
+    def touch(self, task_id: str) -> None:
+        """Mark a tracked task as recently used."""
+        if task_id in self._entries:
+            self._entries[task_id] = self._clock()
+            self._entries.move_to_end(task_id)
+    
+    def collect_evictions(self) -> list[str]:
+        """
+        Stop tracking expired and over-capacity tasks.
+        
+        Returns:
+            Task IDs that should leave memory, oldest first
+        """
+        evicted: list[str] = []
+        
+        if self.ttl_seconds > 0:
+            # Entries are ordered by last use, so stop at the first fresh one
+            cutoff = self._clock() - self.ttl_seconds
+            while self._entries:
+                task_id, last_used = next(iter(self._entries.items()))
+                if last_used > cutoff:
+                    break
+                del self._entries[task_id]
+                evicted.append(task_id)
+        
+        while len(self._entries) > self.max_tasks:
+            task_id, _ = self._entries.popitem(last=False)
+            evicted.append(task_id)
+        
+        return evicted
+
+
+class ResultSpillStore:
+    """
+    SQLite-backed store for results evicted from memory.
+    
+    Rows hold the serialized ``TaskResult``. Pass ``":memory:"`` to keep the
+    store in-process (still far more compact than live model objects) or a
+    file path to move evicted results to disk entirely.
+    
+    ``spill`` never waits on SQLite: results are buffered, readable through
+    ``get`` at once, and written in batches by a background task through
+    ``asyncio.to_thread``. Without a running event loop they are written
+    immediately. Results leave the buffer only once written; a failed write
+    is retried with backoff, up to ``MAX_WRITE_ATTEMPTS`` times per run of
+    the writer, and the next ``spill`` or ``flush`` tries again.
+    """
+    
+    MAX_WRITE_ATTEMPTS = 5
+    RETRY_DELAY_SECONDS = 0.1  # doubled after each failed attempt
+    
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_results (
+                task_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                result TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        # Spilled results not yet written; the writer drains this in batches
+        self._buffer: dict[str, TaskResult] = {}
+        self._writer: asyncio.Task[None] | None = None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM task_results").fetchone()
+        return int(row[0])
+    
+    def put_many(self, results: Iterable[TaskResult]) -> int:
+        """Write results in a single transaction, replacing existing rows."""
+        rows = [
+            (r.task_id, r.status.value, r.model_dump_json()) for r in results
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO task_results (task_id, status, result) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+    
+    def spill(self, results: Iterable[TaskResult]) -> int:
+        """Buffer results for a background write; returns how many."""
+        count = 0
+        for result in results:
+            self._buffer[result.task_id] = result
+            count += 1
+        if not count or (self._writer is not None and not self._writer.done()):
+            return count
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_buffered_now()
+            return count
+        self._writer = loop.create_task(self._write_buffered())
+        return count
+    
+    async def flush(self) -> None:
+        """Wait until every spilled result has been written."""
+        if self._writer is not None:
+            await self._writer
+        if self._buffer:
+            await self._write_buffered()
+    
+    async def _write_buffered(self) -> None:
+        # Results spilled while a batch is being written go in the next batch
+        failures = 0
+        while self._buffer:
+            batch = list(self._buffer.values())
+            try:
+                await asyncio.to_thread(self.put_many, batch)
+            except Exception as e:
+                failures += 1
+                logger.error(
+                    "result_spill_failed",
+                    error=str(e),
+                    results=len(batch),
+                    attempt=failures,
+                )
+                if failures >= self.MAX_WRITE_ATTEMPTS:
+                    return
+                await asyncio.sleep(self.RETRY_DELAY_SECONDS * 2 ** (failures - 1))
+                continue
+            failures = 0
+            self._drop_written(batch)
+    
+    def _write_buffered_now(self) -> None:
+        batch = list(self._buffer.values())
+        try:
+            self.put_many(batch)
+        except Exception as e:
+            logger.error("result_spill_failed", error=str(e), results=len(batch))
+            return
+        self._drop_written(batch)
+    
+    def _drop_written(self, batch: list[TaskResult]) -> None:
+        for result in batch:
+            if self._buffer.get(result.task_id) is result:
+                del self._buffer[result.task_id]
+    
+    def get(self, task_id: str) -> TaskResult | None:
+        """Load a spilled result, or None if the task was never spilled."""
+        buffered = self._buffer.get(task_id)
+        if buffered is not None:
+            return buffered
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM task_results WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return TaskResult.model_validate_json(row[0])
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,261 @@
+"""
+HTTP API for a long-lived HACI orchestrator.
+
+``create_app`` builds a FastAPI application around one ``HACIOrchestrator``
+that lives as long as the process, so tasks submitted by one request can be
+looked up, awaited and approved by later ones. ``run`` serves it with
+uvicorn; ``haci server`` is a thin wrapper around it.
+
+Responses skip FastAPI's generic ``jsonable_encoder`` path. Pydantic models
+(``Task``, ``TaskResult``) are serialized directly by pydantic-core, and
+plain dicts go through orjson when it is installed.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, ValidationError
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+from haci.types import TaskStatus
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in the perf extra
+    orjson = None  # type: ignore[assignment]
+
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, separators=(",", ":")).encode()
+
+
+def _model_response(model: BaseModel, status_code: int = 200) -> Response:
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+class TaskSubmission(BaseModel):
+    """Body of ``POST /tasks``."""
+    
+    title: str = "Untitled Task"
+    description: str = ""
+    priority: str = "medium"
+    type: str = "general"
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+class RejectBody(BaseModel):
+    """Body of single and bulk reject requests."""
+    
+    reason: str = ""
+    filter: str | None = None
+
+
+class ApproveBody(BaseModel):
+    """Body of ``POST /approvals/approve``."""
+    
+    filter: str
+
+
+def create_app(
+    config: HACIConfig | None = None,
+    orchestrator: HACIOrchestrator | None = None,
+) -> FastAPI:
+    """
+    Build the HACI API application.
+    
+    Args:
+        config: Configuration for the orchestrator (ignored if one is given)
+        orchestrator: Orchestrator to serve; created from ``config`` if None
+    """
+    orchestrator = orchestrator or HACIOrchestrator(config)
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        await orchestrator.close()
+    
+    app = FastAPI(
+        title="HACI",
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
+    )
+    app.state.orchestrator = orchestrator
+    
+    @app.get("/health")
+    async def health() -> Response:
+        stats = orchestrator.scheduler.stats()
+        return FastJSONResponse({
+            "status": "ok",
+            "in_flight": stats.in_flight,
+            "queue_depth": stats.queue_depth,
+        })
+    
+    @app.post("/tasks", status_code=202)
+    async def submit_task(body: TaskSubmission) -> Response:
+        task = orchestrator.submit(body.model_dump())
+        return _model_response(task, status_code=202)
+    
+    @app.post("/tasks/batch", status_code=202)
+    async def submit_tasks(request: Request) -> Response:
+        # Validated once, as a whole, by submit_many rather than per item here
+        try:
+            tasks_data = _loads(await request.body())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+        if not isinstance(tasks_data, list) or not all(
+            isinstance(item, dict) for item in tasks_data
+        ):
+            raise HTTPException(status_code=422, detail="Expected a list of task objects")
+        try:
+            tasks = orchestrator.submit_many(tasks_data)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422, detail=json.loads(e.json(include_url=False))
+            )
+        return FastJSONResponse(
+            {"task_ids": [task.id for task in tasks]}, status_code=202
+        )
+    
+    @app.get("/tasks/{task_id}/status")
+    async def task_status(task_id: str) -> Response:
+        try:
+            status = await orchestrator.fetch_status(task_id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+        return FastJSONResponse({"task_id": task_id, "status": status.value})
+    
+    @app.get("/tasks/{task_id}/result")
+    async def task_result(
+        task_id: str,
+        wait: float = Query(default=0.0, ge=0, description="Seconds to wait for completion"),
+    ) -> Response:
+        try:
+            status = await orchestrator.fetch_status(task_id)
+            if status not in _TERMINAL_STATUSES and not wait:
+                return FastJSONResponse(
+                    {"task_id": task_id, "status": status.value}, status_code=202
+                )
+            result = await orchestrator.await_result(task_id, timeout=wait or None)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+        except TimeoutError:
+            status = await orchestrator.fetch_status(task_id)
+            return FastJSONResponse(
+                {"task_id": task_id, "status": status.value}, status_code=202
+            )
+        except RuntimeError as e:
+            # Known to the task store but not running in this process
+            raise HTTPException(status_code=409, detail=str(e))
+        return _model_response(result)
+    
+    @app.get("/approvals")
+    async def list_approvals(
+        filter: str | None = None,
+        limit: int = Query(default=50, ge=1, le=1000),
+        cursor: str | None = None,
+    ) -> Response:
+        try:
+            page = orchestrator.harness.list_approvals(filter, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return FastJSONResponse({
+            "items": [item.model_dump(mode="json") for item in page.items],
+            "next_cursor": page.next_cursor,
+            "total": page.total,
+        })
+    
+    @app.post("/approvals/approve")
+    async def approve_many(body: ApproveBody) -> Response:
+        if not body.filter:
+            raise HTTPException(status_code=422, detail="A filter is required")
+        try:
+            approved = orchestrator.harness.approve_many(body.filter)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return FastJSONResponse({"approved": approved})
+    
+    @app.post("/approvals/reject")
+    async def reject_many(body: RejectBody) -> Response:
+        if not body.filter:
+            raise HTTPException(status_code=422, detail="A filter is required")
+        try:
+            rejected = orchestrator.harness.reject_many(body.filter, reason=body.reason)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return FastJSONResponse({"rejected": rejected})
+    
+    @app.post("/approvals/{approval_id}/approve")
+    async def approve(approval_id: str) -> Response:
+        if not orchestrator.harness.approve(approval_id):
+            raise HTTPException(
+                status_code=404, detail=f"No pending approval: {approval_id}"
+            )
+        return FastJSONResponse({"approved": [approval_id]})
+    
+    @app.post("/approvals/{approval_id}/reject")
+    async def reject(approval_id: str, body: RejectBody | None = None) -> Response:
+        reason = body.reason if body else ""
+        if not orchestrator.harness.reject(approval_id, reason=reason):
+            raise HTTPException(
+                status_code=404, detail=f"No pending approval: {approval_id}"
+            )
+        return FastJSONResponse({"rejected": [approval_id]})
+    
+    return app
+
+
+def event_loop_setting(choice: str) -> str:
+    """
+    Map ``server.event_loop`` to uvicorn's ``loop`` setting.
+    
+    ``auto`` uses uvloop when it is installed; ``uvloop`` requires it.
+    
+    Raises:
+        RuntimeError: If ``uvloop`` is requested but not installed.
+    """
+    if choice == "asyncio":
+        return "asyncio"
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        if choice == "uvloop":
+            raise RuntimeError("server.event_loop is 'uvloop' but uvloop is not installed")
+        return "asyncio"
+    return "uvloop"
+
+
+def run(config: HACIConfig, host: str | None = None, port: int | None = None) -> None:
+    """Serve the API with uvicorn until interrupted."""
+    import uvicorn
+    
+    server_config = config.server
+    uvicorn.run(
+        create_app(config),
+        host=host or server_config.host,
+        port=port if port is not None else server_config.port,
+        loop=event_loop_setting(server_config.event_loop),
+        timeout_keep_alive=server_config.keep_alive_seconds,
+        access_log=server_config.access_log,
+        log_level=config.log_level.lower(),
+    )
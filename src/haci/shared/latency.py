@@ -0,0 +1,85 @@
+"""
+Fixed-memory latency histograms.
+
+A ``LatencyHistogram`` counts observations in log-spaced buckets, four per
+doubling, from 0.1 ms up to about 17 minutes. Recording is one bisect and
+memory does not grow with traffic. Percentiles are read from bucket upper
+bounds and are clamped to the largest observation, so they are accurate to
+within one bucket (about 19%).
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any
+
+_MIN_MS = 0.1
+_STEPS_PER_DOUBLING = 4
+_BUCKETS = 94  # 0.1 ms * 2 ** (93 / 4) ~= 17 min
+
+# Upper bounds of each bucket in milliseconds; the last catches everything above
+BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(
+    _MIN_MS * 2 ** (i / _STEPS_PER_DOUBLING) for i in range(_BUCKETS)
+)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency distribution in milliseconds."""
+    
+    def __init__(self) -> None:
+        self._counts = [0] * (_BUCKETS + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def observe(self, latency_ms: float) -> None:
+        """Record one latency."""
+        self._counts[bisect.bisect_left(BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+    
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+    
+    def percentile(self, pct: float) -> float:
+        """Latency at or below which ``pct`` percent of observations fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for i, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[i] if i < _BUCKETS else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+    
+    def buckets(self) -> list[tuple[float, int]]:
+        """Non-empty (upper bound ms, count) pairs; the overflow bound is inf."""
+        return [
+            (BUCKET_BOUNDS_MS[i] if i < _BUCKETS else float("inf"), n)
+            for i, n in enumerate(self._counts)
+            if n
+        ]
+    
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's observations to this one."""
+        for i, n in enumerate(other._counts):
+            self._counts[i] += n
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+    
+    def snapshot(self) -> dict[str, Any]:
+        """Summary suitable for metrics export."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
@@ -0,0 +1,156 @@
+"""
+Multi-pattern keyword matching.
+
+``KeywordMatcher`` compiles a keyword taxonomy into an Aho-Corasick automaton
+once, then finds every keyword in a text in a single pass, regardless of how
+many keywords the taxonomy holds. Matches must sit on word boundaries, so
+"auth" does not fire inside "author" and "log" does not fire inside
+"catalog". Plural and verb inflections are still accepted through light
+stemming: "logs", "deployed", "debugging", "queries" and "coding" all match
+their keyword. Derived words such as "deployment" do not, and keywords
+declared as nouns accept only plural endings, so "rest" does not match
+"resting".
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Hashable, Iterable, Mapping
+
+# Plural and verb suffixes a keyword may carry and still count as a
+# whole-word match
+INFLECTION_SUFFIXES = ("s", "es", "ed", "ing")
+PLURAL_SUFFIXES = ("s", "es")
+# Suffixes that double a final consonant ("debug" -> "debugging") or replace
+# a final "e" ("code" -> "coding") or "y" ("query" -> "queries")
+_VOWEL_SUFFIXES = ("ed", "ing")
+_Y_SUFFIXES = ("es", "ed")
+_VOWELS = frozenset("aeiou")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive, word-boundary-aware Aho-Corasick matcher.
+    
+    Built from a mapping of tag -> keywords; a keyword may belong to several
+    tags. Keywords listed in ``nouns`` accept plural endings only, for
+    words whose verb forms mean something else. ``scan`` returns, per tag,
+    the distinct keywords found.
+    """
+    
+    def __init__(
+        self,
+        taxonomy: Mapping[Hashable, Iterable[str]],
+        nouns: Iterable[str] = (),
+    ) -> None:
+        nouns = {noun.lower() for noun in nouns}
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Per state: (surface length, keyword, accepted suffixes) for every
+        # surface form of a keyword ending here
+        self._output: list[list[tuple[int, str, frozenset[str]]]] = [[]]
+        self._tags: dict[str, list[Hashable]] = {}
+        
+        for tag, keywords in taxonomy.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                if keyword not in self._tags:
+                    self._tags[keyword] = []
+                    for surface, suffixes in _surface_forms(keyword, keyword in nouns):
+                        self._add(surface, keyword, suffixes)
+                if tag not in self._tags[keyword]:
+                    self._tags[keyword].append(tag)
+        self._build_failure_links()
+    
+    def __len__(self) -> int:
+        return len(self._tags)
+    
+    def find(self, text: str) -> list[str]:
+        """Return matched keywords in order of their end position in text."""
+        text = text.lower()
+        n = len(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        found: list[str] = []
+        state = 0
+        
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            
+            for length, keyword, suffixes in output[state]:
+                start = i - length + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                end = i + 1
+                word_end = end
+                while word_end < n and _is_word_char(text[word_end]):
+                    word_end += 1
+                if text[end:word_end] in suffixes:
+                    found.append(keyword)
+        return found
+    
+    def scan(self, text: str) -> dict[Hashable, list[str]]:
+        """Return tag -> distinct matched keywords, in first-match order."""
+        hits: dict[Hashable, list[str]] = {}
+        for keyword in self.find(text):
+            for tag in self._tags[keyword]:
+                tag_hits = hits.setdefault(tag, [])
+                if keyword not in tag_hits:
+                    tag_hits.append(keyword)
+        return hits
+    
+    def _add(self, surface: str, keyword: str, suffixes: frozenset[str]) -> None:
+        state = 0
+        for ch in surface:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append((len(surface), keyword, suffixes))
+    
+    def _build_failure_links(self) -> None:
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, nxt in self._goto[state].items():
+                pending.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+
+def _surface_forms(
+    keyword: str,
+    noun: bool = False,
+) -> list[tuple[str, frozenset[str]]]:
+    """Strings to search for a keyword, each with the suffixes it may carry."""
+    last = keyword[-1]
+    y_stem = len(keyword) > 2 and last == "y" and keyword[-2] not in _VOWELS
+    if noun:
+        forms = [(keyword, frozenset({"", *PLURAL_SUFFIXES}))]
+        if y_stem:
+            forms.append((keyword[:-1] + "i", frozenset({"es"})))
+        return forms
+    
+    suffixes = {"", *INFLECTION_SUFFIXES}
+    if last.isalpha() and last not in _VOWELS and last not in "wxy":
+        suffixes.update(last + suffix for suffix in _VOWEL_SUFFIXES)
+    forms = [(keyword, frozenset(suffixes))]
+    if len(keyword) > 2 and last == "e":
+        forms.append((keyword[:-1], frozenset(_VOWEL_SUFFIXES)))
+    elif y_stem:
+        forms.append((keyword[:-1] + "i", frozenset(_Y_SUFFIXES)))
+    return forms
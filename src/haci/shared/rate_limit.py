@@ -0,0 +1,84 @@
+"""
+Token-bucket rate limiting.
+
+A ``TokenBucket`` refills continuously at ``rate`` tokens per second up to
+``capacity``. State is two floats and every check is O(1): tokens are
+topped up lazily from the elapsed time whenever the bucket is consulted.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+
+class TokenBucket:
+    """Continuously refilling token bucket."""
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+    
+    @classmethod
+    def per_minute(
+        cls,
+        limit: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> TokenBucket:
+        """Bucket allowing ``limit`` acquisitions per minute, bursting to ``limit``."""
+        return cls(rate=limit / 60.0, capacity=float(limit), clock=clock)
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+    
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available. Returns False without waiting otherwise."""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+    
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` will be available (0 if they are now)."""
+        self._refill()
+        missing = tokens - self._tokens
+        return max(0.0, missing / self.rate)
+    
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+
+@dataclass
+class RateLimitStats:
+    """Counters for rate-limited gating decisions."""
+    
+    checks: int = 0
+    waits: int = 0
+    rejections: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    
+    def record_wait(self, seconds: float) -> None:
+        """Account for one wait of the given length."""
+        self.waits += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
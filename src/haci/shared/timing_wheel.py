@@ -0,0 +1,152 @@
+"""
+Hierarchical timing wheel.
+
+``TimingWheel`` schedules keys to expire at a deadline. Timers are hashed into
+a few levels of slot arrays (256 one-tick slots, then 64 slots per coarser
+level), so scheduling and cancelling are O(1) and each tick only touches the
+slot that is due. Timers in coarse levels are cascaded down a level as their
+slot comes round, which costs O(1) amortised per timer per level.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Hashable, Sequence
+
+DEFAULT_WHEEL_SIZES = (256, 64, 64, 64)
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel keyed by hashable ids.
+    
+    Deadlines are in the units of ``clock`` (seconds of ``time.monotonic`` by
+    default) and are rounded up to whole ticks, so a timer never fires early.
+    Deadlines beyond the wheel's range are parked in the top level and
+    re-hashed each time that slot comes round.
+    """
+    
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        wheel_sizes: Sequence[int] = DEFAULT_WHEEL_SIZES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if tick_seconds <= 0:
+            raise ValueError("tick_seconds must be positive")
+        if not wheel_sizes or any(size < 2 for size in wheel_sizes):
+            raise ValueError("wheel_sizes must be a non-empty list of sizes >= 2")
+        self.tick_seconds = tick_seconds
+        self._clock = clock
+        self._sizes = tuple(wheel_sizes)
+        # Ticks covered by one slot of each level
+        self._granularity: list[int] = []
+        span = 1
+        for size in self._sizes:
+            self._granularity.append(span)
+            span *= size
+        self._range = span
+        self._levels: list[list[dict[Hashable, int]]] = [
+            [{} for _ in range(size)] for size in self._sizes
+        ]
+        # key -> (level, slot), or (-1, 0) for timers already due
+        self._location: dict[Hashable, tuple[int, int]] = {}
+        self._due: dict[Hashable, int] = {}
+        self._tick = self._to_tick(clock())
+    
+    def __len__(self) -> int:
+        return len(self._location)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._location
+    
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Schedule ``key`` to expire at ``deadline``, replacing any earlier timer."""
+        self.cancel(key)
+        if not self._location:
+            # Nothing is pending, so no slot needs visiting on the way: catch
+            # up with the clock now rather than walking every idle tick later
+            self._tick = max(self._tick, self._to_tick(self._clock()))
+        self._place(key, math.ceil(deadline / self.tick_seconds))
+    
+    def cancel(self, key: Hashable) -> bool:
+        """Remove the timer for ``key``. Returns False if none was scheduled."""
+        location = self._location.pop(key, None)
+        if location is None:
+            return False
+        level, slot = location
+        if level < 0:
+            del self._due[key]
+        else:
+            del self._levels[level][slot][key]
+        return True
+    
+    def advance(self, now: float | None = None) -> list[Hashable]:
+        """
+        Move the wheel forward to ``now`` and return the keys that expired.
+        
+        Only the slots for the elapsed ticks are visited; an empty wheel jumps
+        straight to ``now``.
+        """
+        target = self._to_tick(self._clock() if now is None else now)
+        expired: list[Hashable] = []
+        self._drain_due(expired)
+        
+        while self._tick < target:
+            if not self._location:
+                self._tick = target
+                break
+            self._tick += 1
+            self._cascade()
+            self._drain_due(expired)
+            slot = self._levels[0][self._tick % self._sizes[0]]
+            if slot:
+                for key in slot:
+                    del self._location[key]
+                expired.extend(slot)
+                slot.clear()
+        return expired
+    
+    def _drain_due(self, expired: list[Hashable]) -> None:
+        if self._due:
+            for key in self._due:
+                del self._location[key]
+            expired.extend(self._due)
+            self._due.clear()
+    
+    def _to_tick(self, seconds: float) -> int:
+        return math.floor(seconds / self.tick_seconds)
+    
+    def _place(self, key: Hashable, deadline_tick: int) -> None:
+        delta = deadline_tick - self._tick
+        if delta <= 0:
+            self._due[key] = deadline_tick
+            self._location[key] = (-1, 0)
+            return
+        
+        for level, (size, granularity) in enumerate(zip(self._sizes, self._granularity)):
+            if delta < granularity * size:
+                slot = (deadline_tick // granularity) % size
+                break
+        else:
+            # Beyond the wheel's range: park in the furthest top-level slot
+            level = len(self._sizes) - 1
+            slot = ((self._tick + self._range - 1) // self._granularity[level]) % self._sizes[level]
+        self._levels[level][slot][key] = deadline_tick
+        self._location[key] = (level, slot)
+    
+    def _cascade(self) -> None:
+        # Re-hash coarse slots whose span starts at this tick, top level first
+        for level in range(len(self._sizes) - 1, 0, -1):
+            granularity = self._granularity[level]
+            if self._tick % granularity:
+                continue
+            slot = self._levels[level][(self._tick // granularity) % self._sizes[level]]
+            if not slot:
+                continue
+            timers = list(slot.items())
+            slot.clear()
+            for key, deadline_tick in timers:
+                del self._location[key]
+                self._place(key, deadline_tick)
@@ -0,0 +1,338 @@
+"""
+Persistent task state for the HACI orchestrator.
+
+A ``TaskStore`` keeps the latest ``TaskRecord`` for every task so status and
+results survive a restart. Writes go through ``record``/``record_many``,
+which never wait on I/O: the SQLAlchemy backend coalesces them per task and
+a background flusher upserts each batch with one executemany of a single
+prepared statement, so database round-trips scale with batches rather than
+with state transitions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable
+
+import structlog
+
+from haci.types import ExecutionMode, Task, TaskResult, TaskStatus
+
+if TYPE_CHECKING:
+    from haci.config import HACIConfig
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class TaskRecord:
+    """Latest persisted state of one task."""
+    
+    task: Task
+    status: TaskStatus = TaskStatus.PENDING
+    mode: ExecutionMode = ExecutionMode.AUTO
+    result: TaskResult | None = None
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    
+    @property
+    def task_id(self) -> str:
+        return self.task.id
+
+
+class TaskStore(ABC):
+    """Storage backend for task records."""
+    
+    @abstractmethod
+    def record(self, record: TaskRecord) -> None:
+        """Store the latest state of a task. Must not block on I/O."""
+    
+    def record_many(self, records: Iterable[TaskRecord]) -> None:
+        """Store several task states."""
+        for record in records:
+            self.record(record)
+    
+    @abstractmethod
+    async def get(self, task_id: str) -> TaskRecord | None:
+        """Return the latest record for a task, or None if unknown."""
+    
+    async def get_status(self, task_id: str) -> TaskStatus | None:
+        """Return a task's latest status, or None if unknown."""
+        record = await self.get(task_id)
+        return record.status if record else None
+    
+    async def get_result(self, task_id: str) -> TaskResult | None:
+        """Return a task's result, or None if it has none yet."""
+        record = await self.get(task_id)
+        return record.result if record else None
+    
+    def evict(self, task_ids: Iterable[str]) -> None:
+        """
+        Forget finished tasks the orchestrator has moved out of memory.
+        
+        Called with the task IDs task retention evicts, whose results now
+        live in the spill store if one is configured. Persistent backends
+        keep their rows, so the default does nothing.
+        """
+    
+    async def flush(self) -> None:
+        """Wait until every recorded state has been written."""
+    
+    async def close(self) -> None:
+        """Flush and release resources."""
+
+
+class InMemoryTaskStore(TaskStore):
+    """
+    Task records in a process-local dict; nothing survives a restart.
+    
+    Records of evicted tasks are dropped, so the store is bounded by task
+    retention like the orchestrator's own task table.
+    """
+    
+    def __init__(self) -> None:
+        self._records: dict[str, TaskRecord] = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def record(self, record: TaskRecord) -> None:
+        self._records[record.task_id] = record
+    
+    async def get(self, task_id: str) -> TaskRecord | None:
+        return self._records.get(task_id)
+    
+    def evict(self, task_ids: Iterable[str]) -> None:
+        for task_id in task_ids:
+            self._records.pop(task_id, None)
+
+
+class SQLAlchemyTaskStore(TaskStore):
+    """
+    Task records in a SQL database through SQLAlchemy's asyncio engine.
+    
+    Connections come from a bounded pool (``pool_size`` plus up to
+    ``max_overflow``). Recorded states are buffered per task, so repeated
+    transitions of one task between flushes cost one row, and are written by
+    a background flusher every ``flush_interval_seconds`` or as soon as
+    ``batch_size`` tasks are pending. Reads see buffered states first.
+    
+    PostgreSQL (asyncpg) and SQLite (aiosqlite) URLs are supported; plain
+    ``postgresql://`` and ``sqlite://`` URLs get the async driver added.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.05,
+        table_name: str = "haci_tasks",
+    ) -> None:
+        try:
+            import sqlalchemy as sa
+            from sqlalchemy.ext.asyncio import create_async_engine
+        except ImportError as e:  # pragma: no cover - sqlalchemy is a core dependency
+            raise ImportError("SQLAlchemyTaskStore requires sqlalchemy[asyncio]") from e
+        
+        self.url = _async_url(url)
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        
+        engine_options: dict[str, Any] = {}
+        if self.url.startswith("sqlite"):
+            if ":memory:" in self.url or self.url.endswith("://"):
+                # One shared connection, or each checkout would see an empty database
+                engine_options["poolclass"] = sa.pool.StaticPool
+        else:
+            engine_options.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,
+            )
+        self._engine = create_async_engine(self.url, **engine_options)
+        
+        self._metadata = sa.MetaData()
+        self._table = sa.Table(
+            table_name,
+            self._metadata,
+            sa.Column("task_id", sa.String(64), primary_key=True),
+            sa.Column("status", sa.String(32), nullable=False, index=True),
+            sa.Column("mode", sa.String(32), nullable=False),
+            sa.Column("task", sa.Text, nullable=False),
+            sa.Column("result", sa.Text, nullable=True),
+            sa.Column("updated_at", sa.DateTime, nullable=False),
+        )
+        self._upsert = self._build_upsert()
+        self._select = sa.select(self._table).where(
+            self._table.c.task_id == sa.bindparam("task_id")
+        )
+        
+        self._pending: dict[str, TaskRecord] = {}
+        self._writing: dict[str, TaskRecord] = {}  # batch being written
+        self._wake: asyncio.Event | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self._closing = False
+        self._schema_ready = False
+        self._write_lock: asyncio.Lock | None = None
+        self.rows_written = 0
+        self.batches_written = 0
+        self.write_errors = 0
+    
+    @property
+    def pending(self) -> int:
+        """Number of tasks with states waiting to be written."""
+        return len(self._pending)
+    
+    def record(self, record: TaskRecord) -> None:
+        self._pending[record.task_id] = record
+        self._ensure_flusher()
+        if len(self._pending) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+    
+    async def get(self, task_id: str) -> TaskRecord | None:
+        buffered = self._pending.get(task_id) or self._writing.get(task_id)
+        if buffered is not None:
+            return buffered
+        await self._ensure_schema()
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(self._select, {"task_id": task_id})).first()
+        return _row_to_record(row) if row is not None else None
+    
+    async def flush(self) -> None:
+        await self._write_pending()
+    
+    async def close(self) -> None:
+        # Let the flusher finish any write in progress rather than cancel it
+        self._closing = True
+        if self._flusher is not None and self._wake is not None:
+            self._wake.set()
+            await self._flusher
+            self._flusher = None
+        await self._write_pending()
+        await self._engine.dispose()
+    
+    def _build_upsert(self) -> Any:
+        """Build the insert-or-update statement once; it is reused for every batch."""
+        if self.url.startswith("postgresql"):
+            from sqlalchemy.dialects.postgresql import insert
+        elif self.url.startswith("sqlite"):
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            raise ValueError(f"Unsupported task store database: {self.url}")
+        
+        stmt = insert(self._table)
+        return stmt.on_conflict_do_update(
+            index_elements=[self._table.c.task_id],
+            set_={
+                "status": stmt.excluded.status,
+                "mode": stmt.excluded.mode,
+                "result": stmt.excluded.result,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    
+    def _ensure_flusher(self) -> None:
+        if self._closing or (self._flusher is not None and not self._flusher.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet: states stay buffered until flush() or the next record()
+            return
+        self._wake = asyncio.Event()
+        self._flusher = loop.create_task(self._run_flusher())
+    
+    async def _run_flusher(self) -> None:
+        assert self._wake is not None
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._pending:
+                await self._write_pending()
+    
+    async def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        async with self._engine.begin() as conn:
+            await conn.run_sync(self._metadata.create_all)
+        self._schema_ready = True
+    
+    async def _write_pending(self) -> None:
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        async with self._write_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            self._writing = batch
+            try:
+                await self._ensure_schema()
+                async with self._engine.begin() as conn:
+                    await conn.execute(
+                        self._upsert,
+                        [_record_to_row(record) for record in batch.values()],
+                    )
+            except Exception as e:
+                self.write_errors += 1
+                logger.error("task_store_write_failed", error=str(e), tasks=len(batch))
+                # Keep the states for the next attempt unless newer ones arrived
+                for task_id, record in batch.items():
+                    self._pending.setdefault(task_id, record)
+                return
+            finally:
+                self._writing = {}
+            self.rows_written += len(batch)
+            self.batches_written += 1
+
+
+def create_task_store(config: HACIConfig) -> TaskStore:
+    """Build the task store described by the configuration."""
+    store_config = config.task_store
+    if store_config.backend == "memory":
+        return InMemoryTaskStore()
+    return SQLAlchemyTaskStore(
+        url=store_config.url or config.database.url,
+        pool_size=config.database.pool_size,
+        max_overflow=config.database.max_overflow,
+        batch_size=store_config.batch_size,
+        flush_interval_seconds=store_config.flush_interval_seconds,
+    )
+
+
+def _async_url(url: str) -> str:
+    for plain, driver in (
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("postgres://", "postgresql+asyncpg://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if url.startswith(plain):
+            return driver + url[len(plain):]
+    return url
+
+
+def _record_to_row(record: TaskRecord) -> dict[str, Any]:
+    return {
+        "task_id": record.task_id,
+        "status": record.status.value,
+        "mode": record.mode.value,
+        "task": record.task.model_dump_json(),
+        "result": record.result.model_dump_json() if record.result else None,
+        "updated_at": record.updated_at,
+    }
+
+
+def _row_to_record(row: Any) -> TaskRecord:
+    return TaskRecord(
+        task=Task.model_validate_json(row.task),
+        status=TaskStatus(row.status),
+        mode=ExecutionMode(row.mode),
+        result=TaskResult.model_validate_json(row.result) if row.result else None,
+        updated_at=row.updated_at,
+    )
@@ -0,0 +1,348 @@
+"""
+Multi-process task execution for the HACI orchestrator.
+
+In worker-pool mode the orchestrator process only accepts submissions,
+schedules them and tracks results. Each task is sent to the least loaded
+of N worker processes over that worker's own multiprocessing queue. Each
+worker runs its own event loop and in-process orchestrator, so complexity
+analysis, result construction, validation and log formatting are spread
+across cores. Finished ``TaskResult``s come back over a shared result
+queue. A reader thread routes them to the future the front end is
+awaiting. Both directions send everything produced in one event-loop
+iteration as one message per worker, so the per-message cost of the queues
+is paid per batch rather than per task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import multiprocessing.connection
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from haci.types import ExecutionMode, Task, TaskResult, TaskStatus
+
+if TYPE_CHECKING:
+    from haci.config import HACIConfig
+
+logger = structlog.get_logger()
+
+# How often the watcher picks up respawned workers while waiting on sentinels
+_HEALTH_CHECK_SECONDS = 1.0
+
+
+class WorkerPoolError(RuntimeError):
+    """Raised when tasks cannot be run because the worker processes are gone."""
+
+
+class WorkerPool:
+    """
+    Pool of worker processes that run tasks end to end.
+    
+    Each worker has its own task queue. Every task is assigned to the
+    worker with the fewest tasks in flight, so a wave of submissions is
+    spread across the pool. A watcher thread waits on the workers' process
+    sentinels. When a worker exits, the tasks it owned fail with
+    ``WorkerPoolError`` and the worker is replaced the next time work is
+    sent to it. Each worker runs up to ``execution.max_concurrent_tasks``
+    tasks at once. Processes are started with the ``spawn`` method on
+    first use, from a worker thread so the event loop keeps running while
+    they boot; the same goes for respawns.
+    """
+    
+    def __init__(self, config: HACIConfig, processes: int) -> None:
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.processes = processes
+        self._config_data = config.model_dump(mode="json")
+        self._ctx = multiprocessing.get_context("spawn")
+        self._results: Any = None
+        # Per worker slot: its process (None once it has exited) and task queue
+        self._workers: list[Any] = []
+        self._queues: list[Any] = []
+        self._reader: threading.Thread | None = None
+        self._watcher: threading.Thread | None = None
+        self._starting: asyncio.Task[None] | None = None
+        # Slot -> task JSON waiting for that slot's worker to be respawned
+        self._respawning: dict[int, list[str]] = {}
+        self._pending: dict[str, asyncio.Future[TaskResult]] = {}
+        # task id -> worker slot running it, and tasks in flight per slot
+        self._owner: dict[str, int] = {}
+        self._load: list[int] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Worker slot -> task JSON sent at the end of this loop iteration
+        self._outbox: dict[int, list[str]] = {}
+        self._closed = False
+        self.tasks_sent = 0
+        self.results_received = 0
+        self.worker_restarts = 0
+    
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+    
+    async def start(self) -> None:
+        """Start the worker processes, the result reader and the watcher."""
+        if self._workers:
+            return
+        if self._closed:
+            raise WorkerPoolError("Worker pool is closed")
+        # Concurrent first callers share one start-up
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(asyncio.to_thread(self._start))
+        try:
+            await asyncio.shield(self._starting)
+        except Exception:
+            self._starting = None
+            raise
+    
+    def _start(self) -> None:
+        self._results = self._ctx.Queue()
+        spawned = [self._spawn(index) for index in range(self.processes)]
+        # Published together, so ``started`` only turns true once all are up
+        self._queues = [tasks for tasks, _ in spawned]
+        self._load = [0] * self.processes
+        self._workers = [worker for _, worker in spawned]
+        self._reader = threading.Thread(
+            target=self._read_results, name="haci-worker-results", daemon=True
+        )
+        self._reader.start()
+        self._watcher = threading.Thread(
+            target=self._watch_workers, name="haci-worker-watcher", daemon=True
+        )
+        self._watcher.start()
+        logger.info("worker_pool_started", processes=self.processes)
+    
+    def _spawn(self, index: int) -> tuple[Any, Any]:
+        """Start the worker for a slot; returns its task queue and process."""
+        tasks = self._ctx.Queue()
+        worker = self._ctx.Process(
+            target=_worker_main,
+            args=(self._config_data, tasks, self._results),
+            name=f"haci-worker-{index}",
+            daemon=True,
+        )
+        worker.start()
+        return tasks, worker
+    
+    async def run(self, task: Task) -> TaskResult:
+        """Run a task in a worker process and return its result."""
+        self._loop = asyncio.get_running_loop()
+        await self.start()
+        future = self._loop.create_future()
+        # Least loaded worker; ties go to the lowest slot
+        index = min(range(self.processes), key=self._load.__getitem__)
+        self._pending[task.id] = future
+        self._owner[task.id] = index
+        self._load[index] += 1
+        if not self._outbox:
+            self._loop.call_soon(self._send_outbox)
+        self._outbox.setdefault(index, []).append(task.model_dump_json())
+        try:
+            return await future
+        finally:
+            self._pending.pop(task.id, None)
+            self._load[self._owner.pop(task.id)] -= 1
+    
+    def _send_outbox(self) -> None:
+        outbox, self._outbox = self._outbox, {}
+        for index, batch in outbox.items():
+            if self._closed:
+                return
+            if index in self._respawning:
+                self._respawning[index].extend(batch)
+            elif self._workers[index] is None:
+                self._respawning[index] = batch
+                assert self._loop is not None
+                self._loop.create_task(self._respawn(index))
+            else:
+                self._queues[index].put(batch)
+                self.tasks_sent += len(batch)
+    
+    async def _respawn(self, index: int) -> None:
+        """Replace an exited worker, then send it the work held for it."""
+        try:
+            tasks, worker = await asyncio.to_thread(self._spawn, index)
+        except Exception as e:
+            self._respawning.pop(index, None)
+            logger.error("worker_restart_failed", worker=index, error=str(e))
+            error = WorkerPoolError(f"Could not restart worker {index}: {e}")
+            for task_id, owner in list(self._owner.items()):
+                if owner == index:
+                    _set_exception_if_pending(self._pending[task_id], error)
+            return
+        batch = self._respawning.pop(index)
+        if self._closed:
+            tasks.put(None)
+            return
+        self._queues[index] = tasks
+        self._workers[index] = worker
+        self.worker_restarts += 1
+        logger.info("worker_restarted", worker=index)
+        tasks.put(batch)
+        self.tasks_sent += len(batch)
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the workers after their current tasks, then the threads."""
+        self._closed = True
+        if not self._workers:
+            return
+        live = [(w, q) for w, q in zip(self._workers, self._queues) if w is not None]
+        for _, tasks in live:
+            tasks.put(None)
+        for worker, _ in live:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+        self._results.put(None)
+        for thread in (self._reader, self._watcher):
+            if thread is not None:
+                thread.join(timeout)
+        self._workers = []
+        self._fail_pending(WorkerPoolError("Worker pool closed"))
+    
+    def _read_results(self) -> None:
+        while True:
+            message = self._results.get()
+            if message is None:
+                return
+            self.results_received += len(message)
+            results = [
+                (task_id, TaskResult.model_validate_json(result_json))
+                for task_id, result_json in message
+            ]
+            self._call_on_loop(self._resolve, results)
+    
+    def _watch_workers(self) -> None:
+        """Wait on worker sentinels and report each exit to the event loop."""
+        reported: set[Any] = set()
+        while not self._closed:
+            sentinels = {
+                worker.sentinel: (index, worker)
+                for index, worker in enumerate(self._workers)
+                if worker is not None and worker not in reported
+            }
+            if not sentinels:
+                time.sleep(_HEALTH_CHECK_SECONDS)
+                continue
+            # The timeout picks up workers respawned since the last wait
+            ready = multiprocessing.connection.wait(
+                list(sentinels), timeout=_HEALTH_CHECK_SECONDS
+            )
+            for sentinel in ready:
+                index, worker = sentinels[sentinel]
+                reported.add(worker)
+                if not self._closed:
+                    self._call_on_loop(self._worker_exited, index, worker)
+    
+    def _worker_exited(self, index: int, worker: Any) -> None:
+        """Fail the tasks an exited worker owned and free its slot."""
+        if self._closed or self._workers[index] is not worker:
+            return
+        self._workers[index] = None
+        self._outbox.pop(index, None)
+        owned = [task_id for task_id, owner in self._owner.items() if owner == index]
+        logger.error(
+            "worker_exited",
+            worker=index,
+            exitcode=worker.exitcode,
+            tasks_failed=len(owned),
+        )
+        error = WorkerPoolError(
+            f"Worker process {worker.name} exited with code {worker.exitcode}"
+        )
+        for task_id in owned:
+            _set_exception_if_pending(self._pending[task_id], error)
+    
+    def _resolve(self, results: list[tuple[str, TaskResult]]) -> None:
+        for task_id, result in results:
+            future = self._pending.get(task_id)
+            if future is not None and not future.done():
+                future.set_result(result)
+    
+    def _fail_pending(self, error: Exception) -> None:
+        for future in list(self._pending.values()):
+            self._call_on_loop(_set_exception_if_pending, future, error)
+    
+    def _call_on_loop(self, callback: Any, *args: Any) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:  # closed between the check and the call
+            pass
+
+
+def _set_exception_if_pending(future: asyncio.Future[Any], error: Exception) -> None:
+    if not future.done():
+        future.set_exception(error)
+
+
+def _worker_main(config_data: dict[str, Any], tasks: Any, results: Any) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_worker_loop(config_data, tasks, results))
+
+
+async def _worker_loop(config_data: dict[str, Any], tasks: Any, results: Any) -> None:
+    # Imported here so the pool module stays light for the front end
+    from haci.config import HACIConfig
+    from haci.orchestrator import HACIOrchestrator
+    
+    config = HACIConfig.model_validate(config_data)
+    # Workers execute in-process and leave persistence to the front end
+    config.execution.worker_processes = 0
+    config.task_store.backend = "memory"
+    orchestrator = HACIOrchestrator(config)
+    
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(config.execution.max_concurrent_tasks)
+    running: set[asyncio.Task[None]] = set()
+    outbox: list[tuple[str, str]] = []
+    
+    def send_outbox() -> None:
+        batch = outbox[:]
+        outbox.clear()
+        results.put(batch)
+    
+    async def run_one(task_json: str) -> None:
+        try:
+            task = Task.model_validate_json(task_json)
+            try:
+                result = await orchestrator.run_task(task)
+            except Exception as e:
+                result = TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.FAILED,
+                    mode=ExecutionMode.AUTO,
+                    summary=f"Task failed: {e}",
+                    confidence=0.0,
+                    agents_used=[],
+                    resolution_steps=[],
+                    execution_time_ms=0,
+                )
+            if not outbox:
+                loop.call_soon(send_outbox)
+            outbox.append((task.id, result.model_dump_json()))
+        finally:
+            slots.release()
+    
+    while True:
+        batch = await loop.run_in_executor(None, tasks.get)
+        if batch is None:
+            break
+        for task_json in batch:
+            await slots.acquire()
+            job = loop.create_task(run_one(task_json))
+            running.add(job)
+            job.add_done_callback(running.discard)
+    
+    if running:
+        await asyncio.gather(*running)
+    if outbox:
+        send_outbox()
+    await orchestrator.close()
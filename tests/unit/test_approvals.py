@@ -0,0 +1,106 @@
+"""Unit tests for the indexed approval queue."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from haci.approvals import ApprovalFilter, ApprovalQueue
+from haci.types import AgentType, HumanApprovalRequest
+
+BASE = datetime(2025, 1, 1, 12, 0)
+
+
+def make_request(
+    approval_id: str,
+    task_id: str = "t1",
+    agent: AgentType = AgentType.LOG_ANALYST,
+    risk: str = "low",
+    expires_in: int = 60,
+) -> HumanApprovalRequest:
+    return HumanApprovalRequest(
+        id=approval_id,
+        task_id=task_id,
+        action_description="Restart service",
+        risk_assessment=risk,
+        confidence=75.0,
+        agents_recommending=[agent],
+        expires_at=BASE + timedelta(minutes=expires_in),
+    )
+
+
+@pytest.fixture
+def queue() -> ApprovalQueue:
+    queue = ApprovalQueue()
+    queue.add(make_request("a1", "t1", AgentType.SECURITY_ANALYST, "high", 10))
+    queue.add(make_request("a2", "t2", AgentType.LOG_ANALYST, "low", 20))
+    queue.add(make_request("a3", "t1", AgentType.LOG_ANALYST, "critical", 30))
+    queue.add(make_request("a4", "t3", AgentType.SECURITY_ANALYST, "high", 40))
+    return queue
+
+
+class TestApprovalFilter:
+    """Tests for filter expressions."""
+    
+    def test_parse(self) -> None:
+        """Expressions set the matching fields."""
+        f = ApprovalFilter.parse(
+            "agent=security_analyst risk=High,critical and expires<2025-01-01T12:30"
+        )
+        
+        assert f.agent_types == {AgentType.SECURITY_ANALYST}
+        assert f.risk_levels == {"high", "critical"}
+        assert f.expires_before == datetime(2025, 1, 1, 12, 30)
+        assert f.task_ids == set()
+    
+    @pytest.mark.parametrize("expression", ["owner=bob", "risk>high", "risk=high junk"])
+    def test_parse_rejects_bad_terms(self, expression: str) -> None:
+        """Unknown fields, operators and stray words are errors."""
+        with pytest.raises(ValueError):
+            ApprovalFilter.parse(expression)
+
+
+class TestApprovalQueue:
+    """Tests for ApprovalQueue indexes and pagination."""
+    
+    def test_select_by_index(self, queue: ApprovalQueue) -> None:
+        """Each index narrows the selection; fields combine with AND."""
+        assert queue.select(ApprovalFilter(task_ids={"t1"})) == ["a1", "a3"]
+        assert queue.select(ApprovalFilter.parse("agent=security_analyst")) == ["a1", "a4"]
+        assert queue.select(ApprovalFilter.parse("risk=high task=t3")) == ["a4"]
+        assert queue.select(ApprovalFilter.parse("expires<2025-01-01T12:25")) == ["a1", "a2"]
+        assert queue.select(ApprovalFilter.parse("expires>2025-01-01T12:20")) == ["a3", "a4"]
+        assert queue.select(ApprovalFilter(task_ids={"missing"})) == []
+        assert queue.select() == ["a1", "a2", "a3", "a4"]
+    
+    def test_pop_updates_indexes(self, queue: ApprovalQueue) -> None:
+        """Removed approvals disappear from every index."""
+        assert queue.pop("a1").id == "a1"
+        assert queue.pop("a1") is None
+        
+        assert len(queue) == 3
+        assert queue.select(ApprovalFilter(task_ids={"t1"})) == ["a3"]
+        assert queue.select(ApprovalFilter.parse("risk=high")) == ["a4"]
+        assert queue.select(ApprovalFilter.parse("expires<2025-01-01T12:15")) == []
+    
+    def test_update_expiry(self, queue: ApprovalQueue) -> None:
+        """Rescheduled approvals move within the expiry index."""
+        queue.update_expiry("a1", BASE + timedelta(minutes=50))
+        
+        assert queue.select(ApprovalFilter.parse("expires>2025-01-01T12:45")) == ["a1"]
+        assert queue.get("a1").expires_at == BASE + timedelta(minutes=50)
+    
+    def test_pagination(self, queue: ApprovalQueue) -> None:
+        """Pages follow creation order and the cursor survives removals."""
+        first = queue.page(limit=3)
+        assert [r.id for r in first.items] == ["a1", "a2", "a3"]
+        assert first.total == 4
+        
+        queue.pop("a2")
+        second = queue.page(limit=3, cursor=first.next_cursor)
+        assert [r.id for r in second.items] == ["a4"]
+        assert second.next_cursor is None
+        
+        with pytest.raises(ValueError):
+            queue.page(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            queue.page(limit=0)
@@ -0,0 +1,214 @@
+"""Unit tests for HACI audit log storage."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from haci.audit import (
+    AuditArchive,
+    AuditStore,
+    BatchedAuditSink,
+    SegmentedFileWriter,
+)
+from haci.harness import Harness, HarnessConfig
+from haci.types import ExecutionMode
+
+
+def entry(event: str, task_id: str | None = None, **kwargs: object) -> dict:
+    e = {"event": event, "timestamp": "2025-01-01T00:00:00", **kwargs}
+    if task_id is not None:
+        e["task_id"] = task_id
+    return e
+
+
+class TestAuditStore:
+    """Tests for the ring-buffered audit store."""
+    
+    def test_query_by_task_and_event(self) -> None:
+        """Indexes return only matching entries, in write order."""
+        store = AuditStore(capacity=100)
+        store.append(entry("context_created", "t1"))
+        store.append(entry("action_gated", "t2"))
+        store.append(entry("action_gated", "t1", n=1))
+        store.append(entry("approval_granted"))
+        store.append(entry("action_gated", "t1", n=2))
+        
+        assert [e["event"] for e in store.query(task_id="t1")] == [
+            "context_created", "action_gated", "action_gated",
+        ]
+        assert len(store.query(event="action_gated")) == 3
+        assert [e["n"] for e in store.query(task_id="t1", event="action_gated")] == [1, 2]
+        assert len(store.query()) == 5
+        assert store.query(task_id="missing") == []
+    
+    def test_evicts_oldest_and_updates_indexes(self) -> None:
+        """The ring drops the oldest entries and their index slots."""
+        store = AuditStore(capacity=3)
+        for i in range(5):
+            store.append(entry("action_gated", f"t{i % 2}", n=i))
+        
+        assert len(store) == 3
+        assert store.evicted_count == 2
+        assert [e["n"] for e in store.query(task_id="t0")] == [2, 4]
+        assert [e["n"] for e in store.query(task_id="t1")] == [3]
+        assert [e["n"] for e in store.query(event="action_gated")] == [2, 3, 4]
+    
+    def test_evicted_entries_go_to_archive(self, tmp_path: Path) -> None:
+        """Archived entries are returned before in-memory ones."""
+        archive = AuditArchive(tmp_path / "audit.db")
+        store = AuditStore(capacity=2, archive=archive, archive_batch_size=10)
+        for i in range(5):
+            store.append(entry("action_gated", "t1", n=i))
+        
+        # Below the batch size nothing has been written yet
+        assert len(archive) == 0
+        assert [e["n"] for e in store.query(task_id="t1")] == [3, 4]
+        assert [
+            e["n"] for e in store.query(task_id="t1", include_archived=True)
+        ] == [0, 1, 2, 3, 4]
+        assert len(archive) == 3
+    
+    async def test_archives_off_the_event_loop(self, tmp_path: Path) -> None:
+        """On a loop, full batches are written from a worker thread, in order."""
+        archive = AuditArchive(tmp_path / "audit.db")
+        threads = []
+        write_many = archive.write_many
+        
+        def recording_write_many(entries):
+            threads.append(threading.get_ident())
+            return write_many(entries)
+        
+        archive.write_many = recording_write_many
+        store = AuditStore(capacity=1, archive=archive, archive_batch_size=2)
+        for i in range(7):
+            store.append(entry("action_gated", "t1", n=i))
+        await store._writer
+        
+        assert threads and threading.get_ident() not in threads
+        assert [e["n"] for e in archive.query()] == [0, 1, 2, 3, 4, 5]
+        assert [e["n"] for e in store.query(include_archived=True)] == list(range(7))
+    
+    def test_rejects_zero_capacity(self) -> None:
+        """A store must hold at least one entry."""
+        with pytest.raises(ValueError):
+            AuditStore(capacity=0)
+
+
+class TestHarnessAuditLog:
+    """Tests for the Harness audit log integration."""
+    
+    def test_get_audit_log_filters(self) -> None:
+        """Harness lookups go through the indexed store."""
+        harness = Harness(config=HarnessConfig(audit_max_entries=10))
+        harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        harness.create_context("t2", ExecutionMode.MICRO_SWARM)
+        harness.cleanup_context("t1")
+        
+        assert [e["event"] for e in harness.get_audit_log("t1")] == [
+            "context_created", "context_cleaned_up",
+        ]
+        assert len(harness.get_audit_log(event="context_created")) == 2
+        assert len(harness.get_audit_log()) == 3
+
+
+def read_segments(directory: Path) -> list[dict]:
+    entries = []
+    for segment in sorted(directory.glob("audit-*.jsonl")):
+        entries.extend(json.loads(line) for line in segment.read_text().splitlines())
+    return entries
+
+
+class TestSegmentedFileWriter:
+    """Tests for the append-only segment writer."""
+    
+    def test_rotates_segments(self, tmp_path: Path) -> None:
+        """A new segment starts once the size limit would be exceeded."""
+        writer = SegmentedFileWriter(tmp_path, max_segment_bytes=200)
+        for i in range(10):
+            writer.write_batch([entry("action_gated", "t1", n=i)])
+        writer.close()
+        
+        assert len(list(tmp_path.glob("audit-*.jsonl"))) > 1
+        assert [e["n"] for e in read_segments(tmp_path)] == list(range(10))
+    
+    def test_reopen_starts_new_segment(self, tmp_path: Path) -> None:
+        """Existing segments are never appended to after a restart."""
+        first = SegmentedFileWriter(tmp_path)
+        first.write_batch([entry("action_gated", "t1")])
+        first.close()
+        
+        second = SegmentedFileWriter(tmp_path)
+        assert second.current_segment.name == "audit-00000002.jsonl"
+        second.close()
+    
+    def test_fsync_modes(self, tmp_path: Path) -> None:
+        """Batch mode fsyncs every batch; interval mode groups them."""
+        per_batch = SegmentedFileWriter(tmp_path / "batch", fsync_mode="batch")
+        per_interval = SegmentedFileWriter(
+            tmp_path / "interval", fsync_mode="interval", fsync_interval_seconds=60
+        )
+        for i in range(5):
+            per_batch.write_batch([entry("action_gated", n=i)])
+            per_interval.write_batch([entry("action_gated", n=i)])
+        
+        assert per_batch.fsync_count == 5
+        assert per_interval.fsync_count == 0
+        per_interval.close()
+        assert per_interval.fsync_count == 1
+        
+        with pytest.raises(ValueError):
+            SegmentedFileWriter(tmp_path / "bad", fsync_mode="never")
+
+
+class TestBatchedAuditSink:
+    """Tests for the background batched sink."""
+    
+    def test_writes_in_batches(self, tmp_path: Path) -> None:
+        """Emitted entries reach disk in batches after a flush."""
+        sink = BatchedAuditSink(SegmentedFileWriter(tmp_path), max_batch=50)
+        for i in range(120):
+            sink.emit(entry("action_gated", "t1", n=i))
+        
+        assert sink.flush(timeout=5)
+        assert sink.entries_written == 120
+        assert 3 <= sink.batches_written <= 120
+        sink.close()
+        
+        assert [e["n"] for e in read_segments(tmp_path)] == list(range(120))
+    
+    def test_emit_many_keeps_batch_together(self, tmp_path: Path) -> None:
+        """Entries emitted together are written in one batch."""
+        sink = BatchedAuditSink(SegmentedFileWriter(tmp_path), max_batch=10)
+        sink.emit_many([entry("approval_granted", "t1", n=i) for i in range(25)])
+        
+        assert sink.flush(timeout=5)
+        assert sink.entries_written == 25
+        assert sink.batches_written == 1
+        sink.close()
+    
+    def test_bad_entry_does_not_stop_the_writer(self, tmp_path: Path) -> None:
+        """An unserialisable batch is dropped; later entries and flushes work."""
+        sink = BatchedAuditSink(SegmentedFileWriter(tmp_path))
+        sink.emit(entry("action_gated", "t1", detail={("not", "json"): 1}))
+        assert sink.flush(timeout=5)
+        sink.emit(entry("action_gated", "t1", n=1))
+        
+        assert sink.flush(timeout=5)
+        assert sink.write_errors == 1
+        assert sink.entries_written == 1
+        sink.close()
+        
+        assert [e["n"] for e in read_segments(tmp_path)] == [1]
+    
+    def test_harness_uses_segment_sink(self, tmp_path: Path) -> None:
+        """Configuring a segment directory routes audit entries to disk."""
+        harness = Harness(config=HarnessConfig(audit_segment_dir=str(tmp_path)))
+        harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        harness.cleanup_context("t1")
+        harness.close()
+        
+        assert [e["event"] for e in read_segments(tmp_path)] == [
+            "context_created", "context_cleaned_up",
+        ]
@@ -0,0 +1,193 @@
+"""Unit tests for the HACI command line interface."""
+
+import asyncio
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from haci.batch import percentile, run_batch
+from haci.cli import main
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+
+
+def write_tasks(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestSubmit:
+    """Tests for the submit and status commands."""
+    
+    def test_submitted_task_runs_and_is_found_later(self, tmp_path: Path) -> None:
+        """A task runs before submit exits and a later status call finds it."""
+        pytest.importorskip("sqlalchemy")
+        pytest.importorskip("aiosqlite")
+        config = tmp_path / "haci.yaml"
+        config.write_text(
+            "task_store:\n"
+            "  backend: sqlalchemy\n"
+            f"  url: sqlite:///{tmp_path / 'tasks.db'}\n"
+        )
+        runner = CliRunner()
+        
+        submitted = runner.invoke(
+            main, ["-c", str(config), "submit", "-t", "Check logs", "-m", "single_agent"]
+        )
+        assert submitted.exit_code == 0, submitted.output
+        task_id = submitted.output.split("Task submitted: ")[1].split()[0]
+        assert f"Task {task_id}: completed" in submitted.output
+        
+        checked = runner.invoke(main, ["-c", str(config), "status", task_id])
+        assert checked.exit_code == 0, checked.output
+        assert f"Task {task_id}: completed" in checked.output
+        
+        missing = runner.invoke(main, ["-c", str(config), "status", "missing"])
+        assert missing.exit_code == 1
+        assert "Task not found: missing" in missing.output
+    
+    def test_status_requires_persistent_store(self) -> None:
+        """With the in-memory store no earlier task can be found, so say so."""
+        result = CliRunner().invoke(main, ["status", "some-task"])
+        
+        assert result.exit_code == 1
+        assert "persistent task store" in result.output
+
+
+class TestSubmitBatch:
+    """Tests for the submit-batch command."""
+    
+    def test_submits_file_and_writes_results(self, tmp_path: Path) -> None:
+        """Every task gets one result line and the run is summarized."""
+        tasks = write_tasks(tmp_path / "tasks.jsonl", [
+            json.dumps({"title": f"Task {i}", "priority": "high" if i % 2 else "low"})
+            for i in range(20)
+        ])
+        out = tmp_path / "results.jsonl"
+        
+        result = CliRunner().invoke(
+            main,
+            ["submit-batch", str(tasks), "-o", str(out), "-j", "4", "-m", "single_agent"],
+        )
+        
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        assert sorted(r["line"] for r in records) == list(range(1, 21))
+        assert all(r["status"] == "completed" for r in records)
+        assert all(r["mode"] == "single_agent" for r in records)
+        assert "20 submitted, 20 completed, 0 failed, 0 invalid" in result.output
+        assert "tasks/sec" in result.output
+        assert "p99=" in result.output
+    
+    def test_invalid_lines_are_reported(self, tmp_path: Path) -> None:
+        """Bad lines get an error record and a non-zero exit; the rest still run."""
+        tasks = write_tasks(tmp_path / "tasks.jsonl", [
+            json.dumps({"title": "Good"}),
+            "not json",
+            "",
+            json.dumps(["not", "an", "object"]),
+        ])
+        
+        result = CliRunner().invoke(main, ["submit-batch", str(tasks)])
+        
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        errors = {r["line"]: r["error"] for r in records if "error" in r}
+        assert set(errors) == {2, 4}
+        assert [r["line"] for r in records if "error" not in r] == [1]
+        assert "1 submitted, 1 completed, 0 failed, 2 invalid" in result.stderr
+    
+    async def test_timed_out_tasks_are_cancelled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A timed-out task stops before its slot goes to the next one."""
+        running = 0
+        most_running = 0
+        
+        async def hang(self, state, context, agents=None):
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            try:
+                await asyncio.sleep(30)
+            finally:
+                running -= 1
+        
+        monkeypatch.setattr(HACIOrchestrator, "_execute_single_agent", hang)
+        lines = [json.dumps({"title": f"Task {i}"}) for i in range(3)]
+        output = io.StringIO()
+        
+        stats = await asyncio.wait_for(
+            run_batch(HACIConfig(), lines, output, 1, "single_agent", timeout=0.05),
+            timeout=10,
+        )
+        
+        assert (stats.submitted, stats.failed) == (3, 3)
+        assert most_running == 1
+        assert running == 0
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert all("did not complete" in r["error"] for r in records)
+    
+    async def test_task_errors_do_not_abort_the_batch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Any error awaiting a result becomes an error record."""
+        async def broken(self, task_id, timeout=None):
+            raise RuntimeError("result lost")
+        
+        monkeypatch.setattr(HACIOrchestrator, "await_result", broken)
+        lines = [json.dumps({"title": f"Task {i}"}) for i in range(3)]
+        output = io.StringIO()
+        
+        stats = await run_batch(HACIConfig(), lines, output, 2, "single_agent", timeout=5)
+        
+        assert (stats.submitted, stats.completed, stats.failed) == (3, 0, 3)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert all(r["error"] == "Task failed: result lost" for r in records)
+    
+    def test_percentile(self) -> None:
+        """Nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([7.0], 95) == 7.0
+
+
+class TestStartup:
+    """Tests for CLI start-up cost."""
+    
+    def test_informational_commands_skip_heavy_imports(self, tmp_path: Path) -> None:
+        """``haci mode info`` loads neither config, orchestrator nor logging."""
+        src = Path(__file__).resolve().parents[2] / "src"
+        code = (
+            "import sys\n"
+            "from haci.cli import main\n"
+            "try:\n"
+            "    main(['mode', 'info', 'micro_swarm'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = ('pydantic', 'pydantic_settings', 'yaml', 'structlog', 'haci.orchestrator')\n"
+            "print([m for m in heavy if m in sys.modules])\n"
+        )
+        env = {**os.environ, "PYTHONPATH": str(src), "PYTHONSAFEPATH": "1"}
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=tmp_path, env=env, capture_output=True, text=True, check=True,
+        )
+        
+        assert "Checkpoint-based" in proc.stdout
+        assert proc.stdout.strip().splitlines()[-1] == "[]"
+    
+    def test_lazy_package_exports(self) -> None:
+        """Public names are still importable from the package root."""
+        import haci
+        from haci.orchestrator import HACIOrchestrator
+        
+        assert haci.HACIOrchestrator is HACIOrchestrator
+        assert "TaskStatus" in dir(haci)
@@ -0,0 +1,99 @@
+"""Unit tests for the task completion channel."""
+
+import asyncio
+
+import pytest
+
+from haci.completion import CompletionChannel
+from haci.types import ExecutionMode, TaskResult, TaskStatus
+
+
+def make_result(task_id: str, status: TaskStatus = TaskStatus.COMPLETED) -> TaskResult:
+    return TaskResult(
+        task_id=task_id,
+        status=status,
+        mode=ExecutionMode.SINGLE_AGENT,
+        summary="done",
+        confidence=90.0,
+        agents_used=[],
+        resolution_steps=[],
+        execution_time_ms=1,
+    )
+
+
+class TestCompletionChannel:
+    """Tests for CompletionChannel fan-out."""
+    
+    async def test_wait_resolves_on_publish(self) -> None:
+        """Every waiter on a task gets its result; abandoned waiters are dropped."""
+        channel = CompletionChannel()
+        first = channel.wait("t1")
+        second = channel.wait("t1")
+        abandoned = channel.wait("t2")
+        abandoned.cancel()
+        await asyncio.sleep(0)
+        
+        channel.publish(make_result("t1"))
+        
+        assert (await first).task_id == "t1"
+        assert (await second).task_id == "t1"
+        assert channel._waiters == {}
+    
+    async def test_task_subscription_only_sees_its_tasks(self) -> None:
+        """Task-set subscriptions ignore other tasks."""
+        channel = CompletionChannel()
+        subscription = channel.subscribe_tasks(["t1", "t3"])
+        for task_id in ("t1", "t2", "t3"):
+            channel.publish(make_result(task_id))
+        
+        assert [(await subscription.get()).task_id for _ in range(2)] == ["t1", "t3"]
+        subscription.close()
+        assert channel.subscriber_count == 0
+    
+    async def test_stream_drops_oldest_when_full(self) -> None:
+        """A full stream buffer drops its oldest result instead of blocking."""
+        channel = CompletionChannel()
+        stream = channel.subscribe(
+            lambda r: r.status == TaskStatus.COMPLETED, max_buffer=2
+        )
+        channel.publish(make_result("t1"))
+        channel.publish(make_result("failed", TaskStatus.FAILED))
+        channel.publish(make_result("t2"))
+        channel.publish(make_result("t3"))
+        
+        assert stream.dropped == 1
+        assert [(await stream.get()).task_id for _ in range(2)] == ["t2", "t3"]
+    
+    async def test_failing_filter_does_not_break_publish(self) -> None:
+        """A broken stream filter cannot stop delivery to others."""
+        channel = CompletionChannel()
+        channel.subscribe(lambda r: 1 / 0)
+        waiter = channel.wait("t1")
+        
+        channel.publish(make_result("t1"))
+        
+        assert (await waiter).task_id == "t1"
+    
+    async def test_close_wakes_blocked_readers(self) -> None:
+        """Closing ends iteration and fails waiters that are already blocked."""
+        channel = CompletionChannel()
+        stream = channel.subscribe()
+        tasks = channel.subscribe_tasks(["t2"])
+        waiter = channel.wait("t2")
+        channel.publish(make_result("t1"))
+        
+        async def drain() -> list[str]:
+            return [result.task_id async for result in stream]
+        
+        reader = asyncio.create_task(drain())
+        getter = asyncio.create_task(tasks.get())
+        await asyncio.sleep(0)
+        channel.close()
+        
+        # Buffered results are still delivered before the stream ends
+        assert await asyncio.wait_for(reader, timeout=1) == ["t1"]
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(getter, timeout=1)
+        with pytest.raises(RuntimeError):
+            await waiter
+        assert channel.subscriber_count == 0
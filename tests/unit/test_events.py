@@ -0,0 +1,105 @@
+"""Unit tests for task status-transition events."""
+
+import asyncio
+
+import pytest
+
+from haci.events import StatusEvent, StatusEventBus
+from haci.types import ExecutionMode, TaskStatus
+
+
+def make_event(
+    task_id: str,
+    status: TaskStatus = TaskStatus.EXECUTING,
+    mode: ExecutionMode = ExecutionMode.SINGLE_AGENT,
+) -> StatusEvent:
+    return StatusEvent(
+        task_id=task_id,
+        status=status,
+        previous_status=TaskStatus.ANALYZING,
+        mode=mode,
+    )
+
+
+class TestStatusEventBus:
+    """Tests for StatusEventBus filtering and buffering."""
+    
+    async def test_filters_by_task_status_and_mode(self) -> None:
+        """Each subscription only sees events passing all of its filters."""
+        bus = StatusEventBus()
+        by_task = bus.subscribe(task_ids=["t1"])
+        by_status = bus.subscribe(statuses=[TaskStatus.COMPLETED])
+        by_mode = bus.subscribe(modes=["full_swarm"])
+        
+        bus.publish(make_event("t1"))
+        bus.publish(make_event("t2", TaskStatus.COMPLETED))
+        bus.publish(make_event("t3", mode=ExecutionMode.FULL_SWARM))
+        
+        assert (await by_task.get()).task_id == "t1"
+        assert by_task.get_nowait() is None
+        assert (await by_status.get()).task_id == "t2"
+        assert by_status.get_nowait() is None
+        assert (await by_mode.get()).task_id == "t3"
+        assert by_mode.get_nowait() is None
+    
+    async def test_drops_oldest_when_buffer_full(self) -> None:
+        """A slow subscriber loses its oldest events, not new ones."""
+        bus = StatusEventBus()
+        subscription = bus.subscribe(max_buffer=2)
+        for i in range(5):
+            bus.publish(make_event(f"t{i}"))
+        
+        assert subscription.dropped == 3
+        assert [(await subscription.get()).task_id for _ in range(2)] == ["t3", "t4"]
+    
+    def test_close_detaches(self) -> None:
+        """Closed subscriptions stop receiving and are no longer counted."""
+        bus = StatusEventBus()
+        with bus.subscribe(task_ids=["t1", "t2"]) as scoped:
+            unscoped = bus.subscribe()
+            assert bus.subscriber_count == 2
+            assert bus.wants("t1")
+            unscoped.close()
+        
+        assert scoped.closed
+        assert bus.subscriber_count == 0
+        assert not bus.wants("t1")
+        bus.publish(make_event("t1"))
+        assert scoped.get_nowait() is None
+    
+    async def test_close_ends_blocked_iterators(self) -> None:
+        """Iterators waiting for events finish on close, unsubscribe or bus close."""
+        bus = StatusEventBus()
+        closed = bus.subscribe()
+        unsubscribed = bus.subscribe(task_ids=["t1"])
+        on_bus = bus.subscribe(statuses=[TaskStatus.COMPLETED])
+        bus.publish(make_event("t1"))
+        
+        async def drain(subscription) -> list[str]:
+            return [event.task_id async for event in subscription]
+        
+        readers = [asyncio.create_task(drain(s)) for s in (closed, unsubscribed, on_bus)]
+        await asyncio.sleep(0)
+        closed.close()
+        bus.unsubscribe(unsubscribed)
+        bus.close()
+        
+        # Buffered events are still delivered before iteration ends
+        results = await asyncio.wait_for(asyncio.gather(*readers), timeout=1)
+        assert results == [["t1"], ["t1"], []]
+        assert bus.subscriber_count == 0
+        with pytest.raises(RuntimeError):
+            await closed.get()
+        assert bus.subscribe().closed
+    
+    def test_rejects_unbounded_buffer(self) -> None:
+        """Subscriptions must be bounded."""
+        with pytest.raises(ValueError):
+            StatusEventBus().subscribe(max_buffer=0)
+    
+    def test_to_dict(self) -> None:
+        """Events serialize to plain JSON types."""
+        data = make_event("t1").to_dict()
+        assert data["status"] == "executing"
+        assert data["previous_status"] == "analyzing"
+        assert data["agents"] == []
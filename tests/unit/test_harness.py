@@ -0,0 +1,402 @@
+"""Unit tests for the HACI Harness."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from haci.approvals import ApprovalFilter
+from haci.harness import Harness, HarnessAction, HarnessConfig
+from haci.types import AgentType, ExecutionMode
+
+
+def make_action(confidence: float = 97.0) -> HarnessAction:
+    return HarnessAction(
+        agent_type=AgentType.LOG_ANALYST,
+        action_type="query_logs",
+        description="Search error logs",
+        confidence=confidence,
+    )
+
+
+class TestRateLimiting:
+    """Tests for token-bucket rate limiting in gate_action."""
+    
+    @pytest.mark.asyncio
+    async def test_reject_mode_rejects_when_empty(self) -> None:
+        """Reject mode fails fast once the per-task bucket is empty."""
+        harness = Harness(config=HarnessConfig(
+            max_actions_per_minute=2,
+            rate_limit_mode="reject",
+        ))
+        context = harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        
+        results = [await harness.gate_action(context, make_action()) for _ in range(3)]
+        
+        assert [approved for approved, _ in results] == [True, True, False]
+        assert results[-1][1] == "Rate limit exceeded"
+        assert harness.rate_limit_stats.rejections == 1
+        assert len(harness.get_audit_log("t1", event="action_rate_limited")) == 1
+    
+    @pytest.mark.asyncio
+    async def test_buckets_are_per_task(self) -> None:
+        """One task exhausting its bucket does not limit another."""
+        harness = Harness(config=HarnessConfig(
+            max_actions_per_minute=1,
+            rate_limit_mode="reject",
+        ))
+        first = harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        second = harness.create_context("t2", ExecutionMode.SINGLE_AGENT)
+        
+        assert (await harness.gate_action(first, make_action()))[0]
+        assert not (await harness.gate_action(first, make_action()))[0]
+        assert (await harness.gate_action(second, make_action()))[0]
+    
+    @pytest.mark.asyncio
+    async def test_global_bucket_limits_all_tasks(self) -> None:
+        """The global bucket is shared across tasks."""
+        harness = Harness(config=HarnessConfig(
+            max_global_actions_per_minute=1,
+            rate_limit_mode="reject",
+        ))
+        first = harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        second = harness.create_context("t2", ExecutionMode.SINGLE_AGENT)
+        
+        assert (await harness.gate_action(first, make_action()))[0]
+        assert not (await harness.gate_action(second, make_action()))[0]
+    
+    @pytest.mark.asyncio
+    async def test_wait_mode_waits_for_token(self) -> None:
+        """Wait mode sleeps until a token is available."""
+        harness = Harness(config=HarnessConfig(max_actions_per_minute=1200))
+        context = harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        context.rate_limiter._tokens = 0.0  # 20 tokens/s: next one in 50ms
+        
+        approved, _ = await harness.gate_action(context, make_action())
+        
+        assert approved
+        assert harness.rate_limit_stats.waits == 1
+        assert 0 < harness.rate_limit_stats.max_wait_seconds <= 0.06
+    
+    @pytest.mark.asyncio
+    async def test_wait_mode_gives_up_past_max_wait(self) -> None:
+        """Waits longer than the configured maximum are rejected."""
+        harness = Harness(config=HarnessConfig(
+            max_actions_per_minute=1,
+            rate_limit_max_wait_seconds=1.0,
+        ))
+        context = harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        
+        assert (await harness.gate_action(context, make_action()))[0]
+        assert not (await harness.gate_action(context, make_action()))[0]
+        assert harness.rate_limit_stats.rejections == 1
+    
+    @pytest.mark.asyncio
+    async def test_zero_disables_limits(self) -> None:
+        """Per-minute limits of zero turn rate limiting off."""
+        harness = Harness(config=HarnessConfig(
+            max_actions_per_minute=0,
+            max_global_actions_per_minute=0,
+            rate_limit_mode="reject",
+        ))
+        context = harness.create_context("t1", ExecutionMode.SINGLE_AGENT)
+        
+        for _ in range(100):
+            assert (await harness.gate_action(context, make_action()))[0]
+        assert harness.rate_limit_stats.checks == 0
+
+
+async def wait_for_pending(context, count: int = 1) -> list[str]:
+    for _ in range(200):
+        if len(context.pending_approvals) >= count:
+            return list(context.pending_approvals)
+        await asyncio.sleep(0.005)
+    raise AssertionError("approval was never requested")
+
+
+class TestApprovals:
+    """Tests for future-based human approval."""
+    
+    @pytest.mark.asyncio
+    async def test_gate_waits_for_approve(self) -> None:
+        """A gated action suspends until approve() resolves it."""
+        harness = Harness()
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        assert not gate.done()
+        
+        assert harness.approve(approval_id)
+        assert await gate == (True, "Human approved")
+        assert not harness.approve(approval_id)
+    
+    @pytest.mark.asyncio
+    async def test_reject_includes_reason(self) -> None:
+        """reject() resolves the waiter with the rejection reason."""
+        harness = Harness()
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        harness.reject(approval_id, "too risky")
+        
+        assert await gate == (False, "Human rejected: too risky")
+        assert harness.get_audit_log("t1", event="approval_rejected")[0]["reason"] == "too risky"
+    
+    @pytest.mark.asyncio
+    async def test_pending_approval_does_not_block_other_tasks(self) -> None:
+        """Other tasks keep gating while one waits on a human."""
+        harness = Harness()
+        waiting = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        other = harness.create_context("t2", ExecutionMode.SINGLE_AGENT)
+        
+        gate = asyncio.create_task(harness.gate_action(waiting, make_action()))
+        await wait_for_pending(waiting)
+        
+        for _ in range(10):
+            assert (await harness.gate_action(other, make_action()))[0]
+        assert not gate.done()
+        
+        harness.cleanup_context("t1")
+        assert await gate == (False, "Task cleaned up")
+    
+    @pytest.mark.asyncio
+    async def test_approve_from_another_thread(self) -> None:
+        """Decisions may arrive from a thread outside the event loop."""
+        harness = Harness()
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        # The calling thread waits while the loop applies the decision
+        seen: list[int] = []
+        harness._log_audit_many = lambda entries: seen.append(threading.get_ident())
+        
+        assert await asyncio.to_thread(harness.approve, approval_id) is True
+        assert await asyncio.wait_for(gate, timeout=1) == (True, "Human approved")
+        assert seen == [threading.get_ident()]
+    
+    def test_approve_from_another_thread_times_out(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A stalled loop makes the caller time out instead of hanging forever."""
+        monkeypatch.setattr("haci.harness._LOOP_CALL_TIMEOUT_SECONDS", 0.05)
+        harness = Harness()
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+        release = threading.Event()
+        loop.call_soon(started.set)
+        loop.call_soon(release.wait)
+        runner = threading.Thread(target=loop.run_forever)
+        runner.start()
+        started.wait()
+        harness._approval_loop = loop
+        applied: list[str] = []
+        harness._decide_approvals = lambda *args, **kwargs: applied.append("decided")
+        
+        try:
+            with pytest.raises(TimeoutError):
+                harness.approve("a1")
+        finally:
+            release.set()
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+        # The abandoned decision is not applied once the loop catches up
+        assert applied == []
+    
+    @pytest.mark.asyncio
+    async def test_async_handler(self) -> None:
+        """Async handlers are awaited on the event loop."""
+        async def handler(request) -> bool:
+            await asyncio.sleep(0)
+            return request.task_id == "t1"
+        
+        harness = Harness(approval_handler=handler)
+        approved = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        rejected = harness.create_context("t2", ExecutionMode.HUMAN_LED)
+        
+        assert await harness.gate_action(approved, make_action()) == (True, "Human approved")
+        assert not (await harness.gate_action(rejected, make_action()))[0]
+    
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_off_loop(self) -> None:
+        """Blocking sync handlers run in a worker thread."""
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+        
+        def handler(request) -> bool:
+            seen.append(threading.get_ident())
+            return True
+        
+        harness = Harness(approval_handler=handler)
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        assert (await harness.gate_action(context, make_action()))[0]
+        assert seen and seen[0] != loop_thread
+    
+    @pytest.mark.asyncio
+    async def test_handler_returning_none_defers(self) -> None:
+        """A handler may only notify and leave the decision to approve()."""
+        notified: list[str] = []
+        harness = Harness(approval_handler=lambda request: notified.append(request.id))
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        for _ in range(50):
+            if notified:
+                break
+            await asyncio.sleep(0.005)
+        assert notified == [approval_id]
+        assert not gate.done()
+        
+        harness.approve(approval_id)
+        assert (await gate)[0]
+    
+    @pytest.mark.asyncio
+    async def test_handler_error_rejects(self) -> None:
+        """A failing handler rejects the action and clears the request."""
+        def handler(request) -> bool:
+            raise RuntimeError("pager down")
+        
+        harness = Harness(approval_handler=handler)
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        approved, reason = await harness.gate_action(context, make_action())
+        
+        assert not approved
+        assert reason == "Approval handler error: pager down"
+        assert not harness.approve(context.pending_approvals[0])
+
+
+class TestApprovalExpiry:
+    """Tests for timing-wheel approval expiry."""
+    
+    @pytest.mark.asyncio
+    async def test_expired_approval_is_rejected(self) -> None:
+        """Past its timeout an approval is rejected and audited."""
+        harness = Harness(config=HarnessConfig(approval_timeout_seconds=60))
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        
+        assert harness.expire_approvals(time.monotonic() + 30) == []
+        assert harness.expire_approvals(time.monotonic() + 61) == [approval_id]
+        assert await gate == (False, "Approval expired")
+        assert not harness.approve(approval_id)
+        assert len(harness.get_audit_log("t1", event="approval_expired")) == 1
+        harness.close()
+    
+    @pytest.mark.asyncio
+    async def test_escalate_policy_extends_then_rejects(self) -> None:
+        """Escalation keeps the approval open for another timeout first."""
+        harness = Harness(config=HarnessConfig(
+            approval_timeout_seconds=60,
+            approval_expiry_policy="escalate",
+            approval_max_escalations=1,
+        ))
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        
+        start = time.monotonic()
+        assert harness.expire_approvals(start + 61) == [approval_id]
+        await asyncio.sleep(0)
+        assert not gate.done()
+        escalated = harness.get_audit_log("t1", event="approval_escalated")
+        assert [e["escalation_level"] for e in escalated] == [1]
+        
+        assert harness.expire_approvals(start + 122) == [approval_id]
+        assert await gate == (False, "Approval expired")
+        harness.close()
+    
+    @pytest.mark.asyncio
+    async def test_decided_approval_does_not_expire(self) -> None:
+        """Approving cancels the expiry timer."""
+        harness = Harness(config=HarnessConfig(approval_timeout_seconds=60))
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        (approval_id,) = await wait_for_pending(context)
+        harness.approve(approval_id)
+        
+        assert harness.expire_approvals(time.monotonic() + 120) == []
+        assert (await gate)[0]
+        harness.close()
+    
+    @pytest.mark.asyncio
+    async def test_background_expiry(self) -> None:
+        """The expiry task rejects stale approvals without manual ticks."""
+        harness = Harness(config=HarnessConfig(
+            approval_timeout_seconds=0,
+            approval_expiry_tick_seconds=0.01,
+        ))
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        
+        result = await asyncio.wait_for(
+            harness.gate_action(context, make_action()), timeout=1
+        )
+        
+        assert result == (False, "Approval expired")
+        harness.close()
+
+
+class TestBulkApprovals:
+    """Tests for listing and bulk-deciding pending approvals."""
+    
+    @pytest.mark.asyncio
+    async def test_approve_and_reject_many(self) -> None:
+        """Bulk decisions resolve every matching waiter in one pass."""
+        harness = Harness()
+        contexts = [
+            harness.create_context(f"t{i}", ExecutionMode.HUMAN_LED) for i in range(6)
+        ]
+        gates = []
+        for i, context in enumerate(contexts):
+            action = make_action()
+            action.risk_level = "high" if i % 2 else "low"
+            gates.append(asyncio.create_task(harness.gate_action(context, action)))
+        for context in contexts:
+            await wait_for_pending(context)
+        
+        page = harness.list_approvals("risk=high", limit=2)
+        assert page.total == 3
+        assert [r.task_id for r in page.items] == ["t1", "t3"]
+        assert [r.task_id for r in harness.list_approvals(
+            "risk=high", limit=2, cursor=page.next_cursor
+        ).items] == ["t5"]
+        
+        assert len(harness.reject_many("risk=high", reason="incident closed")) == 3
+        assert len(harness.approve_many("agent=log_analyst")) == 3
+        assert harness.list_approvals().total == 0
+        
+        results = await asyncio.gather(*gates)
+        assert [approved for approved, _ in results] == [True, False] * 3
+        assert results[1][1] == "Human rejected: incident closed"
+        assert len(harness.get_audit_log(event="approval_rejected")) == 3
+        assert len(harness.get_audit_log("t0", event="approval_granted")) == 1
+        harness.close()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_decisions_need_a_filter(self) -> None:
+        """Empty filters would match everything, so they are refused."""
+        harness = Harness()
+        context = harness.create_context("t1", ExecutionMode.HUMAN_LED)
+        gate = asyncio.create_task(harness.gate_action(context, make_action()))
+        await wait_for_pending(context)
+        
+        for empty in ["", "  ", "and", ApprovalFilter()]:
+            with pytest.raises(ValueError):
+                harness.approve_many(empty)
+            with pytest.raises(ValueError):
+                harness.reject_many(empty)
+        
+        assert harness.list_approvals().total == 1
+        harness.cleanup_context("t1")
+        await gate
+        harness.close()
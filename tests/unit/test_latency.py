@@ -0,0 +1,31 @@
+"""Unit tests for latency histograms."""
+
+from haci.shared.latency import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+    
+    def test_percentiles_within_one_bucket(self) -> None:
+        """Percentiles are accurate to the bucket width."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.observe(float(ms))
+        
+        assert histogram.count == 1000
+        assert 500 <= histogram.percentile(50) <= 500 * 1.19
+        assert 990 <= histogram.percentile(99) <= 1000
+        assert histogram.percentile(100) == 1000
+        assert abs(histogram.mean_ms - 500.5) < 1e-9
+    
+    def test_merge_and_snapshot(self) -> None:
+        """Merged histograms combine counts; empty ones report zeros."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        assert a.snapshot()["p99_ms"] == 0.0
+        a.observe(2.0)
+        b.observe(5e7)  # beyond the last bucket
+        a.merge(b)
+        
+        assert a.count == 2
+        assert a.percentile(100) == 5e7
+        assert a.buckets()[-1] == (float("inf"), 1)
@@ -0,0 +1,209 @@
+"""Unit tests for the pooled LLM provider clients, against a local stub server."""
+
+import asyncio
+import json
+import socket
+
+import pytest
+
+uvicorn = pytest.importorskip("uvicorn")
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from haci.config import AgentConfig, HACIConfig, LLMProviderConfig
+from haci.integrations.api import (
+    LLMClientPool,
+    LLMProviderError,
+    LLMRequest,
+    ProviderClient,
+)
+
+
+class StubProvider:
+    """Local server speaking the Anthropic and OpenAI wire formats."""
+    
+    def __init__(self) -> None:
+        self.peers: set[tuple[str, int]] = set()
+        self.active = 0
+        self.max_active = 0
+        self.requests: list[dict] = []
+        self.app = Starlette(routes=[
+            Route("/v1/messages", self.messages, methods=["POST"]),
+            Route("/v1/chat/completions", self.chat, methods=["POST"]),
+        ])
+    
+    async def _enter(self, request: Request) -> dict:
+        body = await request.json()
+        self.requests.append({"headers": dict(request.headers), "body": body})
+        self.peers.add((request.client.host, request.client.port))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        if body["model"].endswith("-slow"):
+            await asyncio.sleep(0.05)
+        self.active -= 1
+        return body
+    
+    async def messages(self, request: Request):
+        body = await self._enter(request)
+        if body["model"].endswith("-error"):
+            return JSONResponse(
+                {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}},
+                status_code=529,
+            )
+        words = ["Check ", "the ", "logs."]
+        if not body.get("stream"):
+            return JSONResponse({
+                "content": [{"type": "text", "text": "".join(words)}],
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 12, "output_tokens": 3},
+            })
+        
+        async def events():
+            yield _sse({"type": "message_start", "message": {"usage": {"input_tokens": 12, "output_tokens": 1}}})
+            for word in words:
+                yield _sse({"type": "content_block_delta", "delta": {"type": "text_delta", "text": word}})
+            yield _sse({"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 3}})
+            yield _sse({"type": "message_stop"})
+        
+        return StreamingResponse(events(), media_type="text/event-stream")
+    
+    async def chat(self, request: Request):
+        body = await self._enter(request)
+        if not body.get("stream"):
+            return JSONResponse({
+                "choices": [{"message": {"content": "Restart it."}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 8, "completion_tokens": 2},
+            })
+        
+        async def events():
+            for word in ["Restart ", "it."]:
+                yield _sse({"choices": [{"delta": {"content": word}, "finish_reason": None}]})
+            yield _sse({"choices": [{"delta": {}, "finish_reason": "stop"}]})
+            yield _sse({"choices": [], "usage": {"prompt_tokens": 8, "completion_tokens": 2}})
+            yield "data: [DONE]\n\n"
+        
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _sse(data: dict) -> str:
+    return f"event: {data.get('type', 'message')}\ndata: {json.dumps(data)}\n\n"
+
+
+@pytest.fixture
+async def stub():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    provider = StubProvider()
+    server = uvicorn.Server(uvicorn.Config(
+        provider.app, host="127.0.0.1", port=port, log_level="warning"
+    ))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    provider.base_url = f"http://127.0.0.1:{port}"
+    yield provider
+    server.should_exit = True
+    await serving
+
+
+def make_pool(stub: StubProvider, **overrides) -> LLMClientPool:
+    config = HACIConfig(anthropic_api_key="test-key", openai_api_key="oa-key")
+    config.integrations.llm_providers = [
+        LLMProviderConfig(name="anthropic", base_url=stub.base_url, **overrides),
+        LLMProviderConfig(name="openai", base_url=stub.base_url, **overrides),
+    ]
+    return LLMClientPool(config)
+
+
+class TestProviderClient:
+    """Tests for completion, streaming and accounting."""
+    
+    async def test_complete_routes_by_model(self, stub: StubProvider) -> None:
+        """Requests go to the provider serving the model, with its auth headers."""
+        pool = make_pool(stub)
+        claude = await pool.complete(LLMRequest.from_agent_config(
+            AgentConfig(model="claude-sonnet-4-20250514"), "Why is login failing?",
+            system="You are a log analyst.",
+        ))
+        gpt = await pool.complete(
+            LLMRequest(model="gpt-4o", messages=[{"role": "user", "content": "Fix?"}])
+        )
+        await pool.close()
+        
+        assert (claude.provider, claude.text, claude.stop_reason) == (
+            "anthropic", "Check the logs.", "end_turn"
+        )
+        assert (claude.input_tokens, claude.output_tokens) == (12, 3)
+        assert (gpt.provider, gpt.text, gpt.output_tokens) == ("openai", "Restart it.", 2)
+        anthropic_call, openai_call = stub.requests
+        assert anthropic_call["headers"]["x-api-key"] == "test-key"
+        assert anthropic_call["body"]["system"] == "You are a log analyst."
+        assert openai_call["headers"]["authorization"] == "Bearer oa-key"
+        
+        stats = pool.stats()
+        assert stats["anthropic"]["requests"] == 1
+        assert stats["anthropic"]["tokens_by_model"] == {
+            "claude-sonnet-4-20250514": {"input": 12, "output": 3}
+        }
+        assert stats["anthropic"]["latency"]["count"] == 1
+    
+    @pytest.mark.parametrize("model", ["claude-haiku", "gpt-4o-mini"])
+    async def test_stream(self, stub: StubProvider, model: str) -> None:
+        """Streams yield text deltas and account tokens and time to first token."""
+        pool = make_pool(stub)
+        request = LLMRequest(model=model, messages=[{"role": "user", "content": "Hi"}])
+        
+        async with pool.stream(request) as stream:
+            deltas = [delta async for delta in stream]
+        await pool.close()
+        
+        assert len(deltas) > 1
+        assert stream.response is not None
+        assert stream.response.text == "".join(deltas)
+        assert stream.response.output_tokens > 0
+        assert stream.response.time_to_first_token_ms is not None
+        provider = pool.provider_for(model)
+        assert provider.stats.output_tokens == stream.response.output_tokens
+        assert provider.stats.in_flight == 0
+    
+    async def test_connections_are_reused_and_capped(self, stub: StubProvider) -> None:
+        """Concurrent calls share pooled keep-alive connections under the cap."""
+        pool = make_pool(stub, max_concurrency=4, max_connections=4)
+        request = LLMRequest(model="claude-slow", messages=[{"role": "user", "content": "x"}])
+        
+        await asyncio.gather(*(pool.complete(request) for _ in range(20)))
+        await asyncio.gather(*(pool.complete(request) for _ in range(20)))
+        await pool.close()
+        
+        assert stub.max_active <= 4
+        assert len(stub.peers) <= 4
+        assert pool.stats()["anthropic"]["requests"] == 40
+    
+    async def test_errors(self, stub: StubProvider) -> None:
+        """HTTP errors surface as LLMProviderError and are counted."""
+        pool = make_pool(stub)
+        request = LLMRequest(model="claude-error", messages=[{"role": "user", "content": "x"}])
+        
+        with pytest.raises(LLMProviderError) as excinfo:
+            await pool.complete(request)
+        assert excinfo.value.status_code == 529
+        assert "Overloaded" in str(excinfo.value)
+        
+        with pytest.raises(LLMProviderError):
+            async with pool.stream(request) as stream:
+                await stream.text()
+        
+        stats = pool.provider_for("claude-error").stats
+        assert (stats.errors, stats.in_flight) == (2, 0)
+        with pytest.raises(LLMProviderError):
+            pool.provider_for("gemini-pro")
+        await pool.close()
+
+
+def test_unknown_provider_kind() -> None:
+    """Providers must name a supported wire format."""
+    with pytest.raises(ValueError):
+        ProviderClient.from_config(LLMProviderConfig(name="google"))
@@ -0,0 +1,84 @@
+"""Unit tests for HACI keyword matching."""
+
+from haci.shared.matching import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Tests for the Aho-Corasick keyword matcher."""
+    
+    def test_finds_all_keywords_in_one_pass(self) -> None:
+        """Overlapping and multi-word keywords are all reported."""
+        matcher = KeywordMatcher({
+            "risk": ["data loss", "production"],
+            "db": ["data", "database"],
+        })
+        
+        hits = matcher.scan("Production DATABASE outage caused data loss")
+        
+        assert hits == {
+            "risk": ["production", "data loss"],
+            "db": ["database", "data"],
+        }
+    
+    def test_respects_word_boundaries(self) -> None:
+        """Keywords embedded in longer words do not match."""
+        matcher = KeywordMatcher({"security": ["auth"], "logs": ["log"]})
+        
+        assert matcher.scan("Update the author catalog") == {}
+        assert matcher.scan("auth failures in the log") == {
+            "security": ["auth"],
+            "logs": ["log"],
+        }
+    
+    def test_accepts_plurals(self) -> None:
+        """Simple plural forms still count as the keyword."""
+        matcher = KeywordMatcher({"logs": ["log", "error"]})
+        
+        assert matcher.find("Logs show errors") == ["log", "error"]
+        assert matcher.find("logstash errorless") == []
+    
+    def test_accepts_inflections(self) -> None:
+        """Plural and verb inflections match; other word continuations do not."""
+        matcher = KeywordMatcher({
+            "code": ["deploy", "debug", "code"],
+            "logs": ["log"],
+            "database": ["query"],
+            "security": ["vulnerability", "secure"],
+            "api": ["rest"],
+        }, nouns=["rest"])
+        
+        for text, keyword in [
+            ("deploys stuck", "deploy"),
+            ("deployed twice", "deploy"),
+            ("redeploying", None),
+            ("debugging session", "debug"),
+            ("logging stopped", "log"),
+            ("REST calls", "rest"),
+            ("secured the bucket", "secure"),
+            # Derived words are different words
+            ("Deployment failed", None),
+            ("logger misconfigured", None),
+            ("resting heart rate", None),
+            ("a rester", None),
+            ("securement of cargo", None),
+            ("debugger attached", None),
+            ("slow queries", "query"),
+            ("two vulnerabilities", "vulnerability"),
+            ("coding error", "code"),
+            ("codec mismatch", None),
+            ("login page", None),
+        ]:
+            assert matcher.find(text) == ([keyword] if keyword else []), text
+    
+    def test_keyword_in_several_tags(self) -> None:
+        """A keyword shared by tags is reported under each of them."""
+        matcher = KeywordMatcher({
+            ("domain", "security"): ["security"],
+            ("risk", "high"): ["security", "critical"],
+        })
+        
+        assert len(matcher) == 2
+        assert matcher.scan("security review") == {
+            ("domain", "security"): ["security"],
+            ("risk", "high"): ["security"],
+        }
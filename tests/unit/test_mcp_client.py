@@ -0,0 +1,148 @@
+"""Unit tests for pooled MCP client sessions, against the in-process stub server."""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("uvicorn")
+
+from haci.config import HACIConfig, MCPServerConfig
+from haci.integrations.mcp import (
+    MCPClientManager,
+    MCPError,
+    MCPServerPool,
+    MCPTimeoutError,
+)
+from haci.integrations.mcp.stub import StubMCPServer
+
+
+@pytest.fixture
+async def stub():
+    server = StubMCPServer()
+    async with server.running() as url:
+        server.url = url
+        yield server
+
+
+def make_pool(stub: StubMCPServer, **overrides) -> MCPServerPool:
+    settings = {"health_check_seconds": 0, **overrides}
+    return MCPServerPool(MCPServerConfig(name="stub", url=stub.url, **settings))
+
+
+class TestMCPServerPool:
+    """Tests for MCPServerPool."""
+    
+    @pytest.mark.asyncio
+    async def test_warm_sessions_are_reused(self, stub: StubMCPServer) -> None:
+        """start() opens every session once; calls do not initialize again."""
+        pool = make_pool(stub, sessions=2)
+        await pool.start()
+        assert pool.sessions == 2
+        
+        for i in range(20):
+            result = await pool.call_tool("echo", {"text": f"hi {i}"})
+            assert (result.text, result.is_error) == (f"hi {i}", False)
+        
+        assert stub.methods["initialize"] == 2
+        assert stub.methods["notifications/initialized"] == 2
+        assert pool.stats.latency.count == 20
+        await pool.close()
+        assert stub.sessions == set()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_multiplexed(self, stub: StubMCPServer) -> None:
+        """Many calls run at once over a few sessions, capped per session."""
+        pool = make_pool(stub, sessions=2, max_in_flight_per_session=8)
+        
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(pool.call_tool("sleep", {"seconds": 0.1}) for _ in range(32))
+        )
+        elapsed = time.perf_counter() - start
+        
+        assert pool.sessions == 2
+        assert stub.max_active == 16
+        assert elapsed < 1.0
+        assert pool.stats.snapshot()["tools"]["sleep"]["count"] == 32
+        await pool.close()
+    
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_on_server(self, stub: StubMCPServer) -> None:
+        """Timed-out calls raise and are reported with notifications/cancelled."""
+        pool = make_pool(stub, timeout_seconds=30)
+        
+        with pytest.raises(MCPTimeoutError):
+            await pool.call_tool("sleep", {"seconds": 1}, timeout=0.1)
+        for _ in range(100):
+            if stub.cancelled:
+                break
+            await asyncio.sleep(0.01)
+        
+        assert len(stub.cancelled) == 1
+        assert (pool.stats.timeouts, pool.stats.errors) == (1, 1)
+        assert (await pool.call_tool("echo", {"text": "ok"})).text == "ok"
+        await pool.close()
+    
+    @pytest.mark.asyncio
+    async def test_expired_sessions_are_replaced(self, stub: StubMCPServer) -> None:
+        """A 404 for the session reopens it; health checks replace idle ones."""
+        pool = make_pool(stub, sessions=2)
+        await pool.start()
+        stub.expire_sessions()
+        
+        assert (await pool.call_tool("echo", {"text": "again"})).text == "again"
+        assert pool.stats.sessions_replaced == 1
+        
+        assert await pool.check_health() == 1
+        assert pool.sessions == 2
+        assert len(stub.sessions) == 2
+        assert await pool.check_health() == 0
+        await pool.close()
+    
+    @pytest.mark.asyncio
+    async def test_event_stream_replies_and_errors(self) -> None:
+        """Streamed replies are parsed; tool and protocol errors differ."""
+        stub = StubMCPServer(event_stream=True)
+        
+        async def fail(arguments: dict) -> str:
+            raise RuntimeError("ticket not found")
+        
+        stub.add_tool("fail", fail)
+        async with stub.running() as url:
+            pool = MCPServerPool(MCPServerConfig(name="stub", url=url, health_check_seconds=0))
+            tools = await pool.list_tools()
+            assert {tool["name"] for tool in tools} == {"echo", "sleep", "fail"}
+            
+            result = await pool.call_tool("fail")
+            assert (result.is_error, result.text) == (True, "ticket not found")
+            with pytest.raises(MCPError) as excinfo:
+                await pool.call_tool("missing")
+            assert excinfo.value.code == -32602
+            await pool.close()
+
+
+class TestMCPClientManager:
+    """Tests for MCPClientManager."""
+    
+    @pytest.mark.asyncio
+    async def test_pools_per_enabled_server(self, stub: StubMCPServer) -> None:
+        """Disabled or URL-less servers get no pool; stats are per server."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        config.integrations.mcp_servers = [
+            MCPServerConfig(name="jira-mcp", url=stub.url, health_check_seconds=0),
+            MCPServerConfig(name="github-mcp", url=stub.url, enabled=False),
+            MCPServerConfig(name="slack-mcp", url=""),
+        ]
+        
+        async with MCPClientManager(config) as mcp:
+            assert list(mcp.pools) == ["jira-mcp"]
+            result = await mcp.call_tool("jira-mcp", "echo", {"text": "PROJ-1"})
+            assert result.server == "jira-mcp"
+            with pytest.raises(MCPError):
+                await mcp.call_tool("github-mcp", "echo")
+            stats = mcp.stats()["jira-mcp"]
+        
+        assert stats["sessions"] == 2
+        assert stats["latency"]["count"] == 1
+        assert stats["tools"]["echo"]["p50_ms"] > 0
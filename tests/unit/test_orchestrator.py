@@ -1,10 +1,21 @@
 """Unit tests for HACI Orchestrator."""
 
+import asyncio
+import json
+
 import pytest
+from pydantic import ValidationError
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from haci.orchestrator import HACIOrchestrator, TaskState
-from haci.config import HACIConfig
+from haci.agents import AgentBackend
+from haci.integrations.api import LLMRequest, LLMResponse
+from haci.orchestrator import (
+    ComplexityCache,
+    HACIOrchestrator,
+    TaskScheduler,
+    TaskState,
+)
+from haci.config import HACIConfig, HedgeConfig, QuorumPolicy
 from haci.types import (
     ComplexityScore,
     ExecutionMode,
@@ -84,6 +95,85 @@ class TestComplexityScoring:
         score = await orchestrator._analyze_complexity(task)
         
         assert score.risk_level in ["high", "critical"]
+    
+    @pytest.mark.asyncio
+    async def test_keywords_match_whole_words(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Keywords inside unrelated words do not add domains."""
+        task = Task(
+            id="test-4",
+            type="support",
+            title="Update author name in the product catalog",
+        )
+        
+        score = await orchestrator._analyze_complexity(task)
+        
+        assert score.domain_count == 1
+        assert "general" in score.reasoning
+    
+    @pytest.mark.asyncio
+    async def test_inflected_keywords_count(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Inflected forms of keywords still add their domains."""
+        task = Task(
+            id="test-5",
+            type="incident",
+            title="Deploys broke logging",
+            description="Slow queries and two vulnerabilities found while debugging",
+        )
+        
+        score = await orchestrator._analyze_complexity(task)
+        
+        # code, logs, database, security and performance
+        assert score.domain_count == 5
+    
+    def test_analyze_many_matches_scalar_path(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Batch scoring returns exactly the per-task scores."""
+        titles = [
+            "Password reset request",
+            "API returning 502 errors with database timeouts",
+            "Production database issue",
+            "Security vulnerability in auth endpoint on kubernetes cluster",
+            "Slow SQL query causing high CPU and memory on server",
+            "Update author name in the product catalog",
+        ]
+        tasks = [
+            Task(
+                id=f"bulk-{i}",
+                type="import",
+                title=title,
+                description="Logs show errors after deploy" if i % 2 else "",
+                priority=["low", "medium", "high", "critical"][i % 4],
+            )
+            for i, title in enumerate(titles * 3)
+        ]
+        
+        assert orchestrator.analyze_many(tasks) == [
+            orchestrator._compute_complexity(task) for task in tasks
+        ]
+        assert orchestrator.analyze_many([]) == []
+    
+    def test_analyze_many_scores_repeated_tickets_once(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Tasks with the same text and priority share one score."""
+        tasks = [
+            Task(id=f"t-{i}", type="import", title="Slow database query", priority=priority)
+            for i, priority in enumerate(["high", "high", "critical"])
+        ]
+        
+        with patch.object(
+            orchestrator, "_compute_complexity", wraps=orchestrator._compute_complexity
+        ) as compute:
+            scores = orchestrator.analyze_many(tasks)
+        
+        assert compute.call_count == 2
+        assert scores[0] is scores[1]
+        assert scores[2].risk_level == "critical"
 
 
 class TestModeSelection:
@@ -204,3 +294,759 @@ class TestHarnessIntegration:
         # Context should exist (or have been cleaned up if completed)
         # This is a simple integration test
         assert orchestrator.harness is not None
+
+
+class TestTaskScheduler:
+    """Tests for the bounded-concurrency priority scheduler."""
+    
+    @pytest.mark.asyncio
+    async def test_dispatches_by_priority_then_fifo(self) -> None:
+        """Higher priorities run first, FIFO within a priority."""
+        order: list[str] = []
+        gate = asyncio.Event()
+        
+        async def runner(task_id: str) -> None:
+            if task_id == "blocker":
+                await gate.wait()
+            else:
+                order.append(task_id)
+        
+        scheduler = TaskScheduler(runner=runner, max_in_flight=1)
+        # Occupy the only slot so everything else queues up
+        scheduler.enqueue("blocker", "low")
+        
+        scheduler.enqueue("low-1", "low")
+        scheduler.enqueue("medium-1", "medium")
+        scheduler.enqueue("critical-1", "critical")
+        scheduler.enqueue("medium-2", "medium")
+        scheduler.enqueue("high-1", "high")
+        scheduler.enqueue("critical-2", "critical")
+        
+        assert scheduler.stats().queue_depth_by_priority == {
+            "low": 1, "medium": 2, "critical": 2, "high": 1,
+        }
+        
+        gate.set()
+        while scheduler.in_flight or scheduler.queue_depth:
+            await asyncio.sleep(0)
+        
+        assert order == [
+            "critical-1", "critical-2", "high-1", "medium-1", "medium-2", "low-1",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_max_in_flight_is_respected(self) -> None:
+        """No more than max_in_flight runners execute concurrently."""
+        running = 0
+        peak = 0
+        
+        async def runner(task_id: str) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+        
+        scheduler = TaskScheduler(runner=runner, max_in_flight=3)
+        for i in range(20):
+            scheduler.enqueue(f"task-{i}", "medium")
+        
+        assert scheduler.in_flight == 3
+        assert scheduler.queue_depth == 17
+        
+        while scheduler.in_flight or scheduler.queue_depth:
+            await asyncio.sleep(0.005)
+        
+        stats = scheduler.stats()
+        assert peak == 3
+        assert stats.dispatched == 20
+        assert stats.max_wait_ms > 0
+        assert stats.avg_wait_ms_by_priority["medium"] > 0
+    
+    def test_enqueue_without_running_loop(self) -> None:
+        """Tasks queued from sync code wait for an event loop."""
+        async def runner(task_id: str) -> None:
+            pass
+        
+        scheduler = TaskScheduler(runner=runner, max_in_flight=2)
+        scheduler.enqueue("task-1", "urgent")
+        
+        assert scheduler.in_flight == 0
+        assert scheduler.stats().queue_depth_by_priority == {"medium": 1}
+    
+    @pytest.mark.asyncio
+    async def test_orchestrator_uses_configured_limit(self) -> None:
+        """The orchestrator honours execution.max_concurrent_tasks."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        config.execution.max_concurrent_tasks = 2
+        orchestrator = HACIOrchestrator(config)
+        
+        tasks = [orchestrator.submit({"title": f"Task {i}"}) for i in range(5)]
+        
+        assert orchestrator.scheduler.in_flight == 2
+        assert orchestrator.scheduler.queue_depth == 3
+        
+        for task in tasks:
+            result = await orchestrator.await_result(task.id, timeout=30)
+            assert result.status == TaskStatus.COMPLETED
+
+
+class TestComplexityCache:
+    """Tests for memoized complexity scoring."""
+    
+    @staticmethod
+    def make_score() -> ComplexityScore:
+        return ComplexityScore(
+            overall_score=4,
+            domain_count=2,
+            estimated_agents_needed=3,
+            risk_level="low",
+            recommended_mode=ExecutionMode.MICRO_SWARM,
+            reasoning="Detected 2 domains (logs, api). Risk: low.",
+        )
+    
+    def test_hits_on_normalized_text(self) -> None:
+        """Case and whitespace differences share an entry; priority does not."""
+        cache = ComplexityCache()
+        score = self.make_score()
+        original = Task(id="a", type="alert", title="Disk  FULL", description="on db-1")
+        refired = Task(id="b", type="alert", title="disk full ", description="on  DB-1")
+        escalated = Task(
+            id="c", type="alert", title="disk full", description="on db-1",
+            priority="high",
+        )
+        cache.put(original, score)
+        
+        assert cache.get(refired) is score
+        assert cache.get(escalated) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+    
+    def test_lru_and_ttl(self) -> None:
+        """Entries expire after the TTL and beyond capacity."""
+        now = [1000.0]
+        cache = ComplexityCache(max_entries=2, ttl_seconds=60, clock=lambda: now[0])
+        tasks = [Task(id=str(i), type="t", title=f"Task {i}") for i in range(3)]
+        for task in tasks:
+            cache.put(task, self.make_score())
+        
+        assert cache.get(tasks[0]) is None
+        assert cache.get(tasks[2]) is not None
+        
+        now[0] += 61
+        assert cache.get(tasks[2]) is None
+        assert len(cache) == 1
+    
+    def test_persists_across_restarts(self, tmp_path) -> None:
+        """Persisted scores are reloaded by a new cache."""
+        path = str(tmp_path / "complexity.db")
+        task = Task(id="a", type="alert", title="CPU high on web-3")
+        ComplexityCache(persist_path=path).put(task, self.make_score())
+        
+        reloaded = ComplexityCache(persist_path=path)
+        
+        assert reloaded.get(task) == self.make_score()
+    
+    @pytest.mark.asyncio
+    async def test_persisted_table_is_bounded(self, tmp_path) -> None:
+        """Writes happen off the event loop and keep only max_entries rows."""
+        path = str(tmp_path / "complexity.db")
+        clock = iter(range(1000, 2000)).__next__
+        cache = ComplexityCache(max_entries=3, persist_path=path, clock=clock)
+        tasks = [Task(id=str(i), type="alert", title=f"CPU high on web-{i}") for i in range(5)]
+        for task in tasks:
+            cache.put(task, self.make_score())
+        
+        await cache.flush()
+        (rows,) = cache._conn.execute("SELECT COUNT(*) FROM complexity_cache").fetchone()
+        cache.close()
+        reloaded = ComplexityCache(max_entries=10, persist_path=path, ttl_seconds=0)
+        
+        assert rows == 3
+        assert reloaded.get(tasks[0]) is None
+        assert reloaded.get(tasks[4]) == self.make_score()
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_reanalysis(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Repeated tasks are scored once."""
+        with patch.object(
+            orchestrator,
+            "_analyze_complexity",
+            wraps=orchestrator._analyze_complexity,
+        ) as analyze:
+            for _ in range(3):
+                task = orchestrator.submit({
+                    "title": "Monitor: API latency above SLO",
+                    "description": "p99 latency > 2s on checkout endpoint",
+                })
+                await orchestrator.await_result(task.id, timeout=30)
+        
+        assert analyze.call_count == 1
+        assert orchestrator.complexity_cache.hits == 2
+
+
+class TestBulkSubmission:
+    """Tests for submit_many."""
+    
+    @pytest.mark.asyncio
+    async def test_submit_many_creates_and_runs_tasks(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """All tasks are created with defaults and complete."""
+        tasks = orchestrator.submit_many(
+            [{"title": f"Imported ticket {i}"} for i in range(10)]
+            + [{"title": "Outage", "priority": "critical", "metadata": {"source": "pd"}}]
+        )
+        
+        assert len(tasks) == 11
+        assert len({t.id for t in tasks}) == 11
+        assert tasks[0].type == "general" and tasks[0].priority == "medium"
+        assert tasks[-1].metadata == {"source": "pd"}
+        
+        for task in tasks:
+            result = await orchestrator.await_result(task.id, timeout=30)
+            assert result.status == TaskStatus.COMPLETED
+    
+    def test_submit_many_orders_by_priority(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Bulk-queued tasks obey priority order."""
+        tasks = orchestrator.submit_many([
+            {"title": "Low", "priority": "low"},
+            {"title": "Critical", "priority": "critical"},
+            {"title": "Medium"},
+        ])
+        
+        stats = orchestrator.scheduler.stats()
+        assert stats.queue_depth == 3
+        assert orchestrator.scheduler._queue[0][-1] == tasks[1].id
+    
+    def test_submit_many_rejects_whole_batch(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """One invalid entry means nothing is queued."""
+        with pytest.raises(ValidationError):
+            orchestrator.submit_many([
+                {"title": "Fine"},
+                {"title": "Broken", "metadata": "not-a-dict"},
+            ])
+        
+        assert orchestrator.scheduler.queue_depth == 0
+        assert orchestrator._tasks == {}
+        assert orchestrator.submit_many([]) == []
+
+
+class TestResultStreaming:
+    """Tests for as_completed and stream_results."""
+    
+    @pytest.mark.asyncio
+    async def test_as_completed_yields_in_completion_order(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Finished tasks come first, then the rest as they finish."""
+        done = orchestrator.submit({"title": "Already done"})
+        await orchestrator.await_result(done.id, timeout=30)
+        slow = orchestrator.submit({"title": "Slow", "metadata": {"mode": "full_swarm"}})
+        fast = orchestrator.submit({"title": "Fast", "metadata": {"mode": "single_agent"}})
+        
+        order = [
+            result.task_id
+            async for result in orchestrator.as_completed(
+                [slow.id, fast.id, done.id, fast.id], timeout=30
+            )
+        ]
+        
+        assert order == [done.id, fast.id, slow.id]
+        assert orchestrator._completions.subscriber_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_as_completed_errors(self, orchestrator: HACIOrchestrator) -> None:
+        """Unknown IDs and timeouts are reported."""
+        with pytest.raises(KeyError):
+            async for _ in orchestrator.as_completed(["missing"]):
+                pass
+        
+        slow = orchestrator.submit({"title": "Slow", "metadata": {"mode": "full_swarm"}})
+        with pytest.raises(TimeoutError):
+            async for _ in orchestrator.as_completed([slow.id], timeout=0.05):
+                pass
+    
+    @pytest.mark.asyncio
+    async def test_stream_results_filters(self, orchestrator: HACIOrchestrator) -> None:
+        """Streams see later completions that pass the filter."""
+        received = []
+        
+        async def consume() -> None:
+            async for result in orchestrator.stream_results(
+                lambda r: r.mode == ExecutionMode.SINGLE_AGENT
+            ):
+                received.append(result.task_id)
+                if len(received) == 2:
+                    break
+        
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        tasks = orchestrator.submit_many([
+            {"title": "A", "metadata": {"mode": "single_agent"}},
+            {"title": "B", "metadata": {"mode": "micro_swarm"}},
+            {"title": "C", "metadata": {"mode": "single_agent"}},
+        ])
+        await asyncio.wait_for(consumer, timeout=30)
+        
+        assert sorted(received) == sorted([tasks[0].id, tasks[2].id])
+        assert orchestrator._completions.subscriber_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_close_releases_blocked_consumers(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Consumers waiting on results are released when the orchestrator closes."""
+        async def consume() -> list[str]:
+            return [result.task_id async for result in orchestrator.stream_results()]
+        
+        async def wait_all(task_ids: list[str]) -> list[TaskStatus]:
+            return [r.status async for r in orchestrator.as_completed(task_ids)]
+        
+        stream = asyncio.create_task(consume())
+        slow = orchestrator.submit({"title": "Slow", "metadata": {"mode": "full_swarm"}})
+        waiter = asyncio.create_task(wait_all([slow.id]))
+        await asyncio.sleep(0)
+        await orchestrator.close()
+        
+        # The cancelled task's failed result is the last thing delivered
+        assert await asyncio.wait_for(stream, timeout=5) == [slow.id]
+        assert await asyncio.wait_for(waiter, timeout=5) == [TaskStatus.FAILED]
+        with pytest.raises(RuntimeError):
+            await orchestrator.await_result(orchestrator.submit({"title": "Late"}).id)
+
+
+class TestStatusEvents:
+    """Tests for status-transition subscriptions."""
+    
+    @pytest.mark.asyncio
+    async def test_task_transitions_are_published(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """A subscriber sees every transition of a task in order."""
+        with orchestrator.subscribe_status() as events:
+            task = orchestrator.submit({"title": "Fix the login API"})
+            await orchestrator.await_result(task.id, timeout=30)
+            
+            seen = []
+            while (event := events.get_nowait()) is not None:
+                seen.append(event)
+        
+        assert [e.status for e in seen] == [
+            TaskStatus.PENDING,
+            TaskStatus.ANALYZING,
+            TaskStatus.EXECUTING,
+            TaskStatus.COMPLETED,
+        ]
+        assert [e.previous_status for e in seen[1:]] == [e.status for e in seen[:-1]]
+        assert seen[-1].agents
+        assert seen[-1].mode != ExecutionMode.AUTO
+        assert orchestrator.status_events.subscriber_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_filtered_subscription(self, orchestrator: HACIOrchestrator) -> None:
+        """Filters on status and mode narrow the events received."""
+        events = orchestrator.subscribe_status(
+            statuses=[TaskStatus.COMPLETED], modes=[ExecutionMode.SINGLE_AGENT]
+        )
+        tasks = orchestrator.submit_many([
+            {"title": "A", "metadata": {"mode": "single_agent"}},
+            {"title": "B", "metadata": {"mode": "micro_swarm"}},
+        ])
+        async for _ in orchestrator.as_completed([t.id for t in tasks], timeout=30):
+            pass
+        
+        event = await events.get()
+        assert event.task_id == tasks[0].id
+        assert events.get_nowait() is None
+        events.close()
+
+
+class TestClose:
+    """Tests for orchestrator shutdown."""
+    
+    @pytest.mark.asyncio
+    async def test_close_cancels_running_tasks(self) -> None:
+        """Closing stops pipelines before the stores they write to are closed."""
+        orchestrator = HACIOrchestrator(HACIConfig(anthropic_api_key="test-key"))
+        orchestrator.scheduler.max_in_flight = 1
+        running = orchestrator.submit({"title": "Slow", "metadata": {"mode": "full_swarm"}})
+        queued = orchestrator.submit({"title": "Queued"})
+        waiter = asyncio.create_task(orchestrator.await_result(running.id))
+        await asyncio.sleep(0.01)
+        
+        await orchestrator.close()
+        
+        assert orchestrator.scheduler.in_flight == 0
+        # Waiters of a cancelled task get a failed result instead of hanging
+        result = await asyncio.wait_for(waiter, timeout=1)
+        assert result.status == TaskStatus.FAILED
+        assert orchestrator.get_status(running.id) == TaskStatus.FAILED
+        assert orchestrator.get_status(queued.id) == TaskStatus.PENDING
+        assert orchestrator.scheduler.dispatch() == 0
+
+
+class DelayedBackend(AgentBackend):
+    """Answers each agent type after its own delay; can fail one agent."""
+    
+    def __init__(self, delays: dict[AgentType, float], failing: AgentType | None = None) -> None:
+        self.delays = delays
+        self.failing = failing
+        self.cancelled: list[AgentType] = []
+    
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        try:
+            await asyncio.sleep(self.delays.get(agent_type, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(agent_type)
+            raise
+        if agent_type == self.failing:
+            raise RuntimeError(f"{agent_type.value} crashed")
+        return LLMResponse(provider="test", model=request.model, text=agent_type.value)
+
+
+class TestSwarmExecution:
+    """Swarm agents run concurrently."""
+    
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded_by_slowest_agent(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Findings arrive fastest first; wall time is the slowest agent's."""
+        delays = {
+            AgentType.LOG_ANALYST: 0.3,
+            AgentType.API_SPECIALIST: 0.1,
+            AgentType.INFRASTRUCTURE_OPS: 0.2,
+            AgentType.SWARM_COORDINATOR: 0.05,
+        }
+        orchestrator.agent_backend = DelayedBackend(delays)
+        state = TaskState(task=Task(id="t-1", type="general", title="Outage"))
+        
+        start = asyncio.get_running_loop().time()
+        timings = (await orchestrator._run_agents(state, list(delays))).timings_ms
+        elapsed = asyncio.get_running_loop().time() - start
+        
+        assert elapsed < 0.45  # sequential would take 0.65 s
+        assert [f["agent"] for f in state.findings] == [
+            "swarm_coordinator", "api_specialist", "infrastructure_ops", "log_analyst",
+        ]
+        assert set(timings) == {agent.value for agent in delays}
+        assert timings["log_analyst"] >= 290
+    
+    @pytest.mark.asyncio
+    async def test_failing_agent_cancels_the_rest(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """One agent's error cancels its siblings and is raised as-is."""
+        backend = DelayedBackend(
+            {AgentType.LOG_ANALYST: 0.01, AgentType.API_SPECIALIST: 5.0},
+            failing=AgentType.LOG_ANALYST,
+        )
+        orchestrator.agent_backend = backend
+        state = TaskState(task=Task(id="t-2", type="general", title="Outage"))
+        
+        with pytest.raises(RuntimeError, match="log_analyst crashed"):
+            await orchestrator._run_agents(
+                state, [AgentType.LOG_ANALYST, AgentType.API_SPECIALIST]
+            )
+        assert backend.cancelled == [AgentType.API_SPECIALIST]
+    
+    @pytest.mark.asyncio
+    async def test_swarm_result_records_agent_timings(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Per-agent timings are reported in the result metadata."""
+        task = orchestrator.submit({
+            "title": "Production API errors after deploy",
+            "description": "Database query latency on the Kubernetes cluster",
+            "metadata": {"mode": "full_swarm"},
+        })
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        answered = set(result.metadata["agent_timings_ms"])
+        cancelled = set(result.metadata.get("cancelled_agents", []))
+        assert answered and answered | cancelled == {a.value for a in result.agents_used}
+        assert len(result.agents_used) > 1
+    
+    def test_agent_selection_is_deterministic(self, orchestrator: HACIOrchestrator) -> None:
+        """Agents are picked in a stable order, not set iteration order."""
+        score = ComplexityScore(
+            overall_score=5,
+            domain_count=2,
+            estimated_agents_needed=3,
+            risk_level="medium",
+            recommended_mode=ExecutionMode.MICRO_SWARM,
+            reasoning="",
+        )
+        
+        assert orchestrator._select_agents(score) == [
+            AgentType.LOG_ANALYST, AgentType.API_SPECIALIST, AgentType.SWARM_COORDINATOR,
+        ]
+
+
+class VotingBackend(AgentBackend):
+    """Each agent answers (root cause, confidence) after its own delay."""
+    
+    def __init__(self, answers: dict[AgentType, tuple[str, float, float]]) -> None:
+        self.answers = answers
+        self.cancelled: list[AgentType] = []
+    
+    async def complete(self, agent_type: AgentType, request: LLMRequest) -> LLMResponse:
+        root_cause, confidence, delay = self.answers[agent_type]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(agent_type)
+            raise
+        text = json.dumps({"root_cause": root_cause, "confidence": confidence})
+        return LLMResponse(provider="test", model=request.model, text=text)
+
+
+class TestSwarmQuorum:
+    """Swarms stop early once a quorum of agents agrees."""
+    
+    ANSWERS = {
+        AgentType.LOG_ANALYST: ("Connection pool exhausted", 92.0, 0.02),
+        AgentType.API_SPECIALIST: ("Upstream timeout", 95.0, 0.03),
+        AgentType.INFRASTRUCTURE_OPS: ("connection pool exhausted.", 88.0, 0.04),
+        AgentType.CODE_SPECIALIST: ("Connection pool exhausted", 70.0, 0.05),
+        AgentType.DATABASE_EXPERT: ("Connection pool exhausted", 90.0, 0.06),
+        AgentType.SWARM_COORDINATOR: ("Connection pool exhausted", 99.0, 5.0),
+    }
+    
+    @pytest.mark.asyncio
+    async def test_quorum_cancels_remaining_agents(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """The k-th confident agreeing agent stops the rest."""
+        backend = VotingBackend(self.ANSWERS)
+        orchestrator.agent_backend = backend
+        state = TaskState(task=Task(id="q-1", type="general", title="Checkout errors"))
+        policy = QuorumPolicy(agents=3, min_confidence=85)
+        
+        fan_out = await orchestrator._run_agents(state, list(self.ANSWERS), policy)
+        
+        assert fan_out.quorum is not None
+        assert fan_out.quorum.agents == ("log_analyst", "infrastructure_ops", "database_expert")
+        assert fan_out.quorum.confidence == 90.0
+        assert fan_out.cancelled == ["swarm_coordinator"]
+        assert backend.cancelled == [AgentType.SWARM_COORDINATOR]
+        assert "swarm_coordinator" not in fan_out.timings_ms
+    
+    @pytest.mark.asyncio
+    async def test_result_records_quorum_and_skips_cancelled_cost(self) -> None:
+        """The result names its quorum; cancelled agents add no cost."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        config.execution.quorum["full_swarm"] = QuorumPolicy(agents=2, min_confidence=85)
+        orchestrator = HACIOrchestrator(config)
+        orchestrator.agent_backend = VotingBackend(self.ANSWERS)
+        orchestrator._select_agents = lambda complexity: [
+            AgentType.LOG_ANALYST,
+            AgentType.INFRASTRUCTURE_OPS,
+            AgentType.API_SPECIALIST,
+            AgentType.SWARM_COORDINATOR,
+        ]
+        task = orchestrator.submit({"title": "Checkout errors", "metadata": {"mode": "full_swarm"}})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        assert result.metadata["quorum"]["agents"] == ["log_analyst", "infrastructure_ops"]
+        assert result.metadata["quorum"]["size"] == 2
+        assert result.metadata["cancelled_agents"] == ["swarm_coordinator"]
+        assert AgentType.SWARM_COORDINATOR not in result.agents_used
+        assert set(result.metadata["agent_timings_ms"]) == {
+            "log_analyst", "infrastructure_ops", "api_specialist",
+        }
+        assert result.confidence == 90.0
+        assert result.cost_usd == pytest.approx(0.15 * 3 / 4)
+        assert result.execution_time_ms < 2000
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_no_quorum_waits_for_every_agent(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Modes without a policy, or without agreement, run to completion."""
+        answers = {agent: ("Unclear", 50.0, 0.01) for agent in self.ANSWERS}
+        orchestrator.agent_backend = VotingBackend(answers)
+        state = TaskState(task=Task(id="q-2", type="general", title="Checkout errors"))
+        
+        fan_out = await orchestrator._run_agents(
+            state, list(answers), QuorumPolicy(agents=2, min_confidence=85)
+        )
+        
+        assert fan_out.quorum is None
+        assert len(fan_out.timings_ms) == len(answers)
+        assert fan_out.metadata() == {"agent_timings_ms": fan_out.timings_ms}
+    
+    @pytest.mark.asyncio
+    async def test_default_config_runs_every_agent(self) -> None:
+        """Quorum is off by default; a full swarm reports its agents' mean confidence."""
+        orchestrator = HACIOrchestrator(HACIConfig(anthropic_api_key="test-key"))
+        agents = [
+            AgentType.LOG_ANALYST,
+            AgentType.INFRASTRUCTURE_OPS,
+            AgentType.API_SPECIALIST,
+            AgentType.SWARM_COORDINATOR,
+        ]
+        orchestrator.agent_backend = VotingBackend({
+            agent: ("Connection pool exhausted", 90.0 + i, 0.01)
+            for i, agent in enumerate(agents)
+        })
+        orchestrator._select_agents = lambda complexity: list(agents)
+        task = orchestrator.submit({"title": "Checkout errors", "metadata": {"mode": "full_swarm"}})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        assert "quorum" not in result.metadata
+        assert result.agents_used == agents
+        assert result.confidence == 91.5
+        assert result.cost_usd == pytest.approx(0.15)
+        await orchestrator.close()
+
+
+class TestHedgedExecution:
+    """Borderline tickets race a single agent against a micro-swarm."""
+    
+    @staticmethod
+    def make_orchestrator(
+        answers: dict[AgentType, tuple[str, float, float]],
+        delay_seconds: float,
+    ) -> tuple[HACIOrchestrator, VotingBackend]:
+        """The first agent in ``answers`` is the single agent; the rest swarm."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        config.execution.hedge = HedgeConfig(
+            enabled=True, min_score=1, max_score=10, delay_seconds=delay_seconds
+        )
+        config.execution.quorum["micro_swarm"] = QuorumPolicy(agents=1, min_confidence=90)
+        orchestrator = HACIOrchestrator(config)
+        backend = VotingBackend(answers)
+        orchestrator.agent_backend = backend
+        orchestrator._select_agents = lambda complexity: list(answers)
+        return orchestrator, backend
+    
+    @pytest.mark.asyncio
+    async def test_confident_single_agent_skips_the_swarm(self) -> None:
+        """A confident answer within the delay never launches the swarm."""
+        orchestrator, backend = self.make_orchestrator({
+            AgentType.LOG_ANALYST: ("Disk full", 95.0, 0.01),
+            AgentType.API_SPECIALIST: ("Disk full", 95.0, 0.01),
+        }, delay_seconds=1.0)
+        task = orchestrator.submit({"title": "Login page slow"})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        assert result.mode == ExecutionMode.SINGLE_AGENT
+        assert result.agents_used == [AgentType.LOG_ANALYST]
+        assert result.confidence == 95.0
+        assert result.metadata["hedge"]["winner"] == "single_agent"
+        assert result.metadata["hedge"]["swarm_launched_ms"] is None
+        assert result.metadata["hedge"]["cancelled"] == []
+        assert [f["agent"] for f in orchestrator._tasks[task.id].findings] == ["log_analyst"]
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_slow_single_agent_is_hedged_and_cancelled(self) -> None:
+        """After the delay the swarm launches, wins and cancels the single agent."""
+        orchestrator, backend = self.make_orchestrator({
+            AgentType.LOG_ANALYST: ("Disk full", 95.0, 5.0),
+            AgentType.API_SPECIALIST: ("Rate limited", 92.0, 0.02),
+        }, delay_seconds=0.05)
+        task = orchestrator.submit({"title": "Login page slow"})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        assert result.mode == ExecutionMode.MICRO_SWARM
+        assert result.agents_used == [AgentType.API_SPECIALIST]
+        assert result.confidence == 92.0
+        assert result.metadata["hedge"]["winner"] == "micro_swarm"
+        assert result.metadata["hedge"]["swarm_launched_ms"] >= 50
+        assert result.metadata["hedge"]["cancelled"] == ["single_agent"]
+        # The swarm does not ask the single agent a second time
+        assert backend.cancelled == [AgentType.LOG_ANALYST]
+        assert [f["agent"] for f in orchestrator._tasks[task.id].findings] == [
+            "api_specialist"
+        ]
+        assert result.execution_time_ms < 2000
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_unconfident_single_agent_launches_swarm_early(self) -> None:
+        """A low-confidence answer launches the swarm without waiting out the delay."""
+        orchestrator, backend = self.make_orchestrator({
+            AgentType.LOG_ANALYST: ("Unclear", 60.0, 0.01),
+            AgentType.API_SPECIALIST: ("Rate limited", 93.0, 0.02),
+        }, delay_seconds=10.0)
+        task = orchestrator.submit({"title": "Login page slow"})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        assert result.mode == ExecutionMode.MICRO_SWARM
+        assert result.confidence == 93.0
+        assert result.metadata["hedge"]["swarm_launched_ms"] < 1000
+        assert result.metadata["hedge"]["cancelled"] == []
+        # Both paths finished, so both are charged
+        assert result.cost_usd == pytest.approx(0.008 + 0.025)
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_unconfident_paths_keep_their_confidence(self) -> None:
+        """Without a quorum the swarm reports its agents' mean confidence."""
+        orchestrator, backend = self.make_orchestrator({
+            AgentType.LOG_ANALYST: ("Unclear", 60.0, 0.01),
+            AgentType.API_SPECIALIST: ("Rate limited", 70.0, 0.01),
+            AgentType.DATABASE_EXPERT: ("Lock contention", 80.0, 0.02),
+        }, delay_seconds=10.0)
+        task = orchestrator.submit({"title": "Login page slow"})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        # Neither path is acceptable, so the more confident one is used
+        assert result.mode == ExecutionMode.MICRO_SWARM
+        assert result.confidence == 75.0
+        assert result.confidence < orchestrator.config.execution.hedge.min_confidence
+        assert "quorum" not in result.metadata
+        assert len(orchestrator._tasks[task.id].findings) == 3
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_swarm_pays_for_answered_agents(self) -> None:
+        """Swarm agents that answered before the swarm lost are charged."""
+        orchestrator, backend = self.make_orchestrator({
+            AgentType.LOG_ANALYST: ("Disk full", 95.0, 0.3),
+            AgentType.API_SPECIALIST: ("Unclear", 60.0, 0.01),
+            AgentType.DATABASE_EXPERT: ("Lock contention", 80.0, 5.0),
+        }, delay_seconds=0.05)
+        task = orchestrator.submit({"title": "Login page slow"})
+        
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        assert result.mode == ExecutionMode.SINGLE_AGENT
+        assert result.metadata["hedge"]["cancelled"] == ["micro_swarm"]
+        assert backend.cancelled == [AgentType.DATABASE_EXPERT]
+        # The single agent, plus one of the swarm's two agents
+        assert result.cost_usd == pytest.approx(0.008 + 0.025 / 2)
+        await orchestrator.close()
+    
+    def test_hedge_applies_only_to_configured_scores(
+        self, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Hedging is off by default and limited to its score band."""
+        score = ComplexityScore(
+            overall_score=4,
+            domain_count=1,
+            estimated_agents_needed=2,
+            risk_level="medium",
+            recommended_mode=ExecutionMode.MICRO_SWARM,
+            reasoning="Borderline task",
+        )
+        assert not orchestrator._should_hedge(score)
+        orchestrator.config.execution.hedge.enabled = True
+        assert orchestrator._should_hedge(score)
+        assert not orchestrator._should_hedge(score.model_copy(update={"overall_score": 5}))
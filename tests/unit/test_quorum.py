@@ -0,0 +1,48 @@
+"""Unit tests for swarm quorum detection and agent finding parsing."""
+
+import pytest
+
+from haci.agents import parse_finding
+from haci.quorum import QuorumTally, normalize_root_cause
+
+
+class TestQuorumTally:
+    """Tests for QuorumTally."""
+    
+    def test_quorum_needs_k_confident_agreeing_agents(self) -> None:
+        """Low-confidence and dissenting findings do not count."""
+        tally = QuorumTally(size=2, min_confidence=85)
+        
+        assert tally.add("log_analyst", "Connection pool exhausted.", 95) is None
+        assert tally.add("api_specialist", "connection pool exhausted", 60) is None
+        assert tally.add("code_specialist", "Bad deploy", 99) is None
+        assert tally.add("infrastructure_ops", "No finding", None) is None
+        quorum = tally.add("database_expert", "  Connection  pool exhausted ", 85)
+        
+        assert quorum is not None
+        assert quorum.agents == ("log_analyst", "database_expert")
+        assert quorum.root_cause == "Connection pool exhausted."
+        assert quorum.confidence == 90
+        assert tally.add("swarm_coordinator", "connection pool exhausted", 99) is None
+        assert tally.quorum is quorum
+    
+    def test_normalization_and_validation(self) -> None:
+        assert normalize_root_cause(" Disk  FULL!\n") == "disk full"
+        with pytest.raises(ValueError):
+            QuorumTally(size=0, min_confidence=50)
+
+
+class TestParseFinding:
+    """Tests for parse_finding."""
+    
+    def test_json_answers(self) -> None:
+        """The JSON object may be wrapped in prose or code fences."""
+        text = 'Here:\n```json\n{"root_cause": "Disk full", "confidence": 120}\n```'
+        
+        assert parse_finding(text) == ("Disk full", 100.0)
+        assert parse_finding('{"root_cause": "x", "confidence": "high"}') == ("x", None)
+    
+    def test_unparseable_answers(self) -> None:
+        assert parse_finding("The disk is full.") == (None, None)
+        assert parse_finding("{not json}") == (None, None)
+        assert parse_finding('{"root_cause": "", "confidence": true}') == (None, None)
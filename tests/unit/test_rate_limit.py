@@ -0,0 +1,62 @@
+"""Unit tests for HACI token-bucket rate limiting."""
+
+import pytest
+
+from haci.shared.rate_limit import RateLimitStats, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self) -> None:
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+    
+    def test_bursts_to_capacity_then_refills(self) -> None:
+        """A full bucket allows a burst, then refills at the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=3.0, clock=clock)
+        
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert bucket.wait_time() == pytest.approx(0.5)
+        
+        clock.now += 0.5
+        assert bucket.try_acquire()
+        
+        clock.now += 100
+        assert bucket.tokens == 3.0
+    
+    def test_per_minute(self) -> None:
+        """per_minute spreads the limit over sixty seconds."""
+        clock = FakeClock()
+        bucket = TokenBucket.per_minute(60, clock=clock)
+        for _ in range(60):
+            assert bucket.try_acquire()
+        
+        assert not bucket.try_acquire()
+        assert bucket.wait_time() == pytest.approx(1.0)
+    
+    def test_rejects_invalid_rate(self) -> None:
+        """Rate and capacity must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestRateLimitStats:
+    """Tests for rate limit counters."""
+    
+    def test_record_wait(self) -> None:
+        """Waits accumulate total and maximum."""
+        stats = RateLimitStats()
+        stats.record_wait(0.5)
+        stats.record_wait(1.5)
+        
+        assert stats.waits == 2
+        assert stats.total_wait_seconds == 2.0
+        assert stats.max_wait_seconds == 1.5
@@ -0,0 +1,189 @@
+"""Unit tests for the LLM response cache."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from haci.config import AgentConfig, HACIConfig
+from haci.integrations.api.cache import ResponseCache
+from haci.integrations.api.llm import LLMRequest, LLMResponse
+from haci.orchestrator import HACIOrchestrator
+from haci.types import AgentType
+
+
+def make_request(prompt: str = "Database timeouts", **kwargs: object) -> LLMRequest:
+    return LLMRequest(
+        model="claude-sonnet-4-20250514",
+        messages=[{"role": "user", "content": prompt}],
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class Provider:
+    """Counts calls and answers with a fixed-size response."""
+    
+    def __init__(self, text_size: int = 10, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.text_size = text_size
+        self.delay = delay
+    
+    async def __call__(self) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return LLMResponse(provider="stub", model="m", text="x" * self.text_size)
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+    
+    def test_key_canonicalizes_prompt_but_not_settings(self) -> None:
+        """Whitespace differences share a key; model settings do not."""
+        key = ResponseCache.make_key(make_request("Database  timeouts\n"))
+        
+        assert key == ResponseCache.make_key(make_request(" Database timeouts"))
+        assert key != ResponseCache.make_key(make_request("database timeouts"))
+        assert key != ResponseCache.make_key(make_request(max_tokens=2048))
+        assert key != ResponseCache.make_key(make_request(temperature=0.5))
+        assert key != ResponseCache.make_key(make_request(system="You are terse."))
+    
+    @pytest.mark.asyncio
+    async def test_hits_and_temperature_bypass(self) -> None:
+        """Repeats are served from cache; sampled requests always call."""
+        cache = ResponseCache()
+        provider = Provider()
+        
+        first, outcome = await cache.get_or_call(make_request(), provider, label="log_analyst")
+        assert (outcome, first.cached) == ("miss", False)
+        second, outcome = await cache.get_or_call(make_request(), provider, label="log_analyst")
+        assert (outcome, second.cached, second.text) == ("hit", True, first.text)
+        
+        for _ in range(2):
+            _, outcome = await cache.get_or_call(
+                make_request(temperature=0.7), provider, label="api_specialist"
+            )
+            assert outcome == "bypass"
+        
+        assert provider.calls == 3
+        assert cache.stats() == {
+            "api_specialist": {"hits": 0, "misses": 0, "bypassed": 2, "hit_rate": 0.0},
+            "log_analyst": {"hits": 1, "misses": 1, "bypassed": 0, "hit_rate": 0.5},
+        }
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self) -> None:
+        """Identical requests in flight together make a single provider call."""
+        cache = ResponseCache()
+        provider = Provider(delay=0.05)
+        
+        results = await asyncio.gather(
+            *(cache.get_or_call(make_request(), provider) for _ in range(5))
+        )
+        
+        assert provider.calls == 1
+        assert sorted(outcome for _, outcome in results) == ["hit"] * 4 + ["miss"]
+    
+    @pytest.mark.asyncio
+    async def test_memory_evicts_least_recently_used_by_size(self) -> None:
+        """The memory tier stays within its byte budget."""
+        provider = Provider(text_size=1000)
+        cache = ResponseCache(memory_max_bytes=2500)
+        for prompt in ["a", "b", "c"]:
+            await cache.get_or_call(make_request(prompt), provider)
+        
+        assert len(cache) == 2
+        assert cache.memory_bytes <= 2500
+        assert await cache.get(make_request("a")) is None
+        assert await cache.get(make_request("c")) is not None
+    
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart_and_is_bounded(self, tmp_path: Path) -> None:
+        """Entries are reloaded from SQLite, which evicts to its budget."""
+        path = str(tmp_path / "responses.db")
+        provider = Provider(text_size=1000)
+        cache = ResponseCache(memory_max_bytes=0, disk_path=path, disk_max_bytes=2500)
+        for prompt in ["a", "b", "c"]:
+            await cache.get_or_call(make_request(prompt), provider)
+        assert cache.disk_bytes <= 2500
+        cache.close()
+        
+        reopened = ResponseCache(disk_path=path, disk_max_bytes=2500)
+        response, outcome = await reopened.get_or_call(make_request("c"), provider)
+        assert (outcome, response.text) == ("hit", "x" * 1000)
+        assert await reopened.get(make_request("a")) is None
+        assert provider.calls == 3
+        reopened.close()
+    
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self) -> None:
+        """Expired entries are treated as misses."""
+        now = [1000.0]
+        cache = ResponseCache(ttl_seconds=60, clock=lambda: now[0])
+        await cache.put(make_request(), LLMResponse(provider="stub", model="m", text="ok"))
+        now[0] += 61
+        
+        assert await cache.get(make_request()) is None
+        assert cache.memory_bytes == 0
+
+
+class TestOrchestratorResponseCache:
+    """Agent calls made by the orchestrator go through the cache."""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_task_hits_per_agent_type(self) -> None:
+        """Deterministic agents are served from cache on a repeated ticket."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        for agent in AgentType:
+            config.agents[agent.value] = AgentConfig(temperature=0.0)
+        config.execution.quorum = {}  # every agent answers
+        orchestrator = HACIOrchestrator(config)
+        ticket = {
+            "title": "API 502 errors",
+            "description": "Gateway returns 502 on the orders endpoint",
+            "metadata": {"mode": "micro_swarm"},
+        }
+        
+        first = orchestrator.submit(ticket)
+        first_result = await orchestrator.await_result(first.id, timeout=30)
+        second = orchestrator.submit(ticket)
+        second_result = await orchestrator.await_result(second.id, timeout=30)
+        
+        agents = {agent.value for agent in second_result.agents_used}
+        assert set(first_result.metadata["response_cache"]) == agents
+        for stats in first_result.metadata["response_cache"].values():
+            assert (stats["hits"], stats["misses"]) == (0, 1)
+        for stats in second_result.metadata["response_cache"].values():
+            assert (stats["hits"], stats["hit_rate"]) == (1, 1.0)
+        assert orchestrator.agent_backend.calls == len(agents)
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_default_config_hits_on_repeat(self) -> None:
+        """The shipped defaults cache agent calls made at the default temperature."""
+        orchestrator = HACIOrchestrator(HACIConfig(anthropic_api_key="test-key"))
+        ticket = {"title": "Slow page", "metadata": {"mode": "single_agent"}}
+        
+        first = orchestrator.submit(ticket)
+        await orchestrator.await_result(first.id, timeout=30)
+        second = orchestrator.submit(ticket)
+        result = await orchestrator.await_result(second.id, timeout=30)
+        
+        (stats,) = result.metadata["response_cache"].values()
+        assert (stats["bypassed"], stats["hits"], stats["misses"]) == (0, 1, 0)
+        assert len(orchestrator.response_cache) == 1
+        await orchestrator.close()
+    
+    @pytest.mark.asyncio
+    async def test_hot_agents_bypass(self) -> None:
+        """Agents sampled hotter than max_temperature are never cached."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        for agent in AgentType:
+            config.agents[agent.value] = AgentConfig(temperature=0.3)
+        orchestrator = HACIOrchestrator(config)
+        task = orchestrator.submit({"title": "Slow page", "metadata": {"mode": "single_agent"}})
+        result = await orchestrator.await_result(task.id, timeout=30)
+        
+        (stats,) = result.metadata["response_cache"].values()
+        assert (stats["bypassed"], stats["hits"], stats["misses"]) == (1, 0, 0)
+        assert len(orchestrator.response_cache) == 0
+        await orchestrator.close()
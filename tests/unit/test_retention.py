@@ -0,0 +1,190 @@
+"""Unit tests for HACI task retention."""
+
+from pathlib import Path
+
+import pytest
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+from haci.retention import ResultSpillStore, TaskRetention
+from haci.types import ExecutionMode, TaskResult, TaskStatus
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self) -> None:
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_result(task_id: str) -> TaskResult:
+    return TaskResult(
+        task_id=task_id,
+        status=TaskStatus.COMPLETED,
+        mode=ExecutionMode.SINGLE_AGENT,
+        summary=f"Resolved {task_id}",
+        confidence=92.0,
+        execution_time_ms=100,
+    )
+
+
+class TestTaskRetention:
+    """Tests for LRU/TTL bookkeeping."""
+    
+    def test_evicts_least_recently_used_over_capacity(self) -> None:
+        """Capacity overflow evicts the least recently used task."""
+        retention = TaskRetention(ttl_seconds=0, max_tasks=2)
+        retention.retain("a")
+        retention.retain("b")
+        retention.touch("a")
+        retention.retain("c")
+        
+        assert retention.collect_evictions() == ["b"]
+        assert "a" in retention and "c" in retention
+    
+    def test_evicts_expired_tasks(self) -> None:
+        """Tasks unused for longer than the TTL are evicted."""
+        clock = FakeClock()
+        retention = TaskRetention(ttl_seconds=60, max_tasks=100, clock=clock)
+        retention.retain("old")
+        clock.now += 30
+        retention.retain("new")
+        clock.now += 31
+        
+        assert retention.collect_evictions() == ["old"]
+        assert len(retention) == 1
+    
+    def test_touch_refreshes_ttl(self) -> None:
+        """Looking a task up keeps it alive."""
+        clock = FakeClock()
+        retention = TaskRetention(ttl_seconds=60, max_tasks=100, clock=clock)
+        retention.retain("a")
+        clock.now += 50
+        retention.touch("a")
+        clock.now += 50
+        
+        assert retention.collect_evictions() == []
+
+
+class TestResultSpillStore:
+    """Tests for the SQLite spill store."""
+    
+    def test_round_trip(self) -> None:
+        """Spilled results load back unchanged."""
+        store = ResultSpillStore()
+        result = make_result("task-1")
+        
+        assert store.put_many([result]) == 1
+        assert store.get("task-1") == result
+        assert store.get("missing") is None
+    
+    def test_survives_reopen(self, tmp_path: Path) -> None:
+        """File-backed stores persist across connections."""
+        path = tmp_path / "results.db"
+        results = [make_result("task-1"), make_result("task-2")]
+        store = ResultSpillStore(path)
+        store.put_many(results)
+        store.close()
+        
+        reopened = ResultSpillStore(path)
+        assert len(reopened) == 2
+        assert reopened.get("task-2") == results[1]
+    
+    @pytest.mark.asyncio
+    async def test_spill_writes_off_the_event_loop(self, tmp_path: Path) -> None:
+        """Spilled results are readable at once and written in the background."""
+        store = ResultSpillStore(tmp_path / "results.db")
+        results = [make_result(f"task-{i}") for i in range(3)]
+        
+        assert store.spill(results) == 3
+        assert store.get("task-1") == results[1]
+        assert len(store) == 0  # not written yet
+        
+        await store.flush()
+        assert len(store) == 3
+        assert store.get("task-2") == results[2]
+        store.close()
+    
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_results_buffered(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Results stay readable after a failed write and are retried."""
+        store = ResultSpillStore()
+        monkeypatch.setattr(ResultSpillStore, "RETRY_DELAY_SECONDS", 0.001)
+        put_many = store.put_many
+        attempts = []
+        
+        def flaky_put_many(results):
+            attempts.append(len(results))
+            if len(attempts) < 3 or len(attempts) > 3:
+                raise OSError("disk full")
+            return put_many(results)
+        
+        store.put_many = flaky_put_many
+        result = make_result("task-1")
+        store.spill([result])
+        await store.flush()
+        
+        assert attempts == [1, 1, 1]
+        assert len(store) == 1
+        assert store.get("task-1") == result
+        
+        # A write that keeps failing gives up but does not lose the result
+        store.spill([make_result("task-2")])
+        await store._writer
+        assert len(attempts) == 3 + ResultSpillStore.MAX_WRITE_ATTEMPTS
+        assert store.get("task-2") is not None
+        store.close()
+    
+    def test_spill_without_event_loop_writes_immediately(self) -> None:
+        """Outside an event loop there is no writer task to hand off to."""
+        store = ResultSpillStore()
+        store.spill([make_result("task-1")])
+        
+        assert len(store) == 1
+
+
+class TestOrchestratorRetention:
+    """Tests for eviction from the orchestrator."""
+    
+    @pytest.mark.asyncio
+    async def test_evicted_tasks_still_answer(self, tmp_path: Path) -> None:
+        """Status and results of evicted tasks come from the spill store."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        config.retention.max_completed_tasks = 1
+        config.retention.spill_path = str(tmp_path / "results.db")
+        orchestrator = HACIOrchestrator(config)
+        
+        first = orchestrator.submit({"title": "First task"})
+        first_result = await orchestrator.await_result(first.id, timeout=30)
+        second = orchestrator.submit({"title": "Second task"})
+        await orchestrator.await_result(second.id, timeout=30)
+        
+        assert first.id not in orchestrator._tasks
+        assert first.id not in orchestrator._completions._waiters
+        assert orchestrator.get_status(first.id) == TaskStatus.COMPLETED
+        assert await orchestrator.await_result(first.id) == first_result
+        
+        with pytest.raises(KeyError):
+            orchestrator.get_status("unknown-task")
+    
+    @pytest.mark.asyncio
+    async def test_spilling_is_opt_in(self) -> None:
+        """Without a spill path, evicted results leave the process."""
+        config = HACIConfig(anthropic_api_key="test-key")
+        config.retention.max_completed_tasks = 1
+        orchestrator = HACIOrchestrator(config)
+        
+        first = orchestrator.submit({"title": "First task"})
+        await orchestrator.await_result(first.id, timeout=30)
+        second = orchestrator.submit({"title": "Second task"})
+        await orchestrator.await_result(second.id, timeout=30)
+        
+        assert orchestrator._spill_store is None
+        with pytest.raises(KeyError):
+            orchestrator.get_status(first.id)
+        await orchestrator.close()
@@ -0,0 +1,137 @@
+"""Unit tests for the HACI HTTP API."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+from haci.config import HACIConfig
+from haci.harness import HarnessAction
+from haci.orchestrator import HACIOrchestrator
+from haci.server import create_app, event_loop_setting
+from haci.types import AgentType, ExecutionMode
+
+
+@pytest.fixture
+def orchestrator() -> HACIOrchestrator:
+    return HACIOrchestrator(HACIConfig(anthropic_api_key="test-key"))
+
+
+@pytest.fixture
+async def client(orchestrator: HACIOrchestrator):
+    app = create_app(orchestrator=orchestrator)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://haci") as client:
+        yield client
+
+
+class TestTaskEndpoints:
+    """Tests for task submission and lookup."""
+    
+    async def test_submit_and_fetch_result(self, client) -> None:
+        """A submitted task can be looked up and awaited by later requests."""
+        response = await client.post(
+            "/tasks", json={"title": "Fix login API", "metadata": {"mode": "single_agent"}}
+        )
+        assert response.status_code == 202
+        task_id = response.json()["id"]
+        
+        status = await client.get(f"/tasks/{task_id}/status")
+        assert status.json()["status"] in {"pending", "analyzing", "executing"}
+        
+        pending = await client.get(f"/tasks/{task_id}/result")
+        assert pending.status_code == 202
+        
+        result = await client.get(f"/tasks/{task_id}/result", params={"wait": 30})
+        assert result.status_code == 200
+        assert result.json()["status"] == "completed"
+        assert result.json()["task_id"] == task_id
+        
+        status = await client.get(f"/tasks/{task_id}/status")
+        assert status.json() == {"task_id": task_id, "status": "completed"}
+    
+    async def test_bulk_submit(self, client, orchestrator: HACIOrchestrator) -> None:
+        """Bulk submission queues every task and rejects invalid batches whole."""
+        response = await client.post("/tasks/batch", json=[{"title": "A"}, {"title": "B"}])
+        assert response.status_code == 202
+        task_ids = response.json()["task_ids"]
+        assert len(task_ids) == 2
+        async for _ in orchestrator.as_completed(task_ids, timeout=30):
+            pass
+        
+        invalid = await client.post("/tasks/batch", json=[{"title": "A"}, {"title": 5}])
+        assert invalid.status_code == 422
+        assert (await client.post("/tasks/batch", json={"title": "A"})).status_code == 422
+        assert (await client.post("/tasks/batch", content=b"{")).status_code == 400
+    
+    async def test_unknown_task(self, client) -> None:
+        """Unknown task IDs are 404s."""
+        assert (await client.get("/tasks/missing/status")).status_code == 404
+        assert (await client.get("/tasks/missing/result")).status_code == 404
+    
+    async def test_health(self, client) -> None:
+        """The health endpoint reports scheduler load."""
+        response = await client.get("/health")
+        assert response.json()["status"] == "ok"
+
+
+class TestApprovalEndpoints:
+    """Tests for approval listing and decisions."""
+    
+    async def test_list_approve_and_reject(
+        self, client, orchestrator: HACIOrchestrator
+    ) -> None:
+        """Pending approvals can be listed and decided over HTTP."""
+        harness = orchestrator.harness
+        contexts = [
+            harness.create_context(f"t{i}", ExecutionMode.HUMAN_LED) for i in range(3)
+        ]
+        action = HarnessAction(
+            agent_type=AgentType.LOG_ANALYST,
+            action_type="restart",
+            description="Restart the service",
+            confidence=97.0,
+        )
+        gates = [
+            asyncio.create_task(harness.gate_action(context, action))
+            for context in contexts
+        ]
+        for _ in range(200):
+            if len(harness.list_approvals().items) == 3:
+                break
+            await asyncio.sleep(0.005)
+        
+        page = (await client.get("/approvals", params={"limit": 2})).json()
+        assert page["total"] == 3
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] is not None
+        first, second = (item["id"] for item in page["items"])
+        
+        assert (await client.post(f"/approvals/{first}/approve")).status_code == 200
+        rejected = await client.post(
+            f"/approvals/{second}/reject", json={"reason": "too risky"}
+        )
+        assert rejected.json() == {"rejected": [second]}
+        for decision in ("approve", "reject"):
+            empty = await client.post(f"/approvals/{decision}", json={"filter": ""})
+            assert empty.status_code == 422
+        assert harness.list_approvals().total == 1
+        bulk = await client.post("/approvals/approve", json={"filter": "task=t2"})
+        assert len(bulk.json()["approved"]) == 1
+        
+        assert [await gate for gate in gates] == [
+            (True, "Human approved"),
+            (False, "Human rejected: too risky"),
+            (True, "Human approved"),
+        ]
+        assert (await client.post(f"/approvals/{first}/approve")).status_code == 404
+        bad = await client.get("/approvals", params={"filter": "colour=red"})
+        assert bad.status_code == 400
+
+
+def test_event_loop_setting() -> None:
+    """uvloop is used only when requested or available."""
+    assert event_loop_setting("asyncio") == "asyncio"
+    assert event_loop_setting("auto") in {"asyncio", "uvloop"}
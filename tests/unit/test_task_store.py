@@ -0,0 +1,124 @@
+"""Unit tests for persistent task stores."""
+
+from pathlib import Path
+
+import pytest
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+from haci.task_store import InMemoryTaskStore, TaskRecord
+from haci.types import ExecutionMode, Task, TaskResult, TaskStatus
+
+
+def make_task(task_id: str = "t1") -> Task:
+    return Task(id=task_id, type="incident", title="Slow API", description="p99 up")
+
+
+def make_result(task_id: str = "t1") -> TaskResult:
+    return TaskResult(
+        task_id=task_id,
+        status=TaskStatus.COMPLETED,
+        mode=ExecutionMode.SINGLE_AGENT,
+        summary="Restarted cache",
+        confidence=92.0,
+        agents_used=[],
+        resolution_steps=[],
+        execution_time_ms=12,
+    )
+
+
+class TestInMemoryTaskStore:
+    """Tests for the in-memory backend."""
+    
+    async def test_keeps_latest_record(self) -> None:
+        """Later records for a task replace earlier ones."""
+        store = InMemoryTaskStore()
+        store.record(TaskRecord(task=make_task()))
+        store.record(TaskRecord(
+            task=make_task(), status=TaskStatus.COMPLETED, result=make_result()
+        ))
+        
+        assert await store.get_status("t1") == TaskStatus.COMPLETED
+        assert (await store.get_result("t1")).summary == "Restarted cache"
+        assert await store.get("missing") is None
+    
+    async def test_follows_task_retention(self, tmp_path: Path) -> None:
+        """Records leave the store when their tasks are evicted from memory."""
+        config = HACIConfig()
+        config.retention.ttl_seconds = 0
+        config.retention.max_completed_tasks = 2
+        config.retention.spill_path = str(tmp_path / "results.db")
+        orchestrator = HACIOrchestrator(config)
+        
+        tasks = orchestrator.submit_many(
+            {"title": f"Check logs {i}", "description": "error rate up"} for i in range(5)
+        )
+        for task in tasks:
+            await orchestrator.await_result(task.id, timeout=30)
+        
+        assert len(orchestrator.task_store) == 2
+        assert await orchestrator.fetch_status(tasks[0].id) == TaskStatus.COMPLETED
+        assert (await orchestrator.await_result(tasks[0].id)).task_id == tasks[0].id
+        await orchestrator.close()
+
+
+class TestSQLAlchemyTaskStore:
+    """Tests for the SQLAlchemy backend against SQLite."""
+    
+    @pytest.fixture(autouse=True)
+    def _requires_driver(self) -> None:
+        pytest.importorskip("sqlalchemy")
+        pytest.importorskip("aiosqlite")
+    
+    async def test_batches_and_coalesces_writes(self, tmp_path: Path) -> None:
+        """Transitions between flushes collapse to one row per task."""
+        from haci.task_store import SQLAlchemyTaskStore
+        
+        store = SQLAlchemyTaskStore(f"sqlite:///{tmp_path / 'tasks.db'}", flush_interval_seconds=60)
+        for i in range(50):
+            store.record(TaskRecord(task=make_task(f"t{i}")))
+            store.record(TaskRecord(task=make_task(f"t{i}"), status=TaskStatus.EXECUTING))
+        
+        # Buffered states are visible before they are written
+        assert await store.get_status("t3") == TaskStatus.EXECUTING
+        await store.flush()
+        
+        assert store.rows_written == 50
+        assert store.batches_written == 1
+        assert await store.get_status("t3") == TaskStatus.EXECUTING
+        await store.close()
+    
+    async def test_survives_reopen(self, tmp_path: Path) -> None:
+        """Records written before close are read back by a new store."""
+        from haci.task_store import SQLAlchemyTaskStore
+        
+        url = f"sqlite:///{tmp_path / 'tasks.db'}"
+        result = make_result()
+        first = SQLAlchemyTaskStore(url)
+        first.record(TaskRecord(task=make_task(), status=TaskStatus.COMPLETED, result=result))
+        await first.close()
+        
+        second = SQLAlchemyTaskStore(url)
+        record = await second.get("t1")
+        assert record.status == TaskStatus.COMPLETED
+        assert record.result == result
+        assert record.task.title == "Slow API"
+        await second.close()
+    
+    async def test_orchestrator_status_survives_restart(self, tmp_path: Path) -> None:
+        """A new orchestrator on the same database serves earlier results."""
+        config = HACIConfig()
+        config.task_store.backend = "sqlalchemy"
+        config.task_store.url = f"sqlite:///{tmp_path / 'tasks.db'}"
+        
+        first = HACIOrchestrator(config)
+        task = first.submit({"title": "Check logs", "description": "error rate up"})
+        result = await first.await_result(task.id, timeout=5)
+        await first.close()
+        
+        second = HACIOrchestrator(config)
+        assert await second.fetch_status(task.id) == TaskStatus.COMPLETED
+        assert (await second.await_result(task.id)).summary == result.summary
+        with pytest.raises(KeyError):
+            await second.fetch_status("missing")
+        await second.close()
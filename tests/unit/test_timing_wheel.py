@@ -0,0 +1,100 @@
+"""Unit tests for the hierarchical timing wheel."""
+
+import random
+
+import pytest
+
+from haci.shared.timing_wheel import TimingWheel
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimingWheel:
+    """Tests for TimingWheel."""
+    
+    def test_fires_at_deadline_not_before(self) -> None:
+        """Timers expire once their (tick-rounded) deadline is reached."""
+        wheel = TimingWheel(tick_seconds=1.0, clock=FakeClock())
+        wheel.schedule("a", 5.0)
+        wheel.schedule("b", 2.5)
+        
+        assert wheel.advance(2.0) == []
+        assert wheel.advance(3.0) == ["b"]
+        assert wheel.advance(4.9) == []
+        assert wheel.advance(5.0) == ["a"]
+        assert len(wheel) == 0
+    
+    def test_cancel_and_reschedule(self) -> None:
+        """Cancelled timers never fire; rescheduling replaces the deadline."""
+        wheel = TimingWheel(clock=FakeClock())
+        wheel.schedule("a", 3.0)
+        wheel.schedule("b", 3.0)
+        assert wheel.cancel("a")
+        assert not wheel.cancel("a")
+        wheel.schedule("b", 10.0)
+        
+        assert wheel.advance(5.0) == []
+        assert "b" in wheel
+        assert wheel.advance(10.0) == ["b"]
+    
+    def test_past_deadline_fires_on_next_advance(self) -> None:
+        """A deadline already in the past expires immediately."""
+        clock = FakeClock()
+        clock.now = 100.0
+        wheel = TimingWheel(clock=clock)
+        wheel.schedule("late", 50.0)
+        
+        assert wheel.advance(100.0) == ["late"]
+    
+    def test_matches_reference_across_levels(self) -> None:
+        """Small wheels cascade and park out-of-range timers correctly."""
+        rng = random.Random(7)
+        wheel = TimingWheel(tick_seconds=1.0, wheel_sizes=(4, 4, 4), clock=FakeClock())
+        deadlines = {i: rng.uniform(0, 300) for i in range(500)}
+        for key, deadline in deadlines.items():
+            wheel.schedule(key, deadline)
+        for key in rng.sample(sorted(deadlines), 100):
+            wheel.cancel(key)
+            del deadlines[key]
+        
+        now = 0.0
+        while deadlines:
+            now += rng.choice([1.0, 2.0, 5.0, 17.0])
+            expired = wheel.advance(now)
+            for key in expired:
+                assert deadlines.pop(key) <= now
+            assert all(deadline > now - 1 for deadline in deadlines.values())
+        assert len(wheel) == 0
+    
+    def test_schedule_after_idle_skips_missed_ticks(self) -> None:
+        """A wheel left empty for a long time does not replay the idle ticks."""
+        clock = FakeClock()
+        wheel = TimingWheel(tick_seconds=1.0, clock=clock)
+        clock.now = 7 * 86_400.0
+        wheel.schedule("a", clock.now + 5)
+        visited = 0
+        cascade = wheel._cascade
+        
+        def counting_cascade() -> None:
+            nonlocal visited
+            visited += 1
+            cascade()
+        
+        wheel._cascade = counting_cascade
+        clock.now += 5
+        
+        assert wheel.advance() == ["a"]
+        assert visited == 5
+    
+    def test_rejects_bad_configuration(self) -> None:
+        """Tick length and wheel sizes are validated."""
+        with pytest.raises(ValueError):
+            TimingWheel(tick_seconds=0)
+        with pytest.raises(ValueError):
+            TimingWheel(wheel_sizes=(1,))
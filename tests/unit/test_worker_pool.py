@@ -0,0 +1,99 @@
+"""Unit tests for worker-pool execution."""
+
+import asyncio
+import os
+import signal
+import threading
+
+import pytest
+
+from haci.config import HACIConfig
+from haci.orchestrator import HACIOrchestrator
+from haci.types import Task, TaskStatus
+from haci.worker_pool import WorkerPool, WorkerPoolError
+
+
+class TestWorkerPool:
+    """Tests for running tasks in worker processes."""
+    
+    async def test_results_route_back_to_await_result(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Tasks run in workers and their results reach await_result."""
+        # Spawned workers must not pick up the top-level types.py copy when
+        # the suite runs from the repository root
+        monkeypatch.setenv("PYTHONSAFEPATH", "1")
+        config = HACIConfig()
+        config.execution.worker_processes = 2
+        orchestrator = HACIOrchestrator(config)
+        
+        tasks = orchestrator.submit_many(
+            {"title": f"Check logs {i}", "description": "error rate up"} for i in range(8)
+        )
+        results = [await orchestrator.await_result(t.id, timeout=60) for t in tasks]
+        
+        assert [r.task_id for r in results] == [t.id for t in tasks]
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+        assert orchestrator.get_status(tasks[0].id) == TaskStatus.COMPLETED
+        assert orchestrator.worker_pool.results_received == 8
+        await orchestrator.close()
+    
+    async def test_dead_worker_fails_its_tasks_and_is_replaced(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A worker's exit fails only its tasks; the next task respawns it."""
+        monkeypatch.setenv("PYTHONSAFEPATH", "1")
+        config = HACIConfig()
+        config.execution.worker_processes = 2
+        orchestrator = HACIOrchestrator(config)
+        pool = orchestrator.worker_pool
+        spawn_threads = []
+        spawn = pool._spawn
+        
+        def recording_spawn(index):
+            spawn_threads.append(threading.get_ident())
+            return spawn(index)
+        
+        pool._spawn = recording_spawn
+        
+        tasks = orchestrator.submit_many(
+            {"title": f"Check logs {i}", "description": "error rate up"} for i in range(4)
+        )
+        while pool.tasks_sent < 4:
+            await asyncio.sleep(0.01)
+        # One dispatch wave is spread across both workers
+        assert pool._load == [2, 2]
+        owned = {task_id for task_id, index in pool._owner.items() if index == 0}
+        os.kill(pool._workers[0].pid, signal.SIGKILL)
+        
+        results = [await orchestrator.await_result(t.id, timeout=60) for t in tasks]
+        failed = {r.task_id for r in results if r.status == TaskStatus.FAILED}
+        assert failed == owned
+        assert all("exited" in r.summary for r in results if r.task_id in failed)
+        
+        retry = orchestrator.submit_many(
+            {"title": f"Check logs again {i}", "description": "error rate up"}
+            for i in range(2)
+        )
+        results = [await orchestrator.await_result(t.id, timeout=60) for t in retry]
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+        assert pool.worker_restarts == 1
+        # Start-up and the respawn ran off the event loop
+        assert len(spawn_threads) == 3
+        assert threading.get_ident() not in spawn_threads
+        await orchestrator.close()
+    
+    async def test_closed_pool_rejects_work(self) -> None:
+        """A pool cannot be restarted after close."""
+        pool = WorkerPool(HACIConfig(), processes=1)
+        pool.close()
+        
+        with pytest.raises(WorkerPoolError):
+            await pool.run(Task(id="t1", type="incident", title="Slow API"))
+    
+    def test_requires_a_process(self) -> None:
+        """At least one worker process is needed."""
+        with pytest.raises(ValueError):
+            WorkerPool(HACIConfig(), processes=0)